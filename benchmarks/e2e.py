@@ -0,0 +1,197 @@
+"""
+End-to-End-Durchsatz der Hauptpfade gegen den ReplayDriver – ohne Browser und ohne Login.
+
+Gemessen werden ``scan_watch_history`` (Reader "dom" und "data"), ``run_cleanup_pipeline``,
+``check_history_once`` und ``block_channel``. Alle Datenbanken und Caches liegen für die
+Dauer des Laufs in einem temporären Verzeichnis; Thumbnails werden nicht heruntergeladen
+und die Wartepause zwischen zwei Watch-Loop-Durchläufen entfällt.
+
+Die Seitenskripte laufen dabei nicht als JavaScript, sondern als Python-Nachbildung im
+ReplayDriver (siehe ``benchmarks.replay_driver``): gemessen wird der Python-Anteil samt
+WebDriver-Kommandos, nicht die Korrektheit oder Laufzeit des JavaScripts im Browser.
+
+    python -m benchmarks.e2e --videos 1000 --json e2e.json
+"""
+import argparse
+import json
+import tempfile
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from unittest.mock import patch
+
+import watchangel.globals as app_globals
+from benchmarks.replay_driver import (
+    REPLAY_LIMITATION, HistoryEntry, ReplayConfig, ReplayDriver, load_history_snapshot, synthetic_history,
+)
+from watchangel.analysis.scanner import scan_watch_history
+from watchangel.blocker.actions import block_channel
+from watchangel.rules.engine_instance import log_rules
+from watchangel.rules.language import language_detector
+from watchangel.run.main_clean_run import run_cleanup_pipeline
+from watchangel.storage import channel_store, db, job_queue, seen_videos
+from watchangel.watcher import video_handler, watch_loop
+
+
+@dataclass
+class BenchResult:
+    """Ergebnis eines Szenarios; ``items`` sind Videos bzw. Kanäle (``unit``)."""
+    name: str
+    items: int
+    seconds: float
+    commands: int
+    unit: str = "videos"
+    extra: dict = field(default_factory=dict)
+
+    @property
+    def per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {"name": self.name, "items": self.items, "unit": self.unit, "seconds": round(self.seconds, 4),
+                "per_second": round(self.per_second, 2), "commands": self.commands, **self.extra}
+
+    def row(self) -> str:
+        extra = ", ".join(f"{key}={value}" for key, value in self.extra.items())
+        return (f"{self.name:<34} {self.items:>7} {self.unit:<8} {self.seconds:>8.2f}s "
+                f"{self.per_second:>10.1f}/s {self.commands:>8} cmds  {extra}")
+
+
+@contextmanager
+def isolated_state(workdir: Path) -> Iterator[None]:
+    """
+    Ersetzt die prozessweiten Speicher durch frische Instanzen unter ``workdir`` und schaltet
+    Netzwerkzugriffe (Thumbnails) sowie die Pause zwischen Watch-Loop-Durchläufen ab.
+    """
+    with ExitStack() as stack:
+        stack.enter_context(db.use_database(workdir / "watchangel.db"))
+        stack.enter_context(patch.object(language_detector, "snapshot_path", workdir / "language_cache.json"))
+        stack.enter_context(patch.object(video_handler, "save_thumbnail", lambda video_id, path: None))
+        stack.enter_context(patch.object(watch_loop, "countdown", lambda seconds, label="": None))
+        log_rules.invalidate()
+        try:
+            yield
+        finally:
+            log_rules.invalidate()
+
+
+def _measure(name: str, driver: ReplayDriver, run: Callable[[], int], unit: str = "videos",
+             **extra) -> BenchResult:
+    commands = driver.commands
+    started = time.perf_counter()
+    items = run()
+    return BenchResult(name, items, time.perf_counter() - started, driver.commands - commands, unit, extra)
+
+
+def bench_scan(history: list[HistoryEntry], config: ReplayConfig, reader: str) -> BenchResult:
+    driver = ReplayDriver(history, config)
+    with patch.object(app_globals, "READER_MODE", reader):
+        return _measure(f"scan_watch_history[{reader}]", driver, lambda: len(scan_watch_history(driver)))
+
+
+def bench_cleanup(history: list[HistoryEntry], config: ReplayConfig, blocked: list[HistoryEntry]) -> BenchResult:
+    store = channel_store.get_channel_store()
+    store.add_many({"channel_name": entry.channel_name, "channel_url": entry.channel_url} for entry in blocked)
+    log_rules.invalidate()
+    driver = ReplayDriver(history, config)
+    removed: list[int] = []
+
+    def run() -> int:
+        removed.append(run_cleanup_pipeline(driver))
+        return len(history)
+
+    result = _measure("run_cleanup_pipeline", driver, run)
+    result.extra["removed"] = removed[0]
+    return result
+
+
+def bench_watch_cycle(history: list[HistoryEntry], config: ReplayConfig, job_budget: float) -> list[BenchResult]:
+    driver = ReplayDriver(history, config)
+    results = []
+    with patch.object(watch_loop, "JOB_TIME_BUDGET", job_budget):
+        for name in ("check_history_once[erster Lauf]", "check_history_once[nichts Neues]"):
+            before = len(seen_videos.get_seen_videos())
+            result = _measure(name, driver, lambda: check_and_count(driver, before))
+            results.append(result)
+    results[0].extra["jobs"] = job_queue.get_job_queue().counts()
+    results[0].extra["history_left"] = len(driver.history)
+    return results
+
+
+def check_and_count(driver: ReplayDriver, seen_before: int) -> int:
+    watch_loop.check_history_once(driver)
+    return len(seen_videos.get_seen_videos()) - seen_before
+
+
+def bench_block(channels: list[HistoryEntry], config: ReplayConfig) -> list[BenchResult]:
+    driver = ReplayDriver([], config)
+    urls = list(dict.fromkeys(entry.channel_url for entry in channels))
+    return [
+        _measure(f"block_channel[{label}]", driver, lambda: sum(block_channel(driver, url) for url in urls), "channels")
+        for label in ("Browser", "gespeichert")
+    ]
+
+
+def run_all(
+        videos: int = 1000,
+        config: Optional[ReplayConfig] = None,
+        block_channels: int = 3,
+        job_budget: float = 0.0,
+        removal_delay: float = 0.1,
+) -> list[BenchResult]:
+    """
+    Führt alle Szenarien mit einem synthetischen Verlauf aus dem Mitschnitt aus.
+
+    :param videos: Größe des Verlaufs
+    :param block_channels: Anzahl Kanäle für ``block_channel`` (je Kanal einige Sekunden, da
+        der Blockierablauf feste Pausen enthält)
+    :param job_budget: Zeitbudget für Aufträge in ``check_history_once`` (0 = nur Purge)
+    :param removal_delay: Pause zwischen Entfern-Batches (im Replay gibt es keine Drosselung)
+    """
+    config = config or ReplayConfig()
+    templates = load_history_snapshot()
+    history = synthetic_history(videos, templates)
+    # Alle Varianten zweier Vorlagen-Kanäle ("Slime TV", "Color Fun") gelten als blockiert
+    blocked = [entry for i, entry in enumerate(history) if i % len(templates) in (0, 3)]
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp, patch.object(app_globals, "REMOVAL_BATCH_DELAY", removal_delay):
+        with isolated_state(Path(tmp)):
+            results.append(bench_scan(history, config, "dom"))
+            results.append(bench_scan(history, config, "data"))
+            results.append(bench_cleanup(history, config, blocked))
+            results.extend(bench_watch_cycle(history, config, job_budget))
+            if block_channels:
+                results.extend(bench_block(history[:block_channels], config))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-End-Benchmark gegen den ReplayDriver")
+    parser.add_argument("--videos", type=int, default=1000, help="Größe des synthetischen Verlaufs")
+    parser.add_argument("--page-size", type=int, default=100, help="Einträge je Nachladerunde")
+    parser.add_argument("--latency", type=float, default=0.002, help="Round Trip je WebDriver-Kommando (s)")
+    parser.add_argument("--scroll-load", type=float, default=0.02, help="Nachladezeit je Scroll-Runde (s)")
+    parser.add_argument("--removal-delay", type=float, default=0.1, help="Pause zwischen Entfern-Batches (s)")
+    parser.add_argument("--block-channels", type=int, default=3, help="Kanäle für block_channel (0 = aus)")
+    parser.add_argument("--job-budget", type=float, default=0.0, help="Auftragsbudget je Watch-Durchlauf (s)")
+    parser.add_argument("--json", type=Path, help="Ergebnisse zusätzlich als JSON schreiben")
+    args = parser.parse_args()
+
+    config = ReplayConfig(command_latency=args.latency, scroll_load=args.scroll_load, page_size=args.page_size)
+    results = run_all(args.videos, config, args.block_channels, args.job_budget, args.removal_delay)
+
+    print()
+    for result in results:
+        print(result.row())
+    print(f"[ℹ️] {REPLAY_LIMITATION}")
+    if args.json:
+        args.json.write_text(json.dumps([result.as_dict() for result in results], indent=2, ensure_ascii=False),
+                             encoding="utf-8")
+        print(f"[💾] Ergebnisse gespeichert: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
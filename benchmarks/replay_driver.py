@@ -0,0 +1,527 @@
+"""
+Offline-Ersatz für den Chrome-WebDriver: spielt gespeicherte Seiten (Verlauf, About-Dialog)
+mit einstellbaren Latenzen ab, damit Scannen, Bereinigen und Blockieren ohne YouTube-Login
+gemessen werden können.
+
+Nachgebildet wird genau die WebDriver-Oberfläche, die WatchAngel benutzt: ``get``,
+``find_element(s)`` mit einfachen CSS-Selektoren, Klicks und Wartebedingungen sowie die
+Seitenskripte des Projekts (``EXTRACT_HISTORY_JS``, ``SCROLL_AND_WAIT_JS``, ``REMOVE_BATCH_JS``,
+``FETCH_CONTINUATION_JS``). Die Skripte werden an ihrer Identität erkannt und in Python
+ausgeführt – ein unbekanntes Skript führt zu einer WebDriverException.
+
+Einschränkung: Das JavaScript selbst läuft hier nie. Die Python-Nachbildungen folgen dem
+dokumentierten Verhalten der Skripte, Messwerte und Tests auf Basis des ReplayDrivers sagen
+daher nichts über die Korrektheit des Seitenskripts aus. Das echte JS prüfen die Node-Tests
+in ``tests/test_scrolling.py``, ``tests/test_removal_engine.py`` und ``tests/test_watermark.py``
+(``FETCH_CONTINUATION_JS`` ist dort nicht abgedeckt).
+"""
+import itertools
+import json
+import random
+import re
+import time
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Optional, Sequence
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from watchangel.analysis.extractor import EXTRACT_HISTORY_JS
+from watchangel.analysis.history_data import (
+    FETCH_CONTINUATION_JS, HISTORY_URL, YOUTUBE_ORIGIN, extract_initial_data, parse_history_payload,
+)
+from watchangel.cleaner.removal_engine import REMOVE_BATCH_JS
+from watchangel.utils.scrolling import SCROLL_AND_WAIT_JS
+
+SNAPSHOT_DIR = Path(__file__).parent / "snapshots"
+HISTORY_SNAPSHOT = SNAPSHOT_DIR / "history.html"
+ABOUT_SNAPSHOT = SNAPSHOT_DIR / "channel_about.html"
+
+# Hinweis für Benchmark-Ausgaben (siehe Modulbeschreibung)
+REPLAY_LIMITATION = ("Seitenskripte (Extraktion, Scrollen, Entfernen, Fortsetzungen) laufen im Replay als "
+                     "Python-Nachbildung – die Zahlen sagen nichts über die Korrektheit des JavaScripts aus.")
+
+_VOID_TAGS = {"br", "hr", "img", "input", "link", "meta", "source", "wbr"}
+
+
+@dataclass
+class ReplayConfig:
+    """
+    Latenzen und Verhalten der abgespielten Seiten (Sekunden).
+
+    :param command_latency: Round Trip je WebDriver-Kommando
+    :param page_load: Zusätzlich je ``get()``
+    :param scroll_load: Nachladezeit je Scroll-Runde
+    :param click_latency: Reaktionszeit je Klick
+    :param page_size: Einträge je Verlaufsseite (erste Seite und je Nachladerunde)
+    :param removal_failure_rate: Anteil der Entfernungen, die nicht bestätigt werden
+    :param seed: Startwert für den Zufall (Fehlschläge)
+    """
+    command_latency: float = 0.002
+    page_load: float = 0.05
+    scroll_load: float = 0.02
+    click_latency: float = 0.005
+    page_size: int = 100
+    removal_failure_rate: float = 0.0
+    seed: int = 1
+
+
+@dataclass
+class HistoryEntry:
+    video_id: str
+    title: str
+    channel_name: str
+    channel_url: str
+
+
+def load_history_snapshot(path: Path = HISTORY_SNAPSHOT) -> list[HistoryEntry]:
+    """Liest die Videos aus dem ``ytInitialData`` eines gespeicherten Verlaufs."""
+    page = parse_history_payload(extract_initial_data(path.read_text(encoding="utf-8")))
+    return [HistoryEntry(v.video_id, v.title, v.channel_name, v.channel_url) for v in page.videos]
+
+
+def synthetic_history(size: int, templates: Sequence[HistoryEntry],
+                      channels_per_template: int = 20) -> list[HistoryEntry]:
+    """
+    Vervielfältigt die Einträge eines Mitschnitts auf ``size`` Videos mit eindeutigen IDs.
+    Kanäle werden in Varianten (``"Name 3"``) aufgefächert, damit Kanal-Caches realistisch wirken.
+    """
+    entries = []
+    for i in range(size):
+        template = templates[i % len(templates)]
+        variant = i // len(templates) % channels_per_template
+        suffix = f" {variant}" if variant else ""
+        entries.append(HistoryEntry(
+            video_id=f"{template.video_id[:4]}{i:07d}",
+            title=template.title,
+            channel_name=template.channel_name + suffix,
+            channel_url=template.channel_url + (f"{variant}" if variant else ""),
+        ))
+    return entries
+
+
+# ------------------- Elemente -------------------
+
+class ReplayElement(WebElement):
+    """DOM-Knoten einer abgespielten Seite (Tag, Attribute, Kinder, Text)."""
+
+    def __init__(self, driver: "ReplayDriver", tag: str, attrs: Optional[dict[str, str]] = None,
+                 parent_node: Optional["ReplayElement"] = None) -> None:
+        super().__init__(driver, f"replay-{next(driver.ids)}")
+        self.tag = tag
+        self.attrs: dict[str, str] = dict(attrs or {})
+        self.children: list[ReplayElement] = []
+        self.parent_node = parent_node
+        self.own_text = ""
+        self.video: Optional[HistoryEntry] = None
+        self.connected = True
+
+    @property
+    def tag_name(self) -> str:
+        return self.tag
+
+    @property
+    def text(self) -> str:
+        if not self.is_displayed():
+            return ""
+        return re.sub(r"\s+", " ", self._all_text()).strip()
+
+    def _all_text(self) -> str:
+        return self.own_text + " ".join(child._all_text() for child in self.children)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self.attrs.get(name)
+
+    get_dom_attribute = get_attribute
+
+    def set_attribute(self, name: str, value: str) -> None:
+        self.attrs[name] = value
+
+    def is_displayed(self) -> bool:
+        node: Optional[ReplayElement] = self
+        while node is not None:
+            if "hidden" in node.attrs:
+                return False
+            node = node.parent_node
+        return self.connected
+
+    def is_enabled(self) -> bool:
+        return "disabled" not in self.attrs
+
+    def click(self) -> None:
+        driver: ReplayDriver = self.parent
+        driver.tick(driver.config.click_latency)
+        if not self.is_displayed():
+            raise WebDriverException("element not interactable")
+        for target in self.attrs.get("data-replay-hides", "").split():
+            driver.set_hidden(target, True)
+        for target in self.attrs.get("data-replay-reveals", "").split():
+            driver.set_hidden(target, False)
+
+    def find_element(self, by: str = By.ID, value: Optional[str] = None) -> "ReplayElement":
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElementException(f"Replay: kein Element für {value!r}")
+        return found[0]
+
+    def find_elements(self, by: str = By.ID, value: Optional[str] = None) -> list["ReplayElement"]:
+        self.parent.tick()
+        return select(self, _as_css(by, value))
+
+    def iter(self):
+        for child in self.children:
+            yield child
+            yield from child.iter()
+
+    def __repr__(self) -> str:
+        return f"<ReplayElement {self.tag} {self.attrs.get('id', '')}>"
+
+
+def _as_css(by: str, value: Optional[str]) -> str:
+    if by == By.CSS_SELECTOR:
+        return value or ""
+    if by == By.TAG_NAME:
+        return value or ""
+    if by == By.ID:
+        return f"#{value}"
+    raise WebDriverException(f"Replay: Locator {by!r} nicht unterstützt")
+
+
+# ------------------- Mini-CSS -------------------
+
+_COMPOUND = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<id>#[\w-]+)?(?P<attrs>(?:\[[^\]]+\])*)$")
+_ATTRIBUTE = re.compile(r"""\[\s*([\w-]+)\s*(?:([*^$]?=)\s*(?:"([^"]*)"|'([^']*)'|([^\]\s]+)))?\s*\]""")
+
+
+def _split_selector(selector: str) -> list[str]:
+    parts, current, depth = [], "", 0
+    for char in selector.strip():
+        depth += char == "["
+        depth -= char == "]"
+        if char.isspace() and not depth:
+            if current:
+                parts.append(current)
+            current = ""
+        else:
+            current += char
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _compound_matcher(compound: str):
+    match = _COMPOUND.match(compound)
+    if match is None:
+        raise WebDriverException(f"Replay: Selektor {compound!r} nicht unterstützt")
+    tag = match["tag"] if match["tag"] not in (None, "*") else None
+    element_id = match["id"][1:] if match["id"] else None
+    conditions = []
+    for name, op, v1, v2, v3 in _ATTRIBUTE.findall(match["attrs"]):
+        conditions.append((name, op, v1 or v2 or v3))
+
+    def matches(node: ReplayElement) -> bool:
+        if tag and node.tag != tag:
+            return False
+        if element_id and node.attrs.get("id") != element_id:
+            return False
+        for name, op, expected in conditions:
+            actual = node.attrs.get(name)
+            if actual is None:
+                return False
+            if (op == "=" and actual != expected) or (op == "*=" and expected not in actual) \
+                    or (op == "^=" and not actual.startswith(expected)) \
+                    or (op == "$=" and not actual.endswith(expected)):
+                return False
+        return True
+
+    return matches
+
+
+def select(root: ReplayElement, selector: str) -> list[ReplayElement]:
+    """Einfache CSS-Auswahl: Tag, ``#id``, Attribute (``=``, ``*=``, ``^=``, ``$=``) und Nachfahren."""
+    results = []
+    for group in selector.split(","):
+        matchers = [_compound_matcher(part) for part in _split_selector(group)]
+        if not matchers:
+            continue
+        for node in root.iter():
+            if matchers[-1](node) and _ancestors_match(node, matchers[:-1], root):
+                results.append(node)
+    return list(dict.fromkeys(results))
+
+
+def _ancestors_match(node: ReplayElement, matchers: list, root: ReplayElement) -> bool:
+    ancestor = node.parent_node
+    for matcher in reversed(matchers):
+        while ancestor is not None and ancestor is not root.parent_node and not matcher(ancestor):
+            ancestor = ancestor.parent_node
+        if ancestor is None or ancestor is root.parent_node:
+            return False
+        ancestor = ancestor.parent_node
+    return True
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self, driver: "ReplayDriver") -> None:
+        super().__init__(convert_charrefs=True)
+        self.driver = driver
+        self.root = ReplayElement(driver, "#document")
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        node = ReplayElement(self.driver, tag, {k: v or "" for k, v in attrs}, self.stack[-1])
+        self.stack[-1].children.append(node)
+        if tag not in _VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_endtag(self, tag: str) -> None:
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].tag == tag:
+                del self.stack[depth:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        if self.stack[-1].tag not in ("script", "style"):
+            self.stack[-1].own_text += data
+
+
+def parse_html(driver: "ReplayDriver", html: str) -> ReplayElement:
+    builder = _TreeBuilder(driver)
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# ------------------- Driver -------------------
+
+class ReplayDriver:
+    """
+    WebDriver-Ersatz über gespeicherten Seiten.
+
+    Der Verlauf liegt als Liste von Einträgen vor; gerendert wird seitenweise
+    (``page_size`` je Runde), entfernte Einträge verschwinden dauerhaft. Kanalseiten
+    (``…/about``) werden aus dem About-Mitschnitt aufgebaut.
+    """
+
+    def __init__(
+            self,
+            history: Sequence[HistoryEntry],
+            config: Optional[ReplayConfig] = None,
+            about_html: Optional[str] = None,
+    ) -> None:
+        self.config = config or ReplayConfig()
+        self.history: list[HistoryEntry] = list(history)
+        self.about_html = about_html if about_html is not None else ABOUT_SNAPSHOT.read_text(encoding="utf-8")
+        self.ids = itertools.count(1)
+        self.random = random.Random(self.config.seed)
+        self.current_url = "about:blank"
+        self.document = ReplayElement(self, "#document")
+        self.rendered: list[ReplayElement] = []
+        self.next_index = 0
+        self.commands = 0
+        self.visited: list[str] = []
+        self.service = None
+
+    # ---- Zeit ----
+
+    def tick(self, extra: float = 0.0) -> None:
+        """Ein WebDriver-Kommando: Round-Trip-Latenz plus ``extra``."""
+        self.commands += 1
+        delay = self.config.command_latency + extra
+        if delay > 0:
+            time.sleep(delay)
+
+    # ---- Navigation ----
+
+    def get(self, url: str) -> None:
+        self.tick(self.config.page_load)
+        self.current_url = url
+        self.visited.append(url)
+        self.next_index = 0
+        if url.startswith(HISTORY_URL):
+            self.document = ReplayElement(self, "#document")
+            self.rendered = []
+            self._render_more()
+        elif url.rstrip("/").endswith("/about"):
+            self.document = parse_html(self, self.about_html)
+            self.rendered = []
+        else:
+            self.document = ReplayElement(self, "#document")
+            self.rendered = []
+
+    @property
+    def page_source(self) -> str:
+        self.tick()
+        return HISTORY_SNAPSHOT.read_text(encoding="utf-8") if self.current_url.startswith(HISTORY_URL) else ""
+
+    def find_element(self, by: str = By.ID, value: Optional[str] = None) -> ReplayElement:
+        return self.document.find_element(by, value)
+
+    def find_elements(self, by: str = By.ID, value: Optional[str] = None) -> list[ReplayElement]:
+        if self.current_url.startswith(HISTORY_URL) and value == "ytd-video-renderer":
+            self.tick()
+            return list(self.rendered)
+        return self.document.find_elements(by, value)
+
+    def set_hidden(self, element_id: str, hidden: bool) -> None:
+        for node in select(self.document, f"#{element_id}"):
+            if hidden:
+                node.attrs["hidden"] = ""
+            else:
+                node.attrs.pop("hidden", None)
+
+    # ---- Skripte ----
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        self.tick()
+        if script is EXTRACT_HISTORY_JS:
+            return self._extract(*args)
+        if script.startswith("return window.ytInitialData"):
+            return json.dumps(self._history_payload(0)) if self.current_url.startswith(HISTORY_URL) else None
+        if "scrollIntoView" in script or script.strip() == "return 1;":
+            return 1
+        raise WebDriverException(f"Replay: Script nicht nachgebildet: {script[:60]!r}")
+
+    def execute_async_script(self, script: str, *args: Any) -> Any:
+        self.tick()
+        if script is SCROLL_AND_WAIT_JS:
+            return self._scroll_and_wait(*args)
+        if script is REMOVE_BATCH_JS:
+            return self._remove_batch(*args)
+        if script is FETCH_CONTINUATION_JS:
+            page = int(str(args[0]).split(":")[1])
+            time.sleep(self.config.scroll_load)
+            return {"status": 200, "body": json.dumps(self._history_payload(page))}
+        raise WebDriverException(f"Replay: Script nicht nachgebildet: {script[:60]!r}")
+
+    def set_script_timeout(self, seconds: float) -> None:
+        self.tick()
+
+    def execute_cdp_cmd(self, cmd: str, params: dict) -> dict:
+        self.tick()
+        return {}
+
+    def get_log(self, log_type: str) -> list:
+        self.tick()
+        return []
+
+    def quit(self) -> None:
+        self.tick()
+
+    # ---- Verlauf ----
+
+    def _render_more(self) -> int:
+        # Über die Identität: ein erneut angesehenes Video steht mehrfach im Verlauf
+        shown = {id(node.video) for node in self.rendered}
+        added = 0
+        for entry in self.history:
+            if added >= self.config.page_size:
+                break
+            if id(entry) in shown:
+                continue
+            node = ReplayElement(self, "ytd-video-renderer", parent_node=self.document)
+            node.video = entry
+            node.children.append(ReplayElement(self, "button", {"aria-label": "Remove from watch history"}, node))
+            self.document.children.append(node)
+            self.rendered.append(node)
+            added += 1
+        return added
+
+    def _has_more(self) -> bool:
+        return len(self.rendered) < len(self.history)
+
+    def _extract(self, elements, attr: str, only_new: bool, stop_at) -> Any:
+        nodes = elements if elements is not None else [
+            node for node in self.rendered if not (only_new and attr in node.attrs)
+        ]
+        # Wie im Skript: auch eine leere Liste ist "truthy" und liefert {entries, reached}
+        marks = set(stop_at) if stop_at is not None else None
+        reached = False
+        entries = []
+        for i, node in enumerate(nodes):
+            video = node.video
+            if video is None:
+                continue
+            if marks is not None and video.video_id in marks:
+                following = nodes[i + 1].video if i + 1 < len(nodes) else None
+                if len(marks) == 1 or (following is not None and following.video_id in marks):
+                    reached = True
+                    break
+                if following is None:
+                    break
+            if attr not in node.attrs:
+                node.attrs[attr] = str(self.next_index)
+                self.next_index += 1
+            entries.append({
+                "index": int(node.attrs[attr]),
+                "title": video.title,
+                "video_id": video.video_id,
+                "channel_name": video.channel_name,
+                "channel_url": video.channel_url,
+                "element": node,
+            })
+        return {"entries": entries, "reached": reached} if marks is not None else entries
+
+    def _scroll_and_wait(self, tag: str, scroll: bool, timeout_ms: int) -> dict:
+        """
+        Wie ``SCROLL_AND_WAIT_JS``: ohne Scrollen sofort fertig, sobald ein Eintrag oder der
+        Nachlade-Spinner da ist; beim Scrollen fertig mit der nachgeladenen Seite. Ändert sich
+        nichts (leere Seite, Seitenende ohne Spinner), läuft die volle Wartezeit ab.
+        """
+        started = time.perf_counter()
+        new_items = 0
+        if scroll and self._has_more():
+            time.sleep(self.config.scroll_load)
+            new_items = self._render_more()
+        elif scroll or not (self.rendered or self._has_more()):
+            time.sleep(timeout_ms / 1000)
+        return {
+            "new_items": new_items,
+            "items": len(self.rendered),
+            "grew": bool(new_items),
+            "more": self._has_more(),
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+        }
+
+    def _remove_batch(self, nodes: list, clicked_before: list[bool], click_interval_ms: int,
+                      confirm_timeout_ms: int, selector: str) -> list[str]:
+        statuses = []
+        for node, clicked in zip(nodes, clicked_before):
+            if clicked and not node.connected:
+                statuses.append("removed")
+                continue
+            if not node.connected:
+                statuses.append("detached")
+                continue
+            if not select(node, selector):
+                statuses.append("no_button")
+                continue
+            time.sleep(self.config.click_latency + click_interval_ms / 1000)
+            if not node.connected:
+                # Klick auf einen bereits getrennten Knoten: das Skript bestätigt ihn danach als entfernt
+                statuses.append("removed")
+                continue
+            if self.random.random() < self.config.removal_failure_rate:
+                statuses.append("timeout")
+                continue
+            node.connected = False
+            self.rendered.remove(node)
+            self.history = [entry for entry in self.history if entry is not node.video]
+            statuses.append("removed")
+        return statuses
+
+    def _history_payload(self, page: int) -> dict:
+        size = self.config.page_size
+        entries = self.history[page * size:(page + 1) * size]
+        items: list[dict] = [{"videoRenderer": {
+            "videoId": entry.video_id,
+            "title": {"runs": [{"text": entry.title}]},
+            "ownerText": {"runs": [{"text": entry.channel_name, "navigationEndpoint": {
+                "browseEndpoint": {"canonicalBaseUrl": entry.channel_url.removeprefix(YOUTUBE_ORIGIN)}}}]},
+        }} for entry in entries]
+        if (page + 1) * size < len(self.history):
+            items.append({"continuationItemRenderer": {"continuationEndpoint": {
+                "continuationCommand": {"token": f"page:{page + 1}"}}}})
+        return {"contents": items}
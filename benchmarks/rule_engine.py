@@ -0,0 +1,515 @@
+"""
+Mikrobenchmark der BlockRuleEngine mit synthetischen, reproduzierbaren Korpora.
+
+Gemessen werden ``BlockRuleEngine.explain_block_decision`` und ``match_video`` (ohne und mit
+Entscheidungs-Cache) auf mehrsprachigen Titeln und Kanalnamen (Deutsch, Englisch, Kyrillisch,
+Arabisch, CJK, Emojis, Keyword- und Whitelist-Treffer). Regelumfang und Korpusgröße werden
+über Szenarien variiert; je Stufe werden Durchsatz, p50/p99 je Aufruf und die Spitze der
+Python-Allokationen (``tracemalloc``, eigener Durchlauf) gemessen. Alle Zufallswerte hängen
+nur vom Seed ab.
+
+    python -m benchmarks.rule_engine --preset small medium --json rules.json
+    python -m benchmarks.rule_engine --corpus 100000 --keywords 20000 --blocklist 2000000 --compiled
+    python -m benchmarks.rule_engine --preset medium --compare rules.json
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Sequence
+
+from watchangel.matching.matching import match_video
+from watchangel.model.scanned_video import ScannedVideo
+from watchangel.rules import instrumentation
+from watchangel.rules.block_rules import DECISION_LOGIC_VERSION, BlockRuleEngine
+from watchangel.rules.compiled_blocklist import build_blocklist, load_compiled
+from watchangel.rules.language import LanguageDetector
+from watchangel.storage.decision_cache import DecisionCache
+
+# Wortvorräte je Sprache bzw. Schrift – bewusst klein, damit sich Titel wiederholen wie im Verlauf
+WORDS = {
+    "de": ("Kinder", "Spiel", "Lied", "Abenteuer", "Bauernhof", "Tiere", "lernen", "Farben", "Zahlen", "Folge",
+           "neue", "Geschichte", "singen", "tanzen", "Freunde", "Sommer", "basteln", "malen", "Feuerwehr",
+           "Dinosaurier", "für", "mit", "und", "die", "große"),
+    "en": ("kids", "song", "learn", "colors", "numbers", "episode", "new", "story", "fun", "toys", "surprise",
+           "family", "challenge", "funny", "animals", "train", "truck", "dinosaur", "cartoon", "nursery",
+           "rhymes", "the", "with", "and", "best"),
+    "ru": ("дети", "песня", "мультфильм", "игрушки", "новые", "серия", "весело", "учим", "цвета", "для"),
+    "ar": ("اطفال", "اغاني", "كرتون", "العاب", "تعليم", "الوان", "حروف", "قصص", "جديد", "مضحك"),
+    "zh": ("儿歌", "动画", "宝宝", "学习", "颜色", "玩具", "故事", "新的", "合集", "游戏"),
+    "ja": ("こどもの", "うた", "アニメ", "おもちゃ", "たのしい", "えいご", "あそび", "ぬりえ", "でんしゃ"),
+    "ko": ("동요", "만화", "장난감", "아기", "색깔", "놀이", "새로운", "이야기"),
+}
+# Anteil je Sprache an den Titeln; "mixed" kombiniert Latein mit einer zweiten Schrift
+LANGUAGE_WEIGHTS = {"de": 30, "en": 30, "ru": 8, "ar": 7, "zh": 8, "ja": 8, "ko": 4, "mixed": 5}
+EMOJIS = ("😂", "🔥", "🎉", "👶", "🦖", "🚒", "🌈", "⭐", "🎵", "❤️", "🤣", "💥")
+SYLLABLES = ("ka", "lo", "mi", "su", "ra", "te", "no", "bi", "gu", "ze", "fa", "po", "ri", "xu", "ven", "dor",
+             "lak", "mis", "tro", "gel")
+HAN = "龙凤虎鹤龟麟狮熊猫鹰鲸蛇马羊猴鸡狗猪鼠牛兔"
+# Name eingetragener Kanäle; die Blockliste wird daraus erzeugt statt im Speicher gehalten
+BLOCKED_CHANNEL = "Kanal {:07d}"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Umfang eines Messlaufs.
+
+    :param corpus: Anzahl Videos (Titel/Kanal-Paare)
+    :param distinct: Anzahl verschiedener Titel (Wiederholungen wie im echten Verlauf)
+    :param keywords: Anzahl Keywords (zusätzlich ein Zehntel als Phrasen)
+    :param whitelist: Anzahl Whitelist-Patterns (zusätzlich ein Zehntel als Whitelist-Kanäle)
+    :param blocklist: Anzahl blockierter Kanäle
+    :param compiled: Blockliste als kompilierte Datei statt als Set
+    :param keyword_share: Anteil Titel mit Keyword-Treffer
+    :param whitelist_share: Anteil Titel mit Whitelist-Pattern bzw. Videos von Whitelist-Kanälen
+    :param blocked_share: Anteil Videos von blockierten Kanälen
+    :param emoji_share: Anteil Titel mit Emojis
+    """
+    name: str
+    corpus: int
+    distinct: int
+    keywords: int
+    whitelist: int
+    blocklist: int
+    compiled: bool = False
+    keyword_share: float = 0.10
+    whitelist_share: float = 0.02
+    blocked_share: float = 0.05
+    emoji_share: float = 0.30
+
+
+PRESETS = {
+    "small": Scenario("small", corpus=1_000, distinct=500, keywords=20, whitelist=10, blocklist=1_000),
+    "medium": Scenario("medium", corpus=10_000, distinct=2_000, keywords=1_000, whitelist=200, blocklist=100_000),
+    "large": Scenario("large", corpus=100_000, distinct=5_000, keywords=10_000, whitelist=2_000,
+                      blocklist=1_000_000, compiled=True),
+    "xl": Scenario("xl", corpus=1_000_000, distinct=20_000, keywords=30_000, whitelist=20_000,
+                   blocklist=5_000_000, compiled=True),
+}
+
+
+@dataclass
+class RuleSet:
+    """Synthetische Regeln eines Szenarios (Blockliste nur als Anzahl, siehe ``blocked_channels``)."""
+    keywords: list[str]
+    phrases: list[str]
+    whitelist_patterns: list[str]
+    whitelist_channels: list[str]
+    blocklist: int
+
+
+@dataclass
+class StageResult:
+    """Messwerte einer Stufe; Latenzen in Mikrosekunden, Speicher in KiB."""
+    name: str
+    calls: int
+    seconds: float
+    p50_us: Optional[float] = None
+    p99_us: Optional[float] = None
+    peak_kib: Optional[float] = None
+    extra: dict = field(default_factory=dict)
+
+    @property
+    def per_second(self) -> float:
+        return self.calls / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {"name": self.name, "calls": self.calls, "seconds": round(self.seconds, 4),
+                "per_second": round(self.per_second, 1), "p50_us": self.p50_us, "p99_us": self.p99_us,
+                "peak_kib": self.peak_kib, **self.extra}
+
+    def row(self) -> str:
+        def fmt(value: Optional[float], unit: str) -> str:
+            return f"{value:>10.1f}{unit}" if value is not None else f"{'–':>10}{' ' * len(unit)}"
+        return (f"  {self.name:<28} {self.calls:>9} {self.seconds:>8.2f}s {self.per_second:>12.1f}/s "
+                f"p50 {fmt(self.p50_us, 'µs')} p99 {fmt(self.p99_us, 'µs')} peak {fmt(self.peak_kib, 'KiB')}")
+
+
+# ------------------- Korpus und Regeln -------------------
+
+def _pseudo_word(rng: random.Random, syllables: int) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(syllables))
+
+
+def blocked_channels(count: int) -> Iterator[str]:
+    """Namen der blockierten Kanäle (deterministisch, ohne Liste im Speicher)."""
+    return (BLOCKED_CHANNEL.format(i) for i in range(count))
+
+
+def make_rules(scenario: Scenario, seed: int = 0) -> RuleSet:
+    """
+    Erzeugt Keywords, Phrasen und Whitelist-Einträge im Format der Konfigurationsdateien.
+
+    Etwa jedes zehnte Keyword trägt das ``word:``-Präfix, jedes zwanzigste besteht aus
+    Han-Zeichen; Whitelist-Patterns bilden einen eigenen Wortraum, damit sie sich nicht
+    mit Keywords überschneiden.
+    """
+    rng = random.Random(f"rules:{seed}")
+    keywords = []
+    for i in range(scenario.keywords):
+        if i % 20 == 19:
+            keywords.append("".join(rng.choice(HAN) for _ in range(3)))
+        elif i % 10 == 9:
+            keywords.append(f"word:{_pseudo_word(rng, 2)}")
+        else:
+            keywords.append(_pseudo_word(rng, rng.randint(3, 4)))
+    phrases = [f"{_pseudo_word(rng, 2)} {_pseudo_word(rng, 3)}" for _ in range(max(1, scenario.keywords // 10))]
+    patterns = [f"wl{_pseudo_word(rng, 3)}" for _ in range(scenario.whitelist)]
+    channels = [f"Whitelist {_pseudo_word(rng, 2)} {i}" for i in range(scenario.whitelist // 10)]
+    return RuleSet(keywords, phrases, patterns, channels, scenario.blocklist)
+
+
+def _title(rng: random.Random, scenario: Scenario, rules: RuleSet) -> str:
+    language = rng.choices(list(LANGUAGE_WEIGHTS), weights=list(LANGUAGE_WEIGHTS.values()))[0]
+    if language == "mixed":
+        words = rng.choices(WORDS[rng.choice(("de", "en"))], k=3)
+        words += rng.choices(WORDS[rng.choice(("ar", "zh", "ja", "ru"))], k=rng.randint(1, 3))
+    else:
+        words = rng.choices(WORDS[language], k=rng.randint(2, 8))
+
+    if rules.keywords and rng.random() < scenario.keyword_share:
+        hits = rules.keywords + rules.phrases
+        words.insert(rng.randrange(len(words) + 1), rng.choice(hits).removeprefix("word:"))
+    if rules.whitelist_patterns and rng.random() < scenario.whitelist_share:
+        words.append(rng.choice(rules.whitelist_patterns))
+    if rng.random() < scenario.emoji_share:
+        words.append("".join(rng.choices(EMOJIS, k=rng.randint(1, 3))))
+    if rng.random() < 0.2:
+        words.append(f"#{rng.randint(1, 200)}")
+    return " ".join(words)
+
+
+def _channel_pool(rng: random.Random, size: int) -> list[str]:
+    pool = []
+    for i in range(size):
+        language = rng.choices(list(LANGUAGE_WEIGHTS), weights=list(LANGUAGE_WEIGHTS.values()))[0]
+        words = WORDS[language if language != "mixed" else "en"]
+        pool.append(f"{' '.join(rng.choices(words, k=rng.randint(1, 3)))} {rng.choice(('TV', 'Kids', ''))}{i}")
+    return pool
+
+
+def make_corpus(scenario: Scenario, rules: RuleSet, seed: int = 0) -> list[ScannedVideo]:
+    """
+    Erzeugt den Video-Korpus: ``distinct`` Titel, nach einer schiefen Verteilung gezogen
+    (häufige Titel wiederholen sich wie Serien im Verlauf), jedes Video mit eigener ID.
+    """
+    rng = random.Random(f"corpus:{seed}")
+    distinct = max(1, min(scenario.distinct, scenario.corpus))
+    titles = [_title(rng, scenario, rules) for _ in range(distinct)]
+    channels = _channel_pool(rng, max(20, distinct // 4))
+
+    videos = []
+    for i in range(scenario.corpus):
+        title = titles[int(distinct * rng.random() ** 2)]
+        if scenario.blocklist and rng.random() < scenario.blocked_share:
+            channel = BLOCKED_CHANNEL.format(rng.randrange(scenario.blocklist))
+        elif rules.whitelist_channels and rng.random() < scenario.whitelist_share:
+            channel = rng.choice(rules.whitelist_channels)
+        else:
+            channel = rng.choice(channels)
+        videos.append(ScannedVideo(title=title, channel_name=channel, channel_url="", video_id=f"v{i:010d}"))
+    return videos
+
+
+def build_engine(rules: RuleSet, compiled_path: Optional[Path] = None) -> BlockRuleEngine:
+    """
+    Baut die Engine mit eigener Spracherkennung (der prozessweite Cache samt Snapshot bleibt unberührt).
+
+    :param compiled_path: Kompilierte Blockliste; ohne wird ein Set aufgebaut
+    """
+    block_channels = load_compiled(compiled_path) if compiled_path else blocked_channels(rules.blocklist)
+    engine = BlockRuleEngine(
+        keywords=rules.keywords,
+        phrases=rules.phrases,
+        block_channels=block_channels,
+        whitelist_channels=rules.whitelist_channels,
+        whitelist_patterns=rules.whitelist_patterns,
+        script_rules={"cyrillic": 0.5},
+    )
+    engine.language_detector = LanguageDetector()
+    return engine
+
+
+def reset_engine(engine: BlockRuleEngine) -> None:
+    """Leert Sprach-Cache und Kanal-Memo, damit jede Stufe gleich kalt startet."""
+    engine.language_detector = LanguageDetector()
+    engine._channel_memo.clear()
+
+
+# ------------------- Messung -------------------
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-Rank-Perzentil einer aufsteigend sortierten Folge."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def peak_memory(run: Callable[[], object]) -> float:
+    """Spitze der Python-Allokationen während ``run`` in KiB."""
+    tracemalloc.start()
+    try:
+        run()
+        return round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+
+
+def measure_once(name: str, run: Callable[[], object], calls: int = 1, memory: bool = True,
+                 setup: Optional[Callable[[], None]] = None) -> tuple[StageResult, object]:
+    """Misst eine einmalige Stufe (z. B. Aufbau); der Speicherlauf wiederholt sie unter tracemalloc."""
+    if setup:
+        setup()
+    started = time.perf_counter()
+    value = run()
+    result = StageResult(name, calls, time.perf_counter() - started)
+    if memory:
+        if setup:
+            setup()
+        result.peak_kib = peak_memory(run)
+    return result, value
+
+
+def measure_calls(name: str, items: Sequence, call: Callable[[object], object], memory: bool = True,
+                  setup: Optional[Callable[[], None]] = None,
+                  memory_setup: Optional[Callable[[], None]] = None) -> StageResult:
+    """
+    Ruft ``call`` je Element auf und misst jede Ausführung einzeln.
+
+    Der Speicherlauf ist ein zweiter Durchlauf (nach ``memory_setup``), damit die Messung
+    der Allokationen die Latenzen nicht verfälscht.
+    """
+    if setup:
+        setup()
+    clock = time.perf_counter_ns
+    latencies = []
+    started = clock()
+    for item in items:
+        before = clock()
+        call(item)
+        latencies.append(clock() - before)
+    seconds = (clock() - started) / 1e9
+
+    latencies.sort()
+    result = StageResult(name, len(items), seconds,
+                         p50_us=round(percentile(latencies, 0.50) / 1000, 2),
+                         p99_us=round(percentile(latencies, 0.99) / 1000, 2))
+    if memory:
+        if memory_setup:
+            memory_setup()
+        result.peak_kib = peak_memory(lambda: [call(item) for item in items])
+    return result
+
+
+def stage_breakdown(engine: BlockRuleEngine, videos: Sequence[ScannedVideo], sample: int) -> dict:
+    """Zeitanteile der Regelstufen über die Instrumentierung (auf einer Stichprobe)."""
+    reset_engine(engine)
+    instrumentation.disable()
+    stats = instrumentation.enable()
+    try:
+        for video in videos[:sample]:
+            engine.explain_block_decision(video.title, video.channel_name, _video_url(video))
+    finally:
+        instrumentation.disable()
+    return stats.to_dict()["stages"]
+
+
+def _video_url(video: ScannedVideo) -> str:
+    return f"https://www.youtube.com/watch?v={video.video_id}"
+
+
+def run_scenario(scenario: Scenario, seed: int = 0, memory: bool = True, cache: bool = True,
+                 sample: int = 10_000, workdir: Optional[Path] = None) -> dict:
+    """
+    Führt alle Stufen eines Szenarios aus.
+
+    :param seed: Startwert für Korpus und Regeln
+    :param memory: Speicherspitzen messen (je Stufe ein zusätzlicher Durchlauf)
+    :param cache: ``match_video`` zusätzlich mit Entscheidungs-Cache messen
+    :param sample: Stichprobe für die Aufteilung nach Regelstufen
+    :param workdir: Verzeichnis für kompilierte Blockliste und Cache-Datenbank
+    :return: JSON-fähiges Ergebnis
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(workdir or tmp)
+        stages: list[StageResult] = []
+
+        rules = make_rules(scenario, seed)
+        corpus_stage, videos = measure_once(
+            "corpus", lambda: make_corpus(scenario, rules, seed), scenario.corpus, memory)
+        stages.append(corpus_stage)
+
+        compiled_path = None
+        if scenario.compiled:
+            compiled_path = workdir / "blocklist.wabl"
+            compiled_stage, _ = measure_once(
+                "compile_blocklist", lambda: build_blocklist(blocked_channels(scenario.blocklist), compiled_path),
+                scenario.blocklist, memory)
+            stages.append(compiled_stage)
+
+        build_stage, engine = measure_once("build", lambda: build_engine(rules, compiled_path), 1, memory)
+        stages.append(build_stage)
+
+        def explain(video: ScannedVideo):
+            return engine.explain_block_decision(video.title, video.channel_name, _video_url(video))
+
+        # Kalt gemessen: jede Stufe beginnt mit leerem Sprach-Cache und Kanal-Memo. Der Speicherlauf
+        # behält den Sprach-Cache (langdetect unter tracemalloc ist um ein Vielfaches langsamer);
+        # dessen Größe steht separat im Ergebnis.
+        for name, call in (("explain_block_decision", explain),
+                           ("match_video", lambda video: match_video(video, engine))):
+            stage = measure_calls(name, videos, call, memory, setup=lambda: reset_engine(engine),
+                                  memory_setup=engine._channel_memo.clear)
+            stage.extra["language_cache"] = len(engine.language_detector)
+            stages.append(stage)
+        # Warmer Lauf: Sprach-Cache und Kanal-Memo bleiben aus dem vorigen Durchlauf gefüllt
+        stages.append(measure_calls("explain_block_decision[warm]", videos, explain, memory))
+
+        if cache:
+            cache_path = workdir / "decisions.db"
+            cold = DecisionCache(cache_path, max_entries=max(200_000, scenario.corpus))
+            stages.append(measure_calls("match_video[cache kalt]", videos,
+                                        lambda video: match_video(video, engine, cold), False))
+            stages.append(measure_calls("match_video[cache warm]", videos,
+                                        lambda video: match_video(video, engine, cold), memory))
+            cold.close()
+
+        decisions = Counter(
+            (decision.reason or "allowed").split(":")[0]
+            for decision in (explain(video) for video in videos)
+        )
+        return {
+            "scenario": asdict(scenario),
+            "seed": seed,
+            "rules": {"keywords": len(rules.keywords), "phrases": len(rules.phrases),
+                      "whitelist_patterns": len(rules.whitelist_patterns),
+                      "whitelist_channels": len(rules.whitelist_channels), "blocklist": rules.blocklist},
+            "stages": [stage.as_dict() for stage in stages],
+            "rule_stages": stage_breakdown(engine, videos, sample),
+            "decisions": dict(decisions.most_common()),
+        }
+
+
+# ------------------- Ergebnisse -------------------
+
+def _git_revision() -> Optional[str]:
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                timeout=5, cwd=Path(__file__).parent)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def run_benchmarks(scenarios: Sequence[Scenario], seed: int = 0, memory: bool = True, cache: bool = True,
+                   sample: int = 10_000) -> dict:
+    """Führt alle Szenarien aus und liefert das Ergebnisdokument samt Metadaten."""
+    results = []
+    for scenario in scenarios:
+        print(f"[⏱️] Szenario {scenario.name}: {scenario.corpus} Videos, {scenario.keywords} Keywords, "
+              f"{scenario.whitelist} Whitelist-Patterns, {scenario.blocklist} Kanäle"
+              f"{' (kompiliert)' if scenario.compiled else ''}")
+        results.append(run_scenario(scenario, seed, memory, cache, sample))
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "decision_logic_version": DECISION_LOGIC_VERSION,
+            "seed": seed,
+            "memory": memory,
+        },
+        "results": results,
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = []
+    for result in report["results"]:
+        lines.append(f"{result['scenario']['name']}  {result['rules']}")
+        for stage in result["stages"]:
+            lines.append(StageResult(stage["name"], stage["calls"], stage["seconds"], stage["p50_us"],
+                                     stage["p99_us"], stage["peak_kib"]).row())
+        lines.append(f"  Regelstufen (Ø µs): " + ", ".join(
+            f"{name} {stats['avg_us']}" for name, stats in result["rule_stages"].items()))
+        lines.append(f"  Entscheidungen: {result['decisions']}")
+    return "\n".join(lines)
+
+
+def compare_reports(baseline: dict, current: dict) -> list[str]:
+    """
+    Vergleicht zwei Ergebnisdokumente je Szenario und Stufe.
+
+    :return: Zeilen mit Durchsatz-Verhältnis (neu/alt) und p99-Änderung; nur gemeinsame Stufen
+    """
+    def index(report: dict) -> dict:
+        return {(result["scenario"]["name"], stage["name"]): stage
+                for result in report["results"] for stage in result["stages"]}
+
+    old, new = index(baseline), index(current)
+    lines = []
+    for key in (key for key in new if key in old):
+        before, after = old[key], new[key]
+        ratio = after["per_second"] / before["per_second"] if before["per_second"] else 0.0
+        line = f"{key[0]:<8} {key[1]:<28} {ratio:>6.2f}x Durchsatz"
+        if before.get("p99_us") and after.get("p99_us"):
+            line += f"   p99 {before['p99_us']:>9.1f} → {after['p99_us']:>9.1f} µs"
+        lines.append(line)
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mikrobenchmark der BlockRuleEngine auf synthetischen Korpora")
+    parser.add_argument("--preset", nargs="+", choices=list(PRESETS), default=["small", "medium"],
+                        help="Vordefinierte Szenarien")
+    parser.add_argument("--corpus", type=int, help="Eigenes Szenario: Anzahl Videos (ersetzt --preset)")
+    parser.add_argument("--distinct", type=int, help="Verschiedene Titel (Standard: 20 %% des Korpus)")
+    parser.add_argument("--keywords", type=int, default=1_000, help="Eigenes Szenario: Anzahl Keywords")
+    parser.add_argument("--whitelist", type=int, default=200, help="Eigenes Szenario: Whitelist-Patterns")
+    parser.add_argument("--blocklist", type=int, default=100_000, help="Eigenes Szenario: blockierte Kanäle")
+    parser.add_argument("--compiled", action="store_true", help="Blockliste kompilieren statt als Set halten")
+    parser.add_argument("--seed", type=int, default=0, help="Startwert für Korpus und Regeln")
+    parser.add_argument("--no-memory", action="store_true", help="Keine Speichermessung (je Stufe ein Durchlauf weniger)")
+    parser.add_argument("--no-cache", action="store_true", help="match_video nicht mit Entscheidungs-Cache messen")
+    parser.add_argument("--sample", type=int, default=10_000, help="Stichprobe für die Regelstufen-Aufteilung")
+    parser.add_argument("--json", type=Path, help="Ergebnisse als JSON schreiben")
+    parser.add_argument("--compare", type=Path, help="Mit früherem JSON-Ergebnis vergleichen")
+    args = parser.parse_args()
+
+    if args.corpus:
+        scenarios = [Scenario("custom", corpus=args.corpus, distinct=args.distinct or max(1, args.corpus // 5),
+                              keywords=args.keywords, whitelist=args.whitelist, blocklist=args.blocklist,
+                              compiled=args.compiled)]
+    else:
+        scenarios = [PRESETS[name] for name in args.preset]
+        if args.compiled:
+            scenarios = [replace(scenario, compiled=True) for scenario in scenarios]
+        if args.distinct:
+            scenarios = [replace(scenario, distinct=args.distinct) for scenario in scenarios]
+
+    report = run_benchmarks(scenarios, args.seed, not args.no_memory, not args.no_cache, args.sample)
+
+    print()
+    print(format_report(report))
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(f"\n[📊] Vergleich mit {args.compare} ({baseline['meta'].get('git') or '?'}):")
+        for line in compare_reports(baseline, report):
+            print(line)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"[💾] Ergebnisse gespeichert: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
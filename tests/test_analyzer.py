@@ -1,20 +1,27 @@
 from pathlib import Path
 
 from watchangel.analysis import analyzer
+from watchangel.rules.block_rules import BlockRuleEngine
 from unittest.mock import patch, MagicMock
 
 
+def _keyword_hit(title: str):
+    # Titelprüfung läuft inzwischen über die Keywords der BlockRuleEngine (config/block_keywords.txt)
+    matcher = BlockRuleEngine.load_once().matcher
+    return matcher.first_match("keywords", matcher.scan(title.lower()))
+
+
 def test_is_suspicious_title_hits_expected():
-    assert analyzer.is_suspicious_title("Rainbow M&Ms slime colors") is True
-    assert analyzer.is_suspicious_title("oddly satisfying video") is True
+    assert _keyword_hit("Rainbow M&Ms slime colors") == "slime"
+    assert _keyword_hit("oddly satisfying video") == "oddly satisfying"
 
 
 def test_is_suspicious_title_false_positive():
-    assert analyzer.is_suspicious_title("Educational video about animals") is False
-    assert analyzer.is_suspicious_title("Introduction to math for kids") is False
+    assert _keyword_hit("Educational video about animals") is None
+    assert _keyword_hit("Introduction to math for kids") is None
 
 
-@patch("watchangel.analyzer.requests.get")
+@patch("watchangel.analysis.analyzer.requests.get")
 def test_save_thumbnail_creates_file(mock_get, tmp_path: Path):
     video_id = "abc123"
     out_path = tmp_path / "thumb.jpg"
@@ -0,0 +1,38 @@
+from watchangel.rules import block_rules
+from watchangel.rules.block_rules import BlockRuleEngine
+
+VIDEOS = [
+    ("Rainbow slime crushing", "Slime Kanal", "https://www.youtube.com/watch?v=a1"),
+    ("Mein Tag im Zoo mit den Kindern heute", "Familie Meier", "https://www.youtube.com/watch?v=a2"),
+    ("Rainbow slime crushing", "Slime Kanal", "https://www.youtube.com/watch?v=a3"),
+    ("Best of 2023", "Musik", "https://www.youtube.com/watch?v=a4&list=RDxyz"),
+    ("مرحبا بكم", "Kanal", ""),
+    ("Guten Morgen", "Eva Vlog", ""),
+    ("YOASOBI live", "Eva Vlog", ""),
+]
+
+
+def _engine() -> BlockRuleEngine:
+    return BlockRuleEngine(
+        keywords=["slime", "crushing"],
+        phrases=[],
+        block_channels=["Eva Vlog"],
+        whitelist_patterns=["yoasobi"],
+    )
+
+
+def test_batch_matches_serial_decisions():
+    engine = _engine()
+    serial = [_engine().explain_block_decision(*video) for video in VIDEOS]
+
+    assert engine.explain_block_decisions(VIDEOS, workers=1) == serial
+
+
+def test_batch_process_pool_keeps_input_order(monkeypatch):
+    monkeypatch.setattr(block_rules, "PARALLEL_MIN_ITEMS", 1)
+    videos = VIDEOS * 5
+    engine = _engine()
+
+    assert engine.explain_block_decisions(videos, workers=2) == [
+        engine.explain_block_decision(*video) for video in videos
+    ]
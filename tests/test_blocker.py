@@ -1,25 +1,32 @@
-import pytest
-from unittest.mock import MagicMock, patch
-from watchangel.blocker import block_channel
+from unittest.mock import MagicMock
 
-@patch("watchangel.blocker.time.sleep")
-def test_block_channel_click_sequence(mock_sleep):
-    # BLOCK_PHRASES enthält z. B. "don't recommend channel"
-    mock_video = MagicMock()
-    mock_menu_button = MagicMock()
-    mock_video.find_element.return_value = mock_menu_button
+from watchangel.blocker import actions
+from watchangel.storage import db
+from watchangel.storage.moderation_state import get_moderation_store
 
-    mock_menu_item = MagicMock()
-    mock_menu_item.text = "Don't recommend channel"
-    mock_menu_item.click = MagicMock()
 
-    driver = MagicMock()
-    driver.get = MagicMock()
-    driver.find_element.return_value = mock_video
-    driver.find_elements.return_value = [mock_menu_item]
+def test_block_channel_click_sequence(tmp_path, monkeypatch):
+    monkeypatch.setattr(actions.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(actions, "wait_for_about_modal", lambda driver: True)
+    open_menu = MagicMock()
+    monkeypatch.setattr(actions, "open_report_menu", open_menu)
+
+    hide_item, block_item = MagicMock(), MagicMock()
+    hide_item.text = "Hide user from my channel"
+    block_item.text = "Block channel for kids"
+    monkeypatch.setattr(actions, "get_report_menu_items", lambda driver: [hide_item, block_item])
+    hide = MagicMock(return_value=True)
+    block = MagicMock(return_value=True)
+    monkeypatch.setattr(actions, "handle_hide_user", hide)
+    monkeypatch.setattr(actions, "handle_block_kids", block)
 
-    block_channel(driver, "https://www.youtube.com/channel/abc123")
+    driver = MagicMock()
+    with db.use_database(tmp_path / "watchangel.db"):
+        assert actions.block_channel(driver, "https://www.youtube.com/channel/abc123")
+        assert get_moderation_store().get("https://www.youtube.com/channel/abc123").done
 
-    driver.get.assert_called_once_with("https://www.youtube.com/channel/abc123")
-    mock_menu_button.click.assert_called_once()
-    mock_menu_item.click.assert_called_once()
+    driver.get.assert_called_once_with("https://www.youtube.com/channel/abc123/about")
+    # Menü einmal zum Lesen, einmal erneut für "Block channel for kids"
+    assert open_menu.call_count == 2
+    hide.assert_called_once_with(driver, hide_item)
+    block.assert_called_once_with(driver, block_item)
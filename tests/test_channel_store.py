@@ -0,0 +1,53 @@
+import json
+import pickle
+
+from watchangel.rules.block_rules import BlockRuleEngine
+from watchangel.storage.channel_store import ChannelStore
+
+
+def _store(tmp_path, log_lines=()):
+    log = tmp_path / "blocked_channels.log"
+    if log_lines:
+        log.write_text("\n".join(json.dumps(line) for line in log_lines) + "\n", encoding="utf-8")
+    return ChannelStore(tmp_path / "watchangel.db", legacy_log=log)
+
+
+def test_migrates_legacy_log_once(tmp_path):
+    store = _store(tmp_path, [
+        {"channel_name": "Slime TV"},
+        {"channel_name": "slime tv", "channel_url": "https://www.youtube.com/@slimetv", "video_title": "Slime"},
+        {"channel_name": "Eva Vlog", "channel_url": "https://www.youtube.com/@eva"},
+    ])
+
+    assert len(store) == 2
+    assert "SLIME TV" in store
+    assert store.get("slime tv")["channel_url"] == "https://www.youtube.com/@slimetv"
+    assert not (tmp_path / "blocked_channels.log").exists()
+    assert (tmp_path / "blocked_channels.log.migrated").exists()
+
+
+def test_add_and_remove_bump_revision(tmp_path):
+    store = _store(tmp_path)
+    start = store.revision()
+
+    assert store.add({"channel_name": "Kanal", "channel_url": "u", "title": "t", "video_id": "v"}) is True
+    assert store.add({"channel_name": "kanal"}) is False
+    assert store.revision() == start + 1
+
+    assert store.remove(["KANAL", "unbekannt"]) == 1
+    assert "kanal" not in store
+    assert store.revision() == start + 2
+
+
+def test_engine_queries_store_and_respects_undo(tmp_path):
+    store = _store(tmp_path)
+    store.add({"channel_name": "Eva Vlog"})
+    store.add({"channel_name": "Rosé"})
+    engine = BlockRuleEngine(keywords=[], phrases=[], block_channels=store, undo_channels=["rosé"])
+
+    assert engine.is_blocked_channel("Eva Vlog")
+    assert not engine.is_blocked_channel("Rosé")
+    assert engine.explain_block_decision("Hallo", "Eva Vlog").reason == "explicitly blocked channel"
+
+    restored = pickle.loads(pickle.dumps(engine))
+    assert restored.is_blocked_channel("eva vlog")
@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock
+
+from watchangel.cleaner import cleaner
+from watchangel.cleaner.removal_engine import REMOVE_BATCH_JS, RemovalConfig
+from watchangel.rules.block_rules import BlockRuleEngine
+
+
+def _raw(index, video_id, channel, url=""):
+    return {"index": index, "title": video_id, "video_id": video_id, "channel_name": channel,
+            "channel_url": url, "element": MagicMock(name=video_id)}
+
+
+def test_purge_channels_removes_all_targets_in_one_pass(monkeypatch):
+    rules = BlockRuleEngine([], [], block_channels=[], whitelist_channels=["Freund"])
+    monkeypatch.setattr(cleaner, "get_log_rules", lambda: rules)
+
+    rounds = [
+        [_raw(0, "a", "Slime TV"), _raw(1, "b", "Eva"), _raw(2, "c", "Freund")],
+        # "a" wurde erneut angesehen: zweiter Verlaufseintrag desselben Videos
+        [_raw(3, "d", "Anderer", "https://www.youtube.com/@gamer/"), _raw(4, "e", "slime tv"),
+         _raw(5, "a", "Slime TV")],
+        [],
+    ]
+    clicked = []
+
+    def run_async(script, *args):
+        if script is REMOVE_BATCH_JS:
+            clicked.extend(element._mock_name for element in args[0])
+            return ["timeout" if element._mock_name == "d" else "removed" for element in args[0]]
+        return {"new_items": 0, "items": 0, "more": False, "elapsed_ms": 5}
+
+    driver = MagicMock()
+    driver.execute_script.side_effect = lambda script, *args: rounds.pop(0) if rounds else []
+    driver.execute_async_script.side_effect = run_async
+
+    result = cleaner.purge_channels(driver, ["SLIME TV", "freund", "https://www.youtube.com/@gamer"],
+                                    RemovalConfig(batch_delay=0, click_interval=0, max_retries=0))
+
+    # Von unten nach oben, in einem Batch über die RemovalEngine
+    assert clicked == ["a", "e", "d", "a"]
+    assert result.removed == {"Slime TV": 3}
+    assert result.failed_for("https://www.youtube.com/@gamer") == 1
+    assert result.failed_for("Slime TV") == 0
+    assert driver.get.call_count == 1
+
+
+def test_purge_without_targets_does_not_load_history():
+    driver = MagicMock()
+    assert cleaner.purge_channels(driver, ["", "  "]) == cleaner.PurgeResult()
+    driver.get.assert_not_called()
+
+
+def test_purge_keeps_titles_matching_a_whitelist_pattern(monkeypatch):
+    rules = BlockRuleEngine([], [], block_channels=["Slime TV"], whitelist_patterns=["Farben lernen"])
+    monkeypatch.setattr(cleaner, "get_log_rules", lambda: rules)
+    rounds = [[_raw(0, "a", "Slime TV"), dict(_raw(1, "b", "Slime TV"), title="Farben lernen mit Eva")], []]
+    clicked = []
+
+    def run_async(script, *args):
+        if script is REMOVE_BATCH_JS:
+            clicked.extend(element._mock_name for element in args[0])
+            return ["removed"] * len(args[0])
+        return {"new_items": 0, "items": 0, "more": False, "elapsed_ms": 5}
+
+    driver = MagicMock()
+    driver.execute_script.side_effect = lambda script, *args: rounds.pop(0) if rounds else []
+    driver.execute_async_script.side_effect = run_async
+
+    result = cleaner.purge_channels(driver, ["Slime TV"], RemovalConfig(batch_delay=0, click_interval=0))
+
+    assert clicked == ["a"]
+    assert result.removed == {"Slime TV": 1}
@@ -0,0 +1,75 @@
+import pickle
+
+from watchangel.rules.block_rules import BlockRuleEngine
+from watchangel.rules.compiled_blocklist import (
+    ChannelUnion, CompiledChannelSet, build_blocklist, read_channel_names,
+)
+
+
+def _build(tmp_path, names, bloom_bits=10):
+    path = tmp_path / "block_channels.wabl"
+    build_blocklist(names, path, bloom_bits)
+    return CompiledChannelSet(path)
+
+
+def test_lookup_is_case_insensitive_and_deduplicated(tmp_path):
+    names = [f"Kanal {i}" for i in range(1000)] + ["Слайм ТВ", "kanal 1", "  "]
+    compiled = _build(tmp_path, names)
+
+    assert len(compiled) == 1001
+    assert "KANAL 999" in compiled
+    assert " слайм тв " in compiled
+    assert "Kanal 1000" not in compiled
+    assert "" not in compiled
+    assert list(compiled) == sorted(list(compiled), key=lambda n: n.encode("utf-8"))
+
+
+def test_lookup_without_bloom_filter(tmp_path):
+    compiled = _build(tmp_path, ["a", "b", "c"], bloom_bits=0)
+    assert all(name in compiled for name in "abc")
+    assert "d" not in compiled
+
+
+def test_empty_list(tmp_path):
+    compiled = _build(tmp_path, [])
+    assert len(compiled) == 0
+    assert "kanal" not in compiled
+
+
+def test_read_channel_names_skips_comments(tmp_path):
+    source = tmp_path / "community.txt"
+    source.write_text("# Liste\nKanal A\n\nKanal B\n", encoding="utf-8")
+    assert list(read_channel_names([source])) == ["Kanal A", "Kanal B"]
+
+
+def test_pickles_by_path(tmp_path):
+    compiled = _build(tmp_path, ["Kanal"])
+    restored = pickle.loads(pickle.dumps(compiled))
+    assert "kanal" in restored
+    assert restored.digest == compiled.digest
+
+
+def test_engine_queries_union_and_fingerprints_by_digest(tmp_path):
+    compiled = _build(tmp_path, ["Community Kanal"])
+    engine = BlockRuleEngine([], [], block_channels=ChannelUnion({"lokal"}, compiled), allowed_languages=("en",))
+
+    assert engine.explain_block_decision("Cat", "community kanal").reason == "explicitly blocked channel"
+    assert engine.explain_block_decision("Cat", "Lokal").block
+    assert not engine.explain_block_decision("Cat", "Other").block
+
+    rebuilt = _build(tmp_path, ["Community Kanal", "Neu"])
+    other = BlockRuleEngine([], [], block_channels=ChannelUnion({"lokal"}, rebuilt), allowed_languages=("en",))
+    assert engine.fingerprint != other.fingerprint
+
+
+def test_rebuild_closes_the_mapping_of_the_replaced_file(tmp_path):
+    compiled = _build(tmp_path, ["Kanal"])
+    other = CompiledChannelSet(compiled.path)
+    build_blocklist(["Anders"], tmp_path / "other.wabl")
+    elsewhere = CompiledChannelSet(tmp_path / "other.wabl")
+
+    rebuilt = _build(tmp_path, ["Kanal", "Neu"])
+
+    assert compiled._mm.closed and other._mm.closed
+    assert not elsewhere._mm.closed
+    assert "neu" in rebuilt
@@ -1,4 +1,3 @@
-import pytest
 from watchangel.utils import config_loader
 
 CONFIG_FILE = "block_keywords.txt"
@@ -27,6 +26,6 @@ def test_load_lines_ignores_empty_lines(tmp_path):
         config_loader.CONFIG_DIR = original_config_dir
 
 
-def test_load_lines_raises_if_missing():
-    with pytest.raises(FileNotFoundError):
-        config_loader.load_lines("does_not_exist.txt")
+def test_load_lines_warns_and_returns_empty_if_missing(capsys):
+    assert config_loader.load_lines("does_not_exist.txt") == []
+    assert "nicht gefunden" in capsys.readouterr().out
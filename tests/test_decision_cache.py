@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock
+
+from watchangel.matching.matching import match_videos
+from watchangel.model.scanned_video import ScannedVideo
+from watchangel.rules.block_rules import BlockDecision, BlockRuleEngine
+from watchangel.storage.channel_store import ChannelStore
+from watchangel.storage.decision_cache import DecisionCache
+
+
+def _video(video_id: str, title: str, channel: str) -> ScannedVideo:
+    return ScannedVideo(title=title, channel_name=channel, channel_url="", video_id=video_id, element=MagicMock())
+
+
+def test_cache_roundtrip_and_eviction(tmp_path):
+    cache = DecisionCache(tmp_path / "cache.db", max_entries=2)
+    cache.put("a", "fp", BlockDecision(True, "matched keyword: slime"))
+    cache.put("b", "fp", BlockDecision(False, None))
+    cache.get("a", "fp")
+    cache.put("c", "fp", BlockDecision(False, "whitelisted"))
+
+    assert cache.get("a", "fp") == BlockDecision(True, "matched keyword: slime")
+    assert cache.get("b", "fp") is None
+    assert cache.get("a", "other") is None
+    assert len(cache) == 2
+
+
+def test_match_videos_serves_repeat_runs_from_cache(tmp_path):
+    cache = DecisionCache(tmp_path / "cache.db")
+    rules = BlockRuleEngine(keywords=["slime"], phrases=[], block_channels=[])
+    videos = [_video("v1", "Slime time", "Kanal A"), _video("v2", "Guten Morgen", "Kanal B")]
+
+    first = match_videos(videos, rules, cache=cache)
+    second = match_videos(videos, rules, cache=cache)
+
+    assert [m.block.video_id for m in first] == [m.block.video_id for m in second] == ["v1"]
+    assert cache.stats.hits == 2
+
+    changed = BlockRuleEngine(keywords=["morgen"], phrases=[], block_channels=[])
+    assert [m.block.video_id for m in match_videos(videos, changed, cache=cache)] == ["v2"]
+
+
+def test_newly_blocked_channel_overrides_cached_pass(tmp_path):
+    cache = DecisionCache(tmp_path / "cache.db")
+    store = ChannelStore(tmp_path / "store.db", legacy_log=None)
+    rules = BlockRuleEngine(keywords=[], phrases=[], block_channels=store)
+    videos = [_video("v1", "Guten Morgen", "Kanal A")]
+
+    assert match_videos(videos, rules, cache=cache) == []
+
+    store.add({"channel_name": "Kanal A"})
+    matches = match_videos(videos, rules, cache=cache)
+    assert matches[0].decision.reason == "explicitly blocked channel"
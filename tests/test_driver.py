@@ -0,0 +1,46 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from watchangel.browser.driver import (
+    FULL_PROFILE, LEAN_PROFILE, apply_resource_blocking, build_options, driver_profile,
+)
+
+
+def test_full_profile_keeps_previous_behaviour():
+    options = build_options(Path("/tmp/profile"))
+
+    assert options.arguments == ["user-data-dir=/tmp/profile"]
+    assert options.page_load_strategy == "normal"
+    assert FULL_PROFILE.blocked_urls() == []
+
+
+def test_lean_profile_is_headless_and_eager():
+    options = build_options(Path("/tmp/profile"), LEAN_PROFILE)
+
+    assert "--headless=new" in options.arguments
+    assert options.page_load_strategy == "eager"
+    blocked = LEAN_PROFILE.blocked_urls()
+    assert "*://i.ytimg.com/*" in blocked
+    assert "*://*.googlevideo.com/*" in blocked
+    assert "*://*.doubleclick.net/*" in blocked
+
+
+def test_keep_images_only_drops_image_patterns():
+    blocked = driver_profile("lean", keep_images=True).blocked_urls()
+
+    assert "*://i.ytimg.com/*" not in blocked
+    assert "*://*.googlevideo.com/*" in blocked
+
+
+def test_resource_blocking_uses_cdp():
+    driver = MagicMock()
+    apply_resource_blocking(driver, ["*://*.doubleclick.net/*"])
+
+    driver.execute_cdp_cmd.assert_called_with("Network.setBlockedURLs", {"urls": ["*://*.doubleclick.net/*"]})
+
+
+def test_nothing_blocked_skips_cdp():
+    driver = MagicMock()
+    apply_resource_blocking(driver, [])
+
+    driver.execute_cdp_cmd.assert_not_called()
@@ -0,0 +1,74 @@
+from watchangel.rules.block_rules import BlockRuleEngine
+from watchangel.rules.compiled_blocklist import ChannelUnion, build_blocklist, load_compiled
+from watchangel.rules.engine_instance import RulesSnapshot
+
+
+def _snapshot(tmp_path):
+    source = tmp_path / "whitelist_channels.txt"
+    source.write_text("Kanal A\n", encoding="utf-8")
+
+    def build() -> BlockRuleEngine:
+        names = source.read_text(encoding="utf-8").splitlines()
+        return BlockRuleEngine(keywords=[], phrases=[], block_channels=[], whitelist_channels=names)
+
+    return source, RulesSnapshot(build, sources=[source])
+
+
+def test_snapshot_is_reused_while_sources_unchanged(tmp_path):
+    _, snapshot = _snapshot(tmp_path)
+
+    first = snapshot.get()
+    assert snapshot.get() is first
+    assert first.version > 0
+
+
+def test_snapshot_rebuilds_after_edit(tmp_path):
+    source, snapshot = _snapshot(tmp_path)
+    first = snapshot.get()
+
+    source.write_text("Kanal A\nKanal B\n", encoding="utf-8")
+    second = snapshot.get()
+
+    assert second is not first
+    assert second.version > first.version
+    assert "kanal b" in second.whitelist_channels
+
+
+def test_edit_during_build_triggers_another_rebuild(tmp_path):
+    source = tmp_path / "whitelist_channels.txt"
+    source.write_text("Kanal A\n", encoding="utf-8")
+    builds = []
+
+    def build() -> BlockRuleEngine:
+        names = source.read_text(encoding="utf-8").splitlines()
+        builds.append(names)
+        if len(builds) == 1:
+            source.write_text("Kanal A\nKanal B\n", encoding="utf-8")  # Änderung nach dem Einlesen
+        return BlockRuleEngine(keywords=[], phrases=[], block_channels=[], whitelist_channels=names)
+
+    snapshot = RulesSnapshot(build, sources=[source])
+    first = snapshot.get()
+    second = snapshot.get()
+
+    assert second is not first
+    assert "kanal b" in second.whitelist_channels
+    assert snapshot.get() is second
+
+
+def test_replaced_snapshot_releases_compiled_lists(tmp_path):
+    source = tmp_path / "block_channels.wabl"
+    build_blocklist(["Kanal A"], source)
+    opened = []
+
+    def build() -> BlockRuleEngine:
+        opened.append(load_compiled(source))
+        return BlockRuleEngine(keywords=[], phrases=[], block_channels=ChannelUnion(set(), opened[-1]))
+
+    snapshot = RulesSnapshot(build, sources=[source])
+    first = snapshot.get()
+    snapshot.invalidate()
+    second = snapshot.get()
+
+    assert second is not first
+    assert opened[0]._mm.closed and not opened[1]._mm.closed
+    assert "kanal a" in second.block_channels
@@ -0,0 +1,61 @@
+from unittest.mock import MagicMock
+
+from watchangel.analysis.extractor import INDEX_ATTRIBUTE, HistoryCursor, extract_history_entries
+from watchangel.cleaner.cleaner import scroll_and_process
+
+
+def _raw(index, video_id, channel="Kanal"):
+    return {
+        "index": index,
+        "title": f"Titel {video_id}",
+        "video_id": video_id,
+        "channel_name": channel,
+        "channel_url": "https://www.youtube.com/@kanal",
+        "element": MagicMock(name=video_id),
+    }
+
+
+def test_extracts_all_entries_in_one_call():
+    driver = MagicMock()
+    driver.execute_script.return_value = [_raw(0, "a"), _raw(1, "b")]
+
+    videos = extract_history_entries(driver)
+
+    assert driver.execute_script.call_count == 1
+    _, elements, attribute, only_new, stop_at = driver.execute_script.call_args.args
+    assert elements is None and attribute == INDEX_ATTRIBUTE and only_new is False and stop_at is None
+    assert [(v.index, v.video_id, v.title) for v in videos] == [(0, "a", "Titel a"), (1, "b", "Titel b")]
+    assert videos[0].element is driver.execute_script.return_value[0]["element"]
+
+
+def test_cursor_requests_only_new_nodes_and_dedupes_by_video_id():
+    driver = MagicMock()
+    driver.execute_script.side_effect = [[_raw(0, "a"), _raw(1, "b")], [_raw(2, "a"), _raw(3, "c")]]
+    cursor = HistoryCursor(driver)
+
+    assert [v.video_id for v in cursor.next_batch()] == ["a", "b"]
+    assert [v.video_id for v in cursor.next_batch()] == ["c"]
+    assert len(cursor) == 3
+    assert all(call.args[3] is True for call in driver.execute_script.call_args_list)
+
+
+def test_cursor_for_removal_keeps_repeated_entries_of_a_video():
+    driver = MagicMock()
+    driver.execute_script.side_effect = [[_raw(0, "a"), _raw(1, "b")], [_raw(2, "a"), _raw(2, "a")]]
+    cursor = HistoryCursor(driver, dedupe="index")
+
+    assert [v.index for v in cursor.next_batch()] == [0, 1]
+    assert [v.index for v in cursor.next_batch()] == [2]
+    assert len(cursor) == 3
+
+
+def test_scroll_and_process_stops_when_processor_returns_true():
+    rounds = [[_raw(0, "a"), _raw(1, "b")], [], [_raw(2, "c"), _raw(3, "d")]]
+    driver = MagicMock()
+    driver.execute_script.side_effect = lambda script, *args: rounds.pop(0)
+    driver.execute_async_script.return_value = {"new_items": 2, "items": 2, "more": True, "elapsed_ms": 10}
+
+    visited = []
+    scroll_and_process(driver, lambda video: visited.append(video.video_id) or video.video_id == "c")
+
+    assert visited == ["a", "b", "c"]
@@ -0,0 +1,56 @@
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from watchangel.analysis.history_data import extract_initial_data, parse_history_payload, read_history_data
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _initial_html() -> str:
+    return (FIXTURES / "history_initial.html").read_text(encoding="utf-8")
+
+
+def _continuation() -> dict:
+    return json.loads((FIXTURES / "history_continuation.json").read_text(encoding="utf-8"))
+
+
+def test_parses_initial_data_from_page_source():
+    page = parse_history_payload(extract_initial_data(_initial_html()))
+
+    assert [v.video_id for v in page.videos] == ["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc"]
+    first = page.videos[0]
+    assert (first.title, first.channel_name, first.channel_url) == (
+        "Slime Challenge!!", "Slime TV", "https://www.youtube.com/@slimetv")
+    assert first.element is None
+    assert page.continuation == "TOKEN_PAGE_2"
+
+
+def test_parses_continuation_with_lockup_view_models():
+    page = parse_history_payload(_continuation())
+
+    assert [v.video_id for v in page.videos] == ["aaaaaaaaaaa", "ddddddddddd"]
+    lockup = page.videos[1]
+    assert (lockup.title, lockup.channel_name, lockup.channel_url) == (
+        "Ткань и краски", "Мир Канал", "https://www.youtube.com/@mirkanal")
+    assert page.continuation is None
+
+
+def test_missing_initial_data_raises():
+    with pytest.raises(ValueError):
+        extract_initial_data("<html><body>Kein Verlauf</body></html>")
+
+
+def test_reader_follows_continuations_and_dedupes():
+    driver = MagicMock()
+    driver.execute_script.return_value = None
+    driver.page_source = _initial_html()
+    driver.execute_async_script.return_value = {"status": 200, "body": json.dumps(_continuation())}
+
+    videos = read_history_data(driver)
+
+    assert [v.video_id for v in videos] == ["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc", "ddddddddddd"]
+    assert [v.index for v in videos] == [0, 1, 2, 3]
+    assert driver.execute_async_script.call_args.args[1] == "TOKEN_PAGE_2"
@@ -0,0 +1,40 @@
+from watchangel.rules import instrumentation
+from watchangel.rules.block_rules import BlockRuleEngine
+
+
+def test_stage_and_rule_counters():
+    engine = BlockRuleEngine(keywords=["slime", "toy", "unused"], phrases=[], block_channels=["Eva Vlog"])
+    stats = instrumentation.enable()
+    stats.reset()
+    try:
+        engine.explain_block_decision("Slime toy", "Kanal")
+        engine.explain_block_decision("Hallo", "Eva Vlog")
+        engine.explain_block_decision("Hallo", "Kanal")
+    finally:
+        instrumentation.disable()
+
+    data = stats.to_dict()
+    assert data["decisions"] == 2
+    assert data["stages"]["mix"]["calls"] == 3
+    assert data["stages"]["blocklist"]["hits"] == 1
+    assert data["stages"]["keywords"] == {**data["stages"]["keywords"], "calls": 2, "hits": 1, "blocks": 1}
+    assert data["rule_matches"] == {"slime": 1, "toy": 1}
+    assert data["rule_decisions"] == {"slime": 1}
+    assert stats.unused_rules(engine.matcher.all_labels()) == ["unused"]
+    assert "keywords" in stats.as_table()
+    assert instrumentation.current() is None
+
+
+def test_whitelisted_channel_counts_as_rule_hit():
+    engine = BlockRuleEngine(keywords=["slime"], phrases=[], block_channels=[], whitelist_channels=["Freund"],
+                             whitelist_patterns=["lernen"])
+    stats = instrumentation.enable()
+    stats.reset()
+    try:
+        assert engine.explain_block_decision("Slime lernen", "Freund").reason == "whitelisted"
+    finally:
+        instrumentation.disable()
+
+    assert stats.rule_decisions == {"freund": 1}
+    assert stats.rule_matches == {"freund": 1, "slime": 1, "lernen": 1}
+    assert stats.unused_rules(["freund", *engine.matcher.all_labels()]) == []
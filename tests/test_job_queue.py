@@ -0,0 +1,108 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException
+
+from watchangel.cleaner.cleaner import PurgeResult
+from watchangel.storage.job_queue import JobQueue
+from watchangel.watcher import job_runner
+from watchangel.watcher.job_runner import drain_jobs
+
+
+def test_enqueue_is_idempotent_per_channel(tmp_path):
+    jobs = JobQueue(tmp_path / "watchangel.db")
+
+    assert jobs.enqueue("block", "Slime TV", {"channel_url": "https://youtube.com/@slime"})
+    assert not jobs.enqueue("block", "slime tv", {"channel_url": "https://youtube.com/@slime"})
+    assert jobs.enqueue("purge", "Slime TV")
+    assert jobs.counts() == {"pending": 2}
+
+
+def test_enqueue_rejects_unknown_action(tmp_path):
+    with pytest.raises(ValueError):
+        JobQueue(tmp_path / "watchangel.db").enqueue("delete", "Slime TV")
+
+
+def test_completed_job_can_be_enqueued_again(tmp_path):
+    jobs = JobQueue(tmp_path / "watchangel.db")
+    jobs.enqueue("block", "Slime TV")
+    job = jobs.claim()
+    jobs.complete(job)
+
+    assert jobs.claim() is None
+    assert jobs.enqueue("block", "Slime TV")
+
+
+def test_fail_backs_off_exponentially_until_final(tmp_path):
+    jobs = JobQueue(tmp_path / "watchangel.db", max_attempts=2, base_delay=10)
+    jobs.enqueue("block", "Slime TV")
+
+    job = jobs.claim()
+    assert jobs.fail(job, "timeout")
+    assert jobs.claim() is None  # noch im Backoff
+    job = jobs.claim(now=time.time() + 11)
+    assert job.attempts == 1
+
+    assert not jobs.fail(job, "timeout")
+    assert jobs.claim(now=time.time() + 3600) is None
+    assert jobs.counts() == {"failed": 1}
+
+
+def test_running_jobs_resume_after_restart(tmp_path):
+    path = tmp_path / "watchangel.db"
+    jobs = JobQueue(path)
+    jobs.enqueue("hide", "Slime TV", {"channel_url": "https://youtube.com/@slime"})
+    assert jobs.claim() is not None
+    jobs.close()  # Absturz mitten im Auftrag
+
+    restarted = JobQueue(path)
+    job = restarted.claim()
+    assert (job.action, job.payload) == ("hide", {"channel_url": "https://youtube.com/@slime"})
+
+
+def test_drain_runs_channel_jobs_and_coalesces_purges(tmp_path, monkeypatch):
+    jobs = JobQueue(tmp_path / "watchangel.db")
+    jobs.enqueue("block", "Slime TV", {"channel_url": "https://youtube.com/@slime"})
+    jobs.enqueue("block", "Kaputt", {"channel_url": "https://youtube.com/@kaputt"})
+    jobs.enqueue("purge", "Slime TV")
+    jobs.enqueue("purge", "Kaputt")
+
+    block = MagicMock(side_effect=lambda driver, url: url.endswith("@slime"))
+    purge = MagicMock(return_value=PurgeResult(removed={"Slime TV": 2}, failed={"kaputt": 1}))
+    monkeypatch.setitem(job_runner.CHANNEL_ACTIONS, "block", block)
+    monkeypatch.setattr(job_runner, "purge_channels", purge)
+
+    assert drain_jobs(MagicMock(), jobs) == 2
+    assert block.call_count == 2
+    purge.assert_called_once()
+    assert sorted(purge.call_args.args[1]) == ["Kaputt", "Slime TV"]
+    # Block und Purge für "Kaputt" schlugen fehl und werden wiederholt
+    assert jobs.counts() == {"done": 2, "pending": 2}
+
+
+@pytest.mark.parametrize("action", ["block", "purge"])
+def test_dead_session_is_raised_without_burning_a_retry(tmp_path, monkeypatch, action):
+    jobs = JobQueue(tmp_path / "watchangel.db")
+    jobs.enqueue(action, "Slime TV", {"channel_url": "https://youtube.com/@slime"})
+    crash = MagicMock(side_effect=InvalidSessionIdException("invalid session id"))
+    monkeypatch.setitem(job_runner.CHANNEL_ACTIONS, "block", crash)
+    monkeypatch.setattr(job_runner, "purge_channels", crash)
+
+    with pytest.raises(InvalidSessionIdException):
+        drain_jobs(MagicMock(), jobs)
+
+    job = jobs.claim(actions=(action,))
+    assert job is not None and job.attempts == 0
+
+
+def test_prune_drops_old_finished_jobs_only(tmp_path):
+    jobs = JobQueue(tmp_path / "watchangel.db", max_attempts=1, retention_days=1)
+    for name in ("Alt", "Kaputt", "Offen"):
+        jobs.enqueue("block", name)
+    jobs.complete(jobs.claim())
+    jobs.fail(jobs.claim(), "nicht bestätigt")
+
+    assert jobs.prune() == 0
+    assert jobs.prune(now=time.time() + 2 * 86400) == 2
+    assert jobs.counts() == {"pending": 1}
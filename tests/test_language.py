@@ -0,0 +1,45 @@
+import pytest
+
+from watchangel.rules.block_rules import BlockRuleEngine
+from watchangel.rules.language import LanguageDetector, prefilter_language
+
+
+def test_prefilter_settles_obvious_scripts():
+    assert prefilter_language("ひろゆき 切り抜き 動画") == "ja"
+    assert prefilter_language("مرحبا بكم في قناتي") == "ar"
+    assert prefilter_language("Learn colors with slime") is None
+    assert prefilter_language("Wir lernen heute die Farben mit Schleim") is None
+
+
+def test_detector_caches_by_normalized_text(tmp_path):
+    detector = LanguageDetector(max_entries=2, snapshot_path=tmp_path / "lang.json")
+    text = "Wir lernen heute gemeinsam die Farben mit Schleim"
+
+    first = detector.detect(text)
+    second = detector.detect("  Wir lernen heute  gemeinsam die Farben mit Schleim ")
+
+    assert first == second
+    assert (detector.stats.misses, detector.stats.hits) == (1, 1)
+
+    detector.save()
+    restored = LanguageDetector(snapshot_path=tmp_path / "lang.json")
+    assert restored.detect(text) == first
+    assert restored.stats.hits == 1
+
+
+def test_detector_evicts_least_recently_used():
+    detector = LanguageDetector(max_entries=2)
+    for text in ("Das ist ein deutscher Satz hier", "Ceci est une phrase en français", "Esto es una frase en español"):
+        detector.detect(text)
+
+    assert len(detector) == 2
+
+
+@pytest.mark.parametrize("title", ["Aprende los colores hoy", "Vamos aprender as cores", "Impariamo i colori oggi"])
+def test_short_latin_titles_in_other_languages_are_still_flagged(title):
+    engine = BlockRuleEngine([], [], block_channels=[])
+    engine.language_detector = LanguageDetector()
+
+    assert engine.is_unsupported_language(title)
+    assert not engine.is_unsupported_language("Wir lernen die Farben")
+    assert engine.language_detector.stats.prefiltered == 0
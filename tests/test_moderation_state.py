@@ -0,0 +1,88 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from watchangel.blocker import actions
+from watchangel.storage import db
+from watchangel.storage.moderation_state import ModerationStore, get_moderation_store
+
+URL = "https://www.youtube.com/@slime"
+
+
+@pytest.fixture
+def store(tmp_path):
+    with db.use_database(tmp_path / "watchangel.db"):
+        yield get_moderation_store()
+
+
+def test_record_derives_status_and_survives_restart(tmp_path):
+    store = ModerationStore(tmp_path / "watchangel.db")
+    assert store.record(URL, hidden=True, blocked_for_kids=False).status == "partial"
+    store.record(URL + "/", blocked_for_kids=True)
+    store.close()
+
+    state = ModerationStore(tmp_path / "watchangel.db").get(URL.upper())
+    assert (state.hidden, state.blocked_for_kids, state.status) == (True, True, "done")
+
+
+def test_changed_at_only_moves_on_change(tmp_path):
+    store = ModerationStore(tmp_path / "watchangel.db")
+    first = store.record(URL, hidden=True, blocked_for_kids=True)
+    again = store.record(URL, hidden=True, blocked_for_kids=True)
+    assert again.changed_at == first.changed_at
+    assert again.checked_at >= first.checked_at
+
+
+def test_block_channel_skips_browser_for_done_channels(store):
+    store.record(URL, hidden=True, blocked_for_kids=True)
+    driver = MagicMock()
+
+    assert actions.block_channel(driver, URL)
+    driver.get.assert_not_called()
+
+
+def test_block_channel_records_menu_outcome(store, monkeypatch):
+    monkeypatch.setattr(actions, "wait_for_about_modal", lambda driver: True)
+    monkeypatch.setattr(actions, "open_report_menu", lambda driver: None)
+    monkeypatch.setattr(actions, "get_report_menu_items", lambda driver: [])
+    monkeypatch.setattr(actions, "handle_hide_user", lambda driver, item: True)
+
+    assert not actions.block_channel(MagicMock(), URL)
+    assert store.get(URL).status == "failed"
+
+
+@pytest.mark.parametrize("action", ["block_channel", "unhide_user_from_channel", "hide_user_from_channel"])
+def test_channel_actions_pass_dead_sessions_on(store, monkeypatch, action):
+    monkeypatch.setattr(actions, "wait_for_about_modal", lambda driver: True)
+
+    def crash(driver):
+        raise WebDriverException("unknown error: session deleted because of page crash")
+
+    monkeypatch.setattr(actions, "open_report_menu", crash)
+    with pytest.raises(WebDriverException):
+        getattr(actions, action)(MagicMock(), URL)
+
+    monkeypatch.setattr(actions, "open_report_menu", MagicMock(side_effect=WebDriverException("element not interactable")))
+    assert getattr(actions, action)(MagicMock(), URL) is False
+
+
+def test_unhide_skips_browser_when_already_unhidden(store):
+    store.record(URL, hidden=False, status="unhidden")
+    driver = MagicMock()
+
+    assert actions.unhide_user_from_channel(driver, URL)
+    driver.get.assert_not_called()
+
+
+def test_reverify_forces_browser_for_stale_channels(store, monkeypatch):
+    store.record(URL, hidden=True, blocked_for_kids=True)
+    forced = MagicMock(side_effect=lambda driver, url, force: store.record(url, blocked_for_kids=False))
+    monkeypatch.setattr(actions, "block_channel", forced)
+
+    assert store.due_for_reverify(max_age_days=1) == []
+    monkeypatch.setattr(time, "time", lambda: 10 ** 11)
+    assert actions.reverify_channels(MagicMock(), max_age_days=1) == 0
+    forced.assert_called_once()
+    assert store.get(URL).status == "partial"
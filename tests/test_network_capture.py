@@ -0,0 +1,79 @@
+import base64
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from watchangel.analysis.network_capture import ResponseTracker, decode_response_body, read_history_capture
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _log() -> list[dict]:
+    return json.loads((FIXTURES / "performance_log.json").read_text(encoding="utf-8"))
+
+
+def _bodies() -> dict[str, dict]:
+    html = (FIXTURES / "history_initial.html").read_text(encoding="utf-8")
+    continuation = (FIXTURES / "history_continuation.json").read_bytes()
+    return {
+        "1000.1": {"body": html, "base64Encoded": False},
+        "1000.9": {"body": base64.b64encode(continuation).decode("ascii"), "base64Encoded": True},
+    }
+
+
+def _driver(log_batches: list[list[dict]]) -> MagicMock:
+    driver = MagicMock()
+    driver.get_log.side_effect = [[], *log_batches] + [[]] * 10
+    bodies = _bodies()
+    driver.execute_cdp_cmd.side_effect = lambda cmd, params: bodies.get(params.get("requestId"))
+    driver.execute_async_script.return_value = {"items": 3, "new_items": 2, "elapsed_ms": 100, "more": True}
+    return driver
+
+
+def test_tracker_reports_finished_history_responses_only():
+    finished = ResponseTracker().feed(_log())
+
+    assert [(r.request_id, r.kind) for r in finished] == [("1000.1", "document"), ("1000.9", "browse")]
+
+
+def test_decodes_recorded_bodies():
+    bodies = _bodies()
+
+    document = decode_response_body(bodies["1000.1"], "document")
+    browse = decode_response_body(bodies["1000.9"], "browse")
+
+    assert document.continuation == "TOKEN_PAGE_2"
+    assert [v.video_id for v in browse.videos] == ["aaaaaaaaaaa", "ddddddddddd"]
+    with pytest.raises(ValueError):
+        decode_response_body({"body": "<html></html>"}, "document")
+
+
+def test_capture_streams_pages_as_they_arrive():
+    log = _log()
+    driver = _driver([log[:5], log[5:]])
+
+    videos = read_history_capture(driver)
+
+    assert [v.video_id for v in videos] == ["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc", "ddddddddddd"]
+    assert [v.index for v in videos] == [0, 1, 2, 3]
+    assert all(v.element is None for v in videos)
+    # Genau eine Nachladerunde: die zweite Seite kam über die Antwort der Seite selbst
+    assert driver.execute_async_script.call_count == 2
+
+
+def test_capture_stops_at_watermark():
+    driver = _driver([_log()])
+
+    videos = read_history_capture(driver, stop_at=("ccccccccccc",))
+
+    assert [v.video_id for v in videos] == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+
+
+def test_capture_without_any_history_data_raises():
+    driver = _driver([])
+    driver.execute_script.return_value = None
+
+    with pytest.raises(ValueError):
+        read_history_capture(driver)
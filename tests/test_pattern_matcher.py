@@ -0,0 +1,55 @@
+from watchangel.rules.block_rules import BlockRuleEngine
+from watchangel.rules.pattern_matcher import PatternMatcher
+
+
+def test_scan_finds_overlapping_patterns_in_one_pass():
+    matcher = PatternMatcher([("keywords", ["slime", "lime", "m&ms", "rainbow"])])
+    hits = matcher.scan("rainbow slime with m&ms")
+
+    assert matcher.first_match("keywords", hits) == "slime"
+    assert len(hits) == 4
+
+
+def test_first_match_respects_group_order():
+    matcher = PatternMatcher([
+        ("whitelist", ["first take"]),
+        ("keywords", ["colors", "learn colors"]),
+    ])
+    hits = matcher.scan("learn colors with the first take")
+
+    assert matcher.first_match("whitelist", hits) == "first take"
+    assert matcher.first_match("keywords", hits) == "colors"
+    assert matcher.first_match("phrases", hits) is None
+
+
+def test_word_and_regex_entries():
+    matcher = PatternMatcher([("keywords", ["word:toy", r"re:\bepisode \d+\b"])])
+
+    assert matcher.first_match("keywords", matcher.scan("new toy unboxing")) == "word:toy"
+    assert matcher.first_match("keywords", matcher.scan("toys everywhere")) is None
+    assert matcher.first_match("keywords", matcher.scan("Episode 12 ist da")) == r"re:\bepisode \d+\b"
+
+
+def test_invalid_regex_is_skipped_with_warning(capsys):
+    matcher = PatternMatcher([("keywords", ["re:(unclosed", "slime", r"re:\bepisode \d+\b"])])
+
+    assert "Ungültiger regulärer Ausdruck" in capsys.readouterr().out
+    assert matcher.all_labels() == ["slime", r"re:\bepisode \d+\b"]
+    assert matcher.first_match("keywords", matcher.scan("episode 3 slime")) == "slime"
+    assert matcher.first_match("keywords", matcher.scan("episode 3")) == r"re:\bepisode \d+\b"
+    assert BlockRuleEngine(keywords=["re:[kaputt"], phrases=[], block_channels=[]).explain_block_decision(
+        "Hallo", "Kanal").block is False
+
+
+def test_engine_reasons_match_substring_semantics():
+    engine = BlockRuleEngine(
+        keywords=["Slime", "crushing"],
+        phrases=["Learn Colors"],
+        block_channels=[],
+        whitelist_patterns=["yoasobi"],
+    )
+
+    assert engine.explain_block_decision("YOASOBI slime", "Some Channel").reason == "whitelisted pattern: yoasobi"
+    assert engine.explain_block_decision("Crushing slime", "Kanal").reason == "matched keyword: slime"
+    assert engine.explain_block_decision("learn colors!", "Kanal").reason == "matched phrase: learn colors"
+    assert engine.explain_block_decision("Guten Morgen", "Kanal").block is False
@@ -0,0 +1,95 @@
+import json
+import shutil
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from watchangel.cleaner.removal_engine import REMOVE_BATCH_JS, REMOVE_BUTTON_SELECTOR, RemovalConfig, RemovalEngine
+from watchangel.model.scanned_video import ScannedVideo
+
+
+def _video(video_id, element=True):
+    return ScannedVideo(title=video_id, channel_name="Kanal", channel_url="", video_id=video_id,
+                        element=MagicMock(name=video_id) if element else None)
+
+
+def test_batches_and_retries_only_failed(monkeypatch):
+    monkeypatch.setattr("watchangel.cleaner.removal_engine.time.sleep", lambda _: None)
+    driver = MagicMock()
+    driver.execute_async_script.side_effect = [
+        ["removed", "timeout"],
+        ["removed", "no_button"],
+        ["removed", "removed"],
+    ]
+    videos = [_video("a"), _video("b"), _video("c"), _video("d"), _video("e", element=False)]
+
+    report = RemovalEngine(driver, RemovalConfig(batch_size=2, max_retries=1)).remove(videos)
+
+    batches = [[el._mock_name for el in call.args[1]] for call in driver.execute_async_script.call_args_list]
+    assert batches == [["a", "b"], ["c", "d"], ["b", "d"]]
+    # Im Wiederholungslauf: "b" wurde geklickt (timeout), "d" hatte keinen Button
+    assert [call.args[2] for call in driver.execute_async_script.call_args_list] == [
+        [False, False], [False, False], [True, False],
+    ]
+    assert {o.video.video_id: (o.status, o.attempts) for o in report.outcomes} == {
+        "a": ("removed", 1), "b": ("removed", 2), "c": ("removed", 1), "d": ("removed", 2),
+        "e": ("no_element", 0),
+    }
+    assert len(report.removed) == 4 and len(report.failed) == 1
+
+
+def test_gives_up_after_max_retries(monkeypatch):
+    monkeypatch.setattr("watchangel.cleaner.removal_engine.time.sleep", lambda _: None)
+    driver = MagicMock()
+    driver.execute_async_script.return_value = ["timeout"]
+
+    report = RemovalEngine(driver, RemovalConfig(max_retries=2)).remove([_video("a")])
+
+    assert driver.execute_async_script.call_count == 3
+    assert report.outcomes[0].status == "timeout"
+    assert report.items_per_second == 0.0
+
+
+def test_unclicked_entry_that_leaves_the_dom_is_not_counted(monkeypatch):
+    monkeypatch.setattr("watchangel.cleaner.removal_engine.time.sleep", lambda _: None)
+    driver = MagicMock()
+    driver.execute_async_script.side_effect = [["no_button"], ["detached"]]
+
+    report = RemovalEngine(driver, RemovalConfig(max_retries=1)).remove([_video("a")])
+
+    assert [call.args[2] for call in driver.execute_async_script.call_args_list] == [[False], [False]]
+    assert report.outcomes[0].clicked is False
+    assert report.removed == []
+
+
+# Führt REMOVE_BATCH_JS in Node aus; Knoten: verborgen (offsetParent null), optional mit Button,
+# der den Knoten beim Klick aus dem DOM nimmt, optional schon getrennt.
+_NODE_HARNESS = """
+const [script, specs, clickedBefore, selector] = JSON.parse(process.argv[1]);
+const nodes = specs.map((spec) => {
+    const node = {isConnected: spec.connected, offsetParent: null, hasAttribute: () => false};
+    node.querySelector = (sel) => (spec.button && sel === selector)
+        ? {click: () => { node.isConnected = false; }} : null;
+    return node;
+});
+new Function(script).apply(null, [nodes, clickedBefore, 0, 200, selector, (statuses) => {
+    console.log(JSON.stringify(statuses));
+    process.exit(0);
+}]);
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node nicht installiert")
+def test_hidden_unclicked_nodes_are_not_reported_as_removed():
+    specs = [
+        {"connected": True, "button": True},    # verborgen, wird geklickt und verschwindet
+        {"connected": True, "button": False},   # verborgen, ohne Button
+        {"connected": False, "button": True},   # in einem früheren Versuch geklickt und entfernt
+        {"connected": False, "button": True},   # nie geklickt, inzwischen neu gerendert
+    ]
+    args = [REMOVE_BATCH_JS, specs, [False, False, True, False], REMOVE_BUTTON_SELECTOR]
+    output = subprocess.run(["node", "-e", _NODE_HARNESS, json.dumps(args)],
+                            capture_output=True, text=True, timeout=30, check=True).stdout
+
+    assert json.loads(output) == ["removed", "no_button", "removed", "detached"]
@@ -0,0 +1,100 @@
+import time
+from dataclasses import replace
+
+import pytest
+from selenium.webdriver.common.by import By
+
+import watchangel.globals as app_globals
+from benchmarks.replay_driver import ReplayConfig, ReplayDriver, load_history_snapshot, select, synthetic_history
+from watchangel.analysis.scanner import scan_watch_history
+from watchangel.blocker import actions, ui_navigation
+from watchangel.cleaner import cleaner
+from watchangel.cleaner.removal_engine import REMOVE_BUTTON_SELECTOR, RemovalConfig, RemovalEngine
+from watchangel.rules.block_rules import BlockRuleEngine
+from watchangel.utils.scrolling import AdaptiveScroller
+from watchangel.storage import db
+from watchangel.storage.moderation_state import get_moderation_store
+
+FAST = ReplayConfig(command_latency=0, page_load=0, scroll_load=0, click_latency=0, page_size=10)
+
+
+def _history(size: int = 35):
+    return synthetic_history(size, load_history_snapshot())
+
+
+def test_snapshot_and_synthetic_history_have_unique_ids():
+    templates = load_history_snapshot()
+    history = synthetic_history(50, templates)
+
+    assert templates[0].channel_name == "Slime TV"
+    assert len({entry.video_id for entry in history}) == 50
+    assert history[len(templates)].channel_name == "Slime TV 1"
+
+
+@pytest.mark.parametrize("reader", ["dom", "data"])
+def test_scan_reads_whole_replayed_history(reader, monkeypatch):
+    monkeypatch.setattr(app_globals, "READER_MODE", reader)
+    history = _history()
+
+    videos = scan_watch_history(ReplayDriver(history, FAST))
+
+    assert [video.video_id for video in videos] == [entry.video_id for entry in history]
+
+
+def test_removal_engine_removes_from_replayed_history():
+    driver = ReplayDriver(_history(), FAST)
+    driver.get("https://www.youtube.com/feed/history")
+    videos = scan_watch_history(driver)[:4]
+
+    report = RemovalEngine(driver, RemovalConfig(click_interval=0, batch_delay=0)).remove(videos)
+
+    assert len(report.removed) == 4
+    assert len(driver.history) == 31
+
+
+def test_wait_ready_returns_at_once_on_rendered_history():
+    driver = ReplayDriver(_history(), FAST)
+    driver.get("https://www.youtube.com/feed/history")
+
+    started = time.perf_counter()
+    assert AdaptiveScroller(driver, hard_timeout=5.0).wait_ready() == 10
+    assert time.perf_counter() - started < 1.0
+
+
+def test_purge_removes_every_entry_of_the_channel(monkeypatch):
+    monkeypatch.setattr(cleaner, "get_log_rules", lambda: BlockRuleEngine([], [], block_channels=[]))
+    history = _history(20)
+    # Erneut angesehen: derselbe Eintrag steht ein zweites Mal weiter unten im Verlauf
+    history.append(replace(history[0]))
+    driver = ReplayDriver(history, FAST)
+    target = history[0].channel_name
+    expected = sum(entry.channel_name == target for entry in history)
+
+    result = cleaner.purge_channels(driver, [target], RemovalConfig(click_interval=0, batch_delay=0))
+
+    assert expected == 2
+    assert result.removed == {target: expected} and not result.failed
+    assert len(driver.history) == len(history) - expected
+    assert all(entry.channel_name != target for entry in driver.history)
+    assert all(node.find_elements(By.CSS_SELECTOR, REMOVE_BUTTON_SELECTOR) for node in driver.rendered)
+
+
+def test_selector_subset_matches_about_snapshot():
+    driver = ReplayDriver([], FAST)
+    driver.get("https://www.youtube.com/@slimetv/about")
+
+    assert len(select(driver.document, "tp-yt-paper-item")) == 3
+    button = driver.find_element(By.CSS_SELECTOR, "#confirm-button button[aria-label='Continue']")
+    assert button.text == ""  # Dialog noch verborgen
+    assert not button.is_displayed()
+
+
+def test_block_channel_runs_full_menu_flow(tmp_path, monkeypatch):
+    monkeypatch.setattr(actions.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(ui_navigation.time, "sleep", lambda seconds: None)
+    driver = ReplayDriver([], FAST)
+
+    with db.use_database(tmp_path / "watchangel.db"):
+        assert actions.block_channel(driver, "https://www.youtube.com/@slimetv")
+        assert get_moderation_store().get("https://www.youtube.com/@slimetv").done
+    assert driver.visited == ["https://www.youtube.com/@slimetv/about"]
@@ -0,0 +1,39 @@
+import json
+
+from benchmarks.rule_engine import Scenario, compare_reports, make_corpus, make_rules, run_benchmarks
+
+TINY = Scenario("tiny", corpus=300, distinct=60, keywords=30, whitelist=10, blocklist=500)
+
+
+def test_corpus_is_reproducible_and_multilingual():
+    rules = make_rules(TINY, seed=7)
+    corpus = make_corpus(TINY, rules, seed=7)
+    titles = " ".join(video.title for video in corpus)
+
+    assert [v.title for v in corpus] == [v.title for v in make_corpus(TINY, make_rules(TINY, seed=7), seed=7)]
+    assert len({video.video_id for video in corpus}) == TINY.corpus
+    assert len({video.title for video in corpus}) <= TINY.distinct
+    assert any("؀" <= ch <= "ۿ" for ch in titles)  # Arabisch
+    assert any("一" <= ch <= "鿿" for ch in titles)  # Han
+    assert any(ord(ch) >= 0x1F300 for ch in titles)  # Emoji
+    assert any(video.channel_name.startswith("Kanal ") for video in corpus)
+
+
+def test_compiled_scenario_reports_all_stages_as_json(tmp_path):
+    report = run_benchmarks([Scenario("tiny", 200, 40, 30, 10, 500, compiled=True)], seed=1, sample=50)
+
+    result = report["results"][0]
+    stages = {stage["name"]: stage for stage in result["stages"]}
+    assert {"compile_blocklist", "build", "explain_block_decision", "match_video",
+            "match_video[cache warm]"} <= set(stages)
+    explain = stages["explain_block_decision"]
+    assert explain["calls"] == 200
+    assert 0 < explain["p50_us"] <= explain["p99_us"]
+    assert explain["peak_kib"] > 0
+    assert "keywords" in result["rule_stages"]
+    assert result["decisions"]["explicitly blocked channel"] > 0
+    json.dumps(report)
+
+    compared = compare_reports(report, report)
+    assert len(compared) == len(stages)
+    assert all("1.00x" in line for line in compared)
@@ -0,0 +1,35 @@
+from watchangel.rules.block_rules import BlockRuleEngine
+from watchangel.rules.scripts import parse_script_rules, script_profile
+
+
+def test_profile_counts_letters_per_script():
+    profile = script_profile("Привет мир – Hello 123 🎉 東京ひろゆき")
+
+    assert profile.counts == {"cyrillic": 9, "latin": 5, "han": 2, "kana": 4}
+    assert profile.letters == 20
+    assert profile.share("cjk") == 6 / 20
+    assert profile.dominant() == "cyrillic"
+
+
+def test_parse_script_rules_skips_invalid_lines():
+    assert parse_script_rules(["arabic: 0.5", "CJK:0.8", "klingon: 0.2", "thai"]) == {"arabic": 0.5, "cjk": 0.8}
+
+
+def test_engine_blocks_by_script_share():
+    engine = BlockRuleEngine(keywords=[], phrases=[], block_channels=[], script_rules={"cyrillic": 0.5})
+
+    assert engine.explain_block_decision("Привет", "Kanal").reason == "cyrillic title"
+    assert engine.explain_block_decision("Hello", "Мир Канал TV").reason == "cyrillic channel name"
+    assert engine.explain_block_decision("Hallo Welt", "Kanal").block is False
+    assert engine.is_arabic("Kanal مرحبا")
+
+
+def test_bom_and_arabic_digits_are_not_arabic_letters():
+    engine = BlockRuleEngine(keywords=[], phrases=[], block_channels=[], script_rules={"arabic": 0.0})
+
+    assert script_profile("﻿Peppa Pig Folge 1").counts == {"latin": 13}
+    assert script_profile("Folge ١٢٣").counts == {"latin": 5}
+    bom = engine.explain_block_decision("﻿Peppa Pig Folge 1", "Kanal")
+    assert bom == engine.explain_block_decision("Peppa Pig Folge 1", "Kanal")
+    assert bom.reason != "arabic title"
+    assert engine.explain_block_decision("مرحبا Peppa", "Kanal").reason == "arabic title"
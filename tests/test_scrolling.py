@@ -0,0 +1,95 @@
+import json
+import shutil
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from watchangel.utils.scrolling import SCROLL_AND_WAIT_JS, AdaptiveScroller
+
+
+def _driver(results):
+    driver = MagicMock()
+    driver.execute_async_script.side_effect = results
+    return driver
+
+
+def _result(new_items, elapsed_ms, more=True):
+    return {"new_items": new_items, "items": 0, "more": more, "elapsed_ms": elapsed_ms}
+
+
+def test_timeout_adapts_to_observed_load_times():
+    driver = _driver([_result(20, 200), _result(20, 200), _result(0, 600), _result(20, 300)])
+    scroller = AdaptiveScroller(driver, hard_timeout=10.0, slack=3.0, smoothing=0.5)
+
+    assert scroller.current_timeout() == 10.0
+    scroller.step()
+    assert abs(scroller.current_timeout() - 0.6) < 1e-9
+    scroller.step()
+    scroller.step()
+    # Nach einer leeren Runde wird mit vollem Timeout erneut gewartet
+    assert scroller.current_timeout() == 10.0
+    scroller.step()
+
+    timeouts = [call.args[3] for call in driver.execute_async_script.call_args_list]
+    assert timeouts == [10000, 600, 600, 10000]
+    assert scroller.stats.items == 60 and scroller.stats.rounds == 4
+
+
+# Führt SCROLL_AND_WAIT_JS in Node gegen ein minimales DOM aus; nach ``change_after_ms``
+# ändern sich Einträge/Spinner und der MutationObserver wird ausgelöst.
+_NODE_HARNESS = """
+const [script, tag, doScroll, timeoutMs, initial, later, changeAfterMs] = JSON.parse(process.argv[1]);
+const state = {...initial};
+const observers = [];
+const collection = (key) => ({get length() { return state[key]; }});
+globalThis.document = {
+    getElementsByTagName: (name) => collection(name === tag ? 'items' : 'spinners'),
+    documentElement: {scrollHeight: 1000},
+};
+globalThis.window = {scrollTo() {}};
+globalThis.MutationObserver = class {
+    constructor(callback) { observers.push(callback); }
+    observe() {}
+    disconnect() {}
+};
+if (later) setTimeout(() => { Object.assign(state, later); observers.forEach((cb) => cb()); }, changeAfterMs);
+new Function(script).apply(null, [tag, doScroll, timeoutMs, (result) => {
+    console.log(JSON.stringify(result));
+    process.exit(0);
+}]);
+"""
+
+
+def _run_in_node(do_scroll, initial, later=None, change_after_ms=0, timeout_ms=3000):
+    args = [SCROLL_AND_WAIT_JS, "ytd-video-renderer", do_scroll, timeout_ms, initial, later, change_after_ms]
+    output = subprocess.run(["node", "-e", _NODE_HARNESS, json.dumps(args)],
+                            capture_output=True, text=True, timeout=30, check=True).stdout
+    return json.loads(output)
+
+
+needs_node = pytest.mark.skipif(shutil.which("node") is None, reason="node nicht installiert")
+
+
+@needs_node
+def test_wait_ready_returns_at_once_on_rendered_page_with_spinner():
+    result = _run_in_node(False, {"items": 20, "spinners": 1})
+
+    assert result["items"] == 20 and result["more"] is True
+    assert result["elapsed_ms"] < 500
+
+
+@needs_node
+def test_wait_ready_waits_for_first_entries():
+    result = _run_in_node(False, {"items": 0, "spinners": 0}, later={"items": 3}, change_after_ms=100)
+
+    assert result["new_items"] == 3
+    assert 50 < result["elapsed_ms"] < 1500
+
+
+@needs_node
+def test_scroll_step_still_waits_for_new_entries():
+    result = _run_in_node(True, {"items": 20, "spinners": 1}, later={"items": 40}, change_after_ms=150)
+
+    assert result["new_items"] == 20
+    assert result["elapsed_ms"] > 100
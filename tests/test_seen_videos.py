@@ -0,0 +1,38 @@
+import time
+
+from watchangel.storage.seen_videos import DAY, SeenVideoSet
+
+
+def test_lru_is_bounded_and_refreshes_on_add(tmp_path):
+    seen = SeenVideoSet(tmp_path / "watchangel.db", max_entries=3)
+    for video_id in ("a", "b", "c"):
+        seen.add(video_id)
+    seen.add("a")
+    seen.add("d")
+
+    assert len(seen) == 3
+    assert "b" not in seen
+    assert all(video_id in seen for video_id in ("a", "c", "d"))
+
+
+def test_persists_across_restart_with_limits(tmp_path):
+    path = tmp_path / "watchangel.db"
+    seen = SeenVideoSet(path, max_entries=2)
+    for video_id in ("a", "b", "c"):
+        seen.add(video_id)
+    seen.close()
+
+    restored = SeenVideoSet(path, max_entries=2)
+    assert len(restored) == 2
+    assert "a" not in restored and "c" in restored
+
+
+def test_flushes_automatically_and_drops_expired(tmp_path):
+    path = tmp_path / "watchangel.db"
+    seen = SeenVideoSet(path, flush_every=2, max_age_days=1)
+    seen.add("alt")
+    seen._entries["alt"] = seen._dirty["alt"] = time.time() - 2 * DAY
+    seen.add("neu")
+
+    assert "alt" not in seen
+    assert "neu" in SeenVideoSet(path, max_age_days=1)
@@ -0,0 +1,51 @@
+import sqlite3
+
+import pytest
+
+from watchangel.storage import channel_store, db, decision_cache, job_queue, moderation_state, seen_videos, watermark
+
+GETTERS = (
+    channel_store.get_channel_store,
+    decision_cache.get_decision_cache,
+    job_queue.get_job_queue,
+    moderation_state.get_moderation_store,
+    seen_videos.get_seen_videos,
+    watermark.get_watermark_store,
+)
+
+
+def test_use_database_redirects_every_shared_store(tmp_path):
+    path = tmp_path / "watchangel.db"
+    with db.use_database(path):
+        stores = [get() for get in GETTERS]
+        assert [get() for get in GETTERS] == stores
+        assert all(store.path == path for store in stores)
+        assert db.connect(path).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    with db.use_database(tmp_path / "other.db"):
+        assert all(get() is not store for get, store in zip(GETTERS, stores))
+
+
+def test_use_database_closes_its_stores_and_restores_the_previous_ones(tmp_path):
+    mark = watermark.HistoryWatermark(("a",), 1.0)
+    with db.use_database(tmp_path / "outer.db"):
+        outer = watermark.get_watermark_store()
+        with db.use_database(tmp_path / "inner.db"):
+            inner = watermark.get_watermark_store()
+            inner.save("history", mark)
+        assert watermark.get_watermark_store() is outer
+        assert outer.load("history") == watermark.HistoryWatermark()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        inner.load("history")
+    assert watermark.WatermarkStore(tmp_path / "inner.db").load("history") == mark
+
+
+def test_redirected_channel_store_leaves_the_legacy_log_alone(tmp_path, monkeypatch):
+    legacy = tmp_path / "blocked_channels.log"
+    legacy.write_text('{"channel_name": "Slime TV"}\n', encoding="utf-8")
+    monkeypatch.setattr(channel_store, "log_path", legacy)
+
+    with db.use_database(tmp_path / "watchangel.db"):
+        assert len(channel_store.get_channel_store()) == 0
+    assert legacy.exists()
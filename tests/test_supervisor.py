@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+
+from watchangel.browser.supervisor import BrowserSupervisor, SupervisorLimits, is_dead_session, measure_memory
+
+
+def _fake_proc(root, pid, ppid, rss_pages, cmdline):
+    entry = root / str(pid)
+    entry.mkdir()
+    (entry / "stat").write_text(f"{pid} (chrome (x)) S {ppid} 0 0")
+    (entry / "statm").write_text(f"1000 {rss_pages} 0")
+    (entry / "cmdline").write_bytes(cmdline)
+
+
+def test_measure_memory_sums_descendants_by_type(tmp_path):
+    _fake_proc(tmp_path, 10, 1, 256, b"chromedriver\0")
+    _fake_proc(tmp_path, 11, 10, 256, b"chrome\0")
+    _fake_proc(tmp_path, 12, 11, 512, b"chrome\0--type=renderer\0")
+    _fake_proc(tmp_path, 13, 1, 9999, b"other\0")
+
+    memory = measure_memory(10, tmp_path)
+
+    assert memory.processes == 2
+    assert memory.renderer_mb == pytest.approx(512 * memory.browser_mb / 256)
+    assert memory.renderer_mb > memory.browser_mb > 0
+
+
+def test_dead_session_detection():
+    assert is_dead_session(InvalidSessionIdException("weg"))
+    assert is_dead_session(WebDriverException("unknown error: session deleted because of page crash"))
+    assert is_dead_session(ConnectionRefusedError())
+    assert not is_dead_session(WebDriverException("element not interactable"))
+    assert not is_dead_session(ValueError("kaputt"))
+
+
+def test_run_recovers_dead_session_and_resumes_task(tmp_path):
+    drivers = [MagicMock(), MagicMock()]
+    supervisor = BrowserSupervisor(lambda: drivers.pop(0), proc_root=tmp_path)
+    calls = []
+
+    def task(driver):
+        calls.append(driver)
+        if len(calls) == 1:
+            raise InvalidSessionIdException("invalid session id")
+        return "ok"
+
+    assert supervisor.run(task) == "ok"
+    assert calls[0] is not calls[1]
+    calls[0].quit.assert_called_once()
+    assert supervisor.recycles == 1
+
+
+def test_run_reraises_ordinary_errors(tmp_path):
+    supervisor = BrowserSupervisor(MagicMock, proc_root=tmp_path)
+
+    with pytest.raises(ValueError):
+        supervisor.run(lambda driver: (_ for _ in ()).throw(ValueError("kaputt")))
+    assert supervisor.recycles == 0
+
+
+def test_slow_session_is_recycled(tmp_path, monkeypatch):
+    supervisor = BrowserSupervisor(MagicMock, SupervisorLimits(max_latency=0.5, latency_window=2),
+                                   proc_root=tmp_path)
+    ticks = iter([0.0, 1.0, 2.0, 3.0])
+    monkeypatch.setattr("watchangel.browser.supervisor.time.perf_counter", lambda: next(ticks))
+
+    first = supervisor.driver
+    supervisor.run(lambda driver: None)
+    assert supervisor.driver is first
+    supervisor.run(lambda driver: None)
+
+    first.quit.assert_called_once()
+    assert supervisor.recycles == 1
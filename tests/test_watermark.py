@@ -0,0 +1,126 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from watchangel.analysis.extractor import EXTRACT_HISTORY_JS, INDEX_ATTRIBUTE, extract_until_mark
+from watchangel.analysis.history_data import read_history_data
+from watchangel.storage.watermark import HistoryWatermark, MarkMatcher, WatermarkStore
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_watermark_survives_restart(tmp_path):
+    store = WatermarkStore(tmp_path / "watchangel.db")
+    mark = HistoryWatermark().advance(["c", "b", "a"], depth=2)
+    store.save("watch_loop", mark)
+    store.close()
+
+    restored = WatermarkStore(tmp_path / "watchangel.db").load("watch_loop")
+    assert restored.video_ids == ("c", "b")
+    assert restored.updated_at == mark.updated_at
+
+
+def test_advance_keeps_newest_ids_first():
+    mark = HistoryWatermark(("b", "a"), 1.0).advance(["d", "c", "b"], depth=3)
+    assert mark.video_ids == ("d", "c", "b")
+    assert mark.updated_at > 1.0
+
+
+def test_missing_watermark_is_empty(tmp_path):
+    assert WatermarkStore(tmp_path / "watchangel.db").load("unbekannt") == HistoryWatermark()
+
+
+def test_dom_extraction_stops_at_mark():
+    driver = MagicMock()
+    driver.execute_script.return_value = {"entries": [], "reached": True}
+
+    videos, reached = extract_until_mark(driver, ("top",))
+
+    assert (videos, reached) == ([], True)
+    assert driver.execute_script.call_args.args[4] == ["top"]
+
+
+def test_data_reader_stops_at_mark_without_continuation():
+    driver = MagicMock()
+    driver.execute_script.return_value = None
+    driver.page_source = (FIXTURES / "history_initial.html").read_text(encoding="utf-8")
+
+    videos = read_history_data(driver, stop_at=("bbbbbbbbbbb",))
+
+    assert [v.video_id for v in videos] == ["aaaaaaaaaaa"]
+    driver.execute_async_script.assert_not_called()
+
+
+def _feed(mark, ids, finish=False):
+    matcher = MarkMatcher(mark)
+    out = [video.video_id for video_id in ids for video in matcher.feed(SimpleNamespace(video_id=video_id))]
+    if finish:
+        matcher.finish()
+    return out, matcher.reached
+
+
+def test_rewatched_marked_video_does_not_hide_newer_entries():
+    # "m3" wurde erneut angesehen und steht jetzt über dem neuen Video "y"
+    assert _feed(("m0", "m1", "m3"), ["x", "m3", "y", "m0", "m1", "alt"]) == (["x", "m3", "y"], True)
+
+
+def test_mark_needs_two_consecutive_hits_unless_single_or_last():
+    assert _feed(("m0", "m1"), ["m0", "m1"]) == ([], True)
+    assert _feed(("m0",), ["x", "m0", "y"]) == (["x"], True)
+    assert _feed(("m0", "m1"), ["x", "m0"]) == (["x"], False)
+    assert _feed(("m0", "m1"), ["x", "m0"], finish=True) == (["x"], True)
+
+
+def test_data_reader_reads_past_rewatched_mark():
+    driver = MagicMock()
+    driver.execute_script.return_value = None
+    driver.page_source = (FIXTURES / "history_initial.html").read_text(encoding="utf-8")
+    continuation = (FIXTURES / "history_continuation.json").read_text(encoding="utf-8")
+    driver.execute_async_script.return_value = {"status": 200, "body": continuation}
+
+    # "aaaaaaaaaaa" oben ist erneut angesehen; die Marke sitzt bei "ccccccccccc" + "aaaaaaaaaaa" (Seite 2)
+    videos = read_history_data(driver, stop_at=("aaaaaaaaaaa", "ccccccccccc"))
+
+    assert [v.video_id for v in videos] == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+    assert driver.execute_async_script.call_count == 1
+
+
+# Führt EXTRACT_HISTORY_JS in Node über Verlaufsknoten mit den gegebenen Video-IDs aus
+_NODE_HARNESS = """
+const [script, ids, attr, stopAt] = JSON.parse(process.argv[1]);
+globalThis.location = {href: 'https://www.youtube.com/feed/history'};
+globalThis.window = {};
+const nodes = ids.map((id) => {
+    const attrs = {};
+    const parts = {
+        '#video-title': {textContent: 'Titel ' + id, href: '/watch?v=' + id},
+        'ytd-channel-name a, #channel-name a': {textContent: 'Kanal', href: '/@kanal'},
+        'a#thumbnail[href*="watch?v="]': {href: '/watch?v=' + id},
+    };
+    return {
+        querySelector: (selector) => parts[selector] || null,
+        getAttribute: (name) => (name in attrs ? attrs[name] : null),
+        setAttribute: (name, value) => { attrs[name] = value; },
+    };
+});
+const result = new Function(script).apply(null, [nodes, attr, false, stopAt]);
+console.log(JSON.stringify({ids: result.entries.map((e) => e.video_id), reached: result.reached}));
+"""
+
+
+@pytest.mark.parametrize("ids, expected", [
+    (["x", "m3", "y", "m0", "m1"], {"ids": ["x", "m3", "y"], "reached": True}),
+    (["x", "m0"], {"ids": ["x"], "reached": False}),
+])
+@pytest.mark.skipif(shutil.which("node") is None, reason="node nicht installiert")
+def test_dom_extraction_script_applies_mark_rule(ids, expected):
+    args = [EXTRACT_HISTORY_JS, ids, INDEX_ATTRIBUTE, ["m0", "m1", "m3"]]
+    output = subprocess.run(["node", "-e", _NODE_HARNESS, json.dumps(args)],
+                            capture_output=True, text=True, timeout=30, check=True).stdout
+
+    assert json.loads(output) == expected
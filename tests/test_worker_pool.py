@@ -0,0 +1,66 @@
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from watchangel.blocker import worker_pool
+from watchangel.blocker.worker_pool import BlockingPool, ChannelJob, cloned_profile_factory
+
+
+def test_jobs_are_spread_across_workers(monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+    calls = []
+
+    def fake_block(driver, url):
+        calls.append((driver.name, url))
+        if len(calls) <= 2:
+            barrier.wait()  # beide Worker arbeiten gleichzeitig
+        return url != "https://www.youtube.com/@kaputt"
+
+    monkeypatch.setitem(worker_pool.JOB_ACTIONS, "block", fake_block)
+    drivers = {}
+
+    def factory(worker):
+        drivers[worker] = MagicMock(name=f"driver-{worker}")
+        drivers[worker].name = worker
+        return drivers[worker]
+
+    urls = ["https://www.youtube.com/@a", "https://www.youtube.com/@b", "https://www.youtube.com/@kaputt"]
+    report = BlockingPool(factory, workers=2).run(ChannelJob("block", url) for url in urls)
+
+    assert sorted(url for _, url in calls) == sorted(urls)
+    assert {worker for worker, _ in calls} == {0, 1}
+    assert len(report.succeeded) == 2
+    assert [stats.worker for stats in report.workers] == [0, 1]
+    assert sum(stats.done + stats.failed for stats in report.workers) == 3
+    assert all(driver.quit.called for driver in drivers.values())
+
+
+def test_unknown_action_fails_without_crashing():
+    report = BlockingPool(lambda worker: MagicMock(), workers=3).run([ChannelJob("explode", "u")])
+    assert len(report.workers) == 1
+    assert report.results[0].ok is False and "unbekannte Aktion" in report.results[0].error
+
+
+def test_profile_clones_live_in_temp_and_are_removed_after_the_run(tmp_path, monkeypatch):
+    monkeypatch.setitem(worker_pool.JOB_ACTIONS, "block", lambda driver, url: True)
+    profile = tmp_path / "profile"
+    (profile / "Default").mkdir(parents=True)
+    (profile / "Default" / "Cookies").write_text("login")
+    (profile / "SingletonLock").write_text("")
+    clones = []
+
+    def create_driver(clone):
+        assert (clone / "Default" / "Cookies").read_text() == "login"
+        assert not (clone / "SingletonLock").exists()
+        clones.append(clone)
+        return MagicMock()
+
+    report = BlockingPool(cloned_profile_factory(profile, create_driver), workers=2).run(
+        ChannelJob("block", url) for url in ("a", "b"))
+
+    assert len(report.succeeded) == 2
+    assert len(clones) == 2
+    assert all(Path(tempfile.gettempdir()) in clone.parents for clone in clones)
+    assert not any(clone.exists() or clone.parent.exists() for clone in clones)
+    assert profile.exists() and not list(tmp_path.glob("profile-worker-*"))
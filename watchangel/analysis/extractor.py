@@ -0,0 +1,148 @@
+from typing import Optional, Sequence, Union
+from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from watchangel.model.scanned_video import ScannedVideo
+
+# Stabile Nummer je Verlaufs-Knoten, bleibt über Scroll-Runden hinweg am Element
+INDEX_ATTRIBUTE = "data-watchangel-index"
+
+# Liest alle (oder die übergebenen) Verlaufseinträge in einem einzigen WebDriver-Aufruf aus.
+# DOM-Knoten im Rückgabewert kommen bei Selenium als WebElement an – ohne weitere Round Trips.
+# Mit onlyNew werden nur Knoten ohne Nummer gelesen, also seit dem letzten Aufruf hinzugekommene;
+# unvollständig gerenderte Knoten bleiben ohne Nummer und werden beim nächsten Aufruf erneut versucht.
+# Mit stopAt endet die Auswertung an der Verlaufsmarke: an einem markierten Video, auf das direkt
+# ein weiteres markiertes folgt (bei nur einer Marken-ID am ersten Treffer). Ein einzelner Treffer ist
+# ein erneut angesehenes Video und zählt zu den neuen Einträgen; steht er als letzter Knoten auf der
+# Seite, bleibt er offen (reached = false), bis nachgeladen wurde.
+EXTRACT_HISTORY_JS = """
+const attr = arguments[1];
+const onlyNew = arguments[2];
+const stopAt = arguments[3] ? new Set(arguments[3]) : null;
+let reached = false;
+const nodes = arguments[0]
+    || document.querySelectorAll(onlyNew ? `ytd-video-renderer:not([${attr}])` : 'ytd-video-renderer');
+let next = window.__watchangelNextIndex || 0;
+const clean = (s) => (s || '').replace(/\\s+/g, ' ').trim();
+const videoIdOf = (node) => {
+    const link = node.querySelector('a#thumbnail[href*="watch?v="]') || node.querySelector('#video-title');
+    try {
+        return new URL(link.href, location.href).searchParams.get('v') || '';
+    } catch (e) {
+        return '';
+    }
+};
+const entries = [];
+for (let i = 0; i < nodes.length; i++) {
+    const node = nodes[i];
+    const titleEl = node.querySelector('#video-title');
+    const channelEl = node.querySelector('ytd-channel-name a, #channel-name a');
+    const videoId = videoIdOf(node);
+    if (stopAt && stopAt.has(videoId)) {
+        if (stopAt.size === 1 || (i + 1 < nodes.length && stopAt.has(videoIdOf(nodes[i + 1])))) {
+            reached = true;
+            break;
+        }
+        if (i + 1 >= nodes.length) break;
+    }
+    if (!titleEl || !channelEl || !videoId) continue;
+    let index = node.getAttribute(attr);
+    if (index === null) {
+        index = String(next++);
+        node.setAttribute(attr, index);
+    }
+    entries.push({
+        index: Number(index),
+        title: clean(titleEl.textContent),
+        video_id: videoId,
+        channel_name: clean(channelEl.textContent),
+        channel_url: channelEl.href || '',
+        element: node,
+    });
+}
+window.__watchangelNextIndex = next;
+return stopAt ? {entries, reached} : entries;
+"""
+
+
+def extract_history_entries(
+        driver: WebDriver,
+        elements: Optional[Sequence[WebElement]] = None,
+        only_new: bool = False,
+) -> list[ScannedVideo]:
+    """
+    Extrahiert Titel, Video-ID, Kanal und DOM-Referenz aller Verlaufseinträge in einem Aufruf.
+
+    Einträge ohne Titel, Kanal oder Video-ID werden übersprungen.
+
+    :param driver: Aktiver WebDriver
+    :param elements: Nur diese ``ytd-video-renderer`` auslesen (Standard: alle auf der Seite)
+    :param only_new: Nur Einträge, die bei keinem früheren Aufruf zurückgegeben wurden
+    :return: ScannedVideo je Eintrag in Seitenreihenfolge
+    """
+    raw = driver.execute_script(
+        EXTRACT_HISTORY_JS, list(elements) if elements is not None else None, INDEX_ATTRIBUTE, only_new, None,
+    )
+    return _to_scanned(raw)
+
+
+def extract_until_mark(driver: WebDriver, stop_at: Sequence[str]) -> tuple[list[ScannedVideo], bool]:
+    """
+    Liest Verlaufseinträge von oben bis zur Verlaufsmarke (Regel wie ``MarkMatcher``).
+
+    :param driver: Aktiver WebDriver
+    :param stop_at: Video-IDs der Verlaufsmarke
+    :return: (Einträge vor der Marke, Marke erreicht)
+    """
+    raw = driver.execute_script(EXTRACT_HISTORY_JS, None, INDEX_ATTRIBUTE, False, list(stop_at))
+    return _to_scanned(raw["entries"]), bool(raw["reached"])
+
+
+def _to_scanned(raw: Optional[list[dict]]) -> list[ScannedVideo]:
+    return [
+        ScannedVideo(
+            title=entry["title"],
+            channel_name=entry["channel_name"],
+            channel_url=entry["channel_url"],
+            video_id=entry["video_id"],
+            element=entry["element"],
+            index=int(entry["index"]),
+        )
+        for entry in raw or []
+    ]
+
+
+class HistoryCursor:
+    """
+    Liest den Verlauf inkrementell: jeder Aufruf von :meth:`next_batch` liefert nur
+    Einträge, die seit dem letzten Aufruf auf der Seite hinzugekommen sind.
+
+    Dedupliziert wird standardmäßig über die Video-ID (jedes Video einmal bewerten). Zum
+    Entfernen über die Knotennummer (``dedupe="index"``): ein mehrfach angesehenes Video steht
+    mehrfach im Verlauf, und jeder dieser Einträge muss einzeln entfernt werden.
+    Laufzeit und Speicher wachsen linear mit dem Verlauf; nach einem Neuladen der Seite ist ein
+    neuer Cursor nötig.
+    """
+
+    def __init__(self, driver: WebDriver, dedupe: str = "video_id") -> None:
+        if dedupe not in ("video_id", "index"):
+            raise ValueError(f"Unbekannte Deduplizierung: {dedupe!r}")
+        self.driver = driver
+        self.dedupe = dedupe
+        self.seen: set[Union[str, int]] = set()
+
+    def next_batch(self) -> list[ScannedVideo]:
+        """
+        :return: Neue, bisher ungesehene Einträge in Seitenreihenfolge
+        """
+        batch: list[ScannedVideo] = []
+        for video in extract_history_entries(self.driver, only_new=True):
+            key = video.index if self.dedupe == "index" else video.video_id
+            if key in self.seen:
+                continue
+            self.seen.add(key)
+            batch.append(video)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.seen)
@@ -0,0 +1,221 @@
+"""
+Liest den YouTube-Verlauf aus den eingebetteten Strukturdaten (``ytInitialData``) und
+den Fortsetzungs-Antworten der internen API, statt den gerenderten DOM auszuwerten.
+
+Der Parser arbeitet rein auf JSON und ist damit offline gegen gespeicherte Antworten testbar.
+"""
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional, Sequence
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from watchangel.model.scanned_video import ScannedVideo
+from watchangel.storage.watermark import MarkMatcher
+
+HISTORY_URL = "https://www.youtube.com/feed/history"
+YOUTUBE_ORIGIN = "https://www.youtube.com"
+
+_INITIAL_DATA_MARKER = re.compile(r"""(?:var\s+ytInitialData|window\[["']ytInitialData["']\])\s*=\s*""")
+
+# Holt eine Fortsetzungsseite über die interne API aus dem Seitenkontext (Cookies und
+# ytcfg des angemeldeten Profils). Liefert den Antworttext, geparst wird in Python.
+FETCH_CONTINUATION_JS = """
+const token = arguments[0];
+const done = arguments[arguments.length - 1];
+(async () => {
+    const cfg = window.ytcfg;
+    const headers = {
+        'Content-Type': 'application/json',
+        'X-Goog-AuthUser': String(cfg.get('SESSION_INDEX') || 0),
+        'X-Origin': location.origin,
+    };
+    const sapisid = (document.cookie.match(/(?:^|; )(?:SAPISID|__Secure-3PAPISID)=([^;]+)/) || [])[1];
+    if (sapisid) {
+        const ts = Math.floor(Date.now() / 1000);
+        const digest = await crypto.subtle.digest(
+            'SHA-1', new TextEncoder().encode(`${ts} ${sapisid} ${location.origin}`));
+        const hex = Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, '0')).join('');
+        headers['Authorization'] = `SAPISIDHASH ${ts}_${hex}`;
+    }
+    const response = await fetch(
+        `/youtubei/v1/browse?key=${cfg.get('INNERTUBE_API_KEY')}&prettyPrint=false`,
+        {
+            method: 'POST',
+            credentials: 'include',
+            headers,
+            body: JSON.stringify({context: cfg.get('INNERTUBE_CONTEXT'), continuation: token}),
+        });
+    done({status: response.status, body: await response.text()});
+})().catch((e) => done({status: 0, body: '', error: String(e)}));
+"""
+
+
+@dataclass
+class HistoryPage:
+    """Videos einer Verlaufsseite und das Token für die nächste Seite."""
+    videos: list[ScannedVideo] = field(default_factory=list)
+    continuation: Optional[str] = None
+
+
+# ------------------- Parser -------------------
+
+def extract_initial_data(html: str) -> dict:
+    """
+    Liest das eingebettete ``ytInitialData``-Objekt aus dem HTML der Verlaufsseite.
+
+    :param html: Seitenquelltext
+    :return: Geparstes JSON
+    :raises ValueError: Wenn kein ytInitialData gefunden wird
+    """
+    marker = _INITIAL_DATA_MARKER.search(html)
+    if marker is None:
+        raise ValueError("ytInitialData nicht im Seitenquelltext gefunden")
+    data, _ = json.JSONDecoder().raw_decode(html, marker.end())
+    return data
+
+
+def parse_history_payload(payload: dict) -> HistoryPage:
+    """
+    Wandelt ``ytInitialData`` oder eine Fortsetzungs-Antwort in ScannedVideo-Einträge um.
+
+    Der Baum wird generisch durchlaufen: jeder ``videoRenderer`` bzw. Video-``lockupViewModel``
+    wird ein Eintrag, das letzte ``continuationCommand``-Token die nächste Seite.
+
+    :param payload: JSON der Seite oder der API-Antwort
+    :return: HistoryPage (Videos ohne DOM-Element)
+    """
+    page = HistoryPage()
+    for key, node in _walk(payload):
+        if key == "videoRenderer":
+            video = _from_video_renderer(node)
+        elif key == "lockupViewModel":
+            video = _from_lockup(node)
+        elif key == "continuationCommand":
+            page.continuation = node.get("token") or page.continuation
+            continue
+        else:
+            continue
+        if video is not None:
+            video.index = len(page.videos)
+            page.videos.append(video)
+    return page
+
+
+def _walk(node: Any) -> Iterator[tuple[str, dict]]:
+    """Liefert (Schlüssel, Objekt) für alle verschachtelten Objekte in Dokumentreihenfolge."""
+    stack: list[Any] = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            children = []
+            for key, value in current.items():
+                if isinstance(value, dict):
+                    yield key, value
+                if isinstance(value, (dict, list)):
+                    children.append(value)
+            stack.extend(reversed(children))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
+def _dig(node: Any, *path: Any) -> Any:
+    for step in path:
+        if isinstance(node, dict):
+            node = node.get(step)
+        elif isinstance(node, list) and isinstance(step, int) and -len(node) <= step < len(node):
+            node = node[step]
+        else:
+            return None
+    return node
+
+
+def _text(node: Any) -> str:
+    """Text aus ``simpleText``, ``runs`` oder ``content``."""
+    if not isinstance(node, dict):
+        return ""
+    if "simpleText" in node:
+        return str(node["simpleText"]).strip()
+    if "runs" in node:
+        return "".join(str(run.get("text", "")) for run in node["runs"]).strip()
+    return str(node.get("content", "")).strip()
+
+
+def _channel_url(endpoint: Any) -> str:
+    path = _dig(endpoint, "browseEndpoint", "canonicalBaseUrl") \
+        or _dig(endpoint, "commandMetadata", "webCommandMetadata", "url") or ""
+    return f"{YOUTUBE_ORIGIN}{path}" if path.startswith("/") else path
+
+
+def _from_video_renderer(node: dict) -> Optional[ScannedVideo]:
+    video_id = node.get("videoId")
+    if not video_id:
+        return None
+    byline = node.get("ownerText") or node.get("longBylineText") or node.get("shortBylineText") or {}
+    return ScannedVideo(
+        title=_text(node.get("title")),
+        channel_name=_text(byline),
+        channel_url=_channel_url(_dig(byline, "runs", 0, "navigationEndpoint")),
+        video_id=video_id,
+    )
+
+
+def _from_lockup(node: dict) -> Optional[ScannedVideo]:
+    video_id = node.get("contentId")
+    if not video_id or node.get("contentType", "LOCKUP_CONTENT_TYPE_VIDEO") != "LOCKUP_CONTENT_TYPE_VIDEO":
+        return None
+    metadata = _dig(node, "metadata", "lockupMetadataViewModel") or {}
+    channel_part = _dig(metadata, "metadata", "contentMetadataViewModel", "metadataRows", 0, "metadataParts", 0,
+                        "text") or {}
+    return ScannedVideo(
+        title=_text(metadata.get("title")),
+        channel_name=_text(channel_part),
+        channel_url=_channel_url(_dig(channel_part, "commandRuns", 0, "onTap", "innertubeCommand")),
+        video_id=video_id,
+    )
+
+
+# ------------------- Reader -------------------
+
+def read_history_data(driver: WebDriver, max_pages: int = 50, stop_at: Sequence[str] = ()) -> list[ScannedVideo]:
+    """
+    Liest den Verlauf über Strukturdaten: erste Seite aus ``ytInitialData``, weitere über
+    Fortsetzungs-Anfragen im Seitenkontext. Es wird nichts gescrollt oder gerendert.
+
+    :param driver: Aktiver WebDriver (angemeldetes Profil)
+    :param max_pages: Maximale Anzahl Fortsetzungsseiten (0 = nur erste Seite)
+    :param stop_at: Video-IDs einer Verlaufsmarke – das Lesen endet an der Marke (siehe ``MarkMatcher``)
+    :return: Videos in Verlaufsreihenfolge, je Video-ID einmal, ohne DOM-Element
+    :raises ValueError: Wenn die Seite keine lesbaren Strukturdaten enthält
+    """
+    driver.get(HISTORY_URL)
+    raw = driver.execute_script("return window.ytInitialData ? JSON.stringify(window.ytInitialData) : null;")
+    data = json.loads(raw) if raw else extract_initial_data(driver.page_source)
+
+    page = parse_history_payload(data)
+    videos: list[ScannedVideo] = []
+    seen: set[str] = set()
+    marks = MarkMatcher(stop_at)
+    pages = 0
+
+    while True:
+        for video in (ready for video in page.videos for ready in marks.feed(video)):
+            if video.video_id not in seen:
+                seen.add(video.video_id)
+                video.index = len(videos)
+                videos.append(video)
+
+        if marks.reached:
+            break
+        if not page.continuation or pages >= max_pages:
+            marks.finish()
+            break
+        response = driver.execute_async_script(FETCH_CONTINUATION_JS, page.continuation)
+        if not response or response.get("status") != 200:
+            print(f"[⚠️] Fortsetzung nicht geladen (Status {response and response.get('status')}) – Abbruch.")
+            break
+        page = parse_history_payload(json.loads(response["body"]))
+        pages += 1
+
+    print(f"[🧾] {len(videos)} Videos aus Strukturdaten gelesen ({pages + 1} Seite(n)).")
+    return videos
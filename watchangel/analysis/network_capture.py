@@ -0,0 +1,197 @@
+"""
+Liest den YouTube-Verlauf aus den Netzwerkantworten, die die Seite ohnehin lädt.
+
+Über das Performance-Log von ChromeDriver (DevTools-Ereignisse ``Network.*``) werden die
+Antwort des Verlaufsdokuments und die Fortsetzungsantworten von ``/youtubei/v1/browse``
+erkannt, ihr Inhalt per ``Network.getResponseBody`` geholt und mit ``parse_history_payload``
+dekodiert. Der DOM wird nur noch zum Nachladen (Scrollen) und für Entfern-Klicks gebraucht.
+
+Voraussetzung: Der Treiber wurde mit ``goog:loggingPrefs = {"performance": "ALL"}`` gestartet
+(``DriverProfile.capture_network``).
+"""
+import base64
+import json
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from watchangel.analysis.history_data import (
+    HISTORY_URL, HistoryPage, extract_initial_data, parse_history_payload, read_history_data,
+)
+from watchangel.model.scanned_video import ScannedVideo
+from watchangel.storage.watermark import MarkMatcher
+from watchangel.utils.scrolling import AdaptiveScroller
+
+BROWSE_API_PATH = "/youtubei/v1/browse"
+HISTORY_PATH = "/feed/history"
+
+
+@dataclass
+class CapturedResponse:
+    """Eine abgeschlossene, relevante Antwort aus dem Performance-Log."""
+    request_id: str
+    url: str
+    kind: str  # "document" (Verlaufsseite) oder "browse" (API-Fortsetzung)
+
+
+# ------------------- Decoder -------------------
+
+def _classify(url: str, resource_type: str) -> Optional[str]:
+    if BROWSE_API_PATH in url:
+        return "browse"
+    if resource_type == "Document" and HISTORY_PATH in url:
+        return "document"
+    return None
+
+
+class ResponseTracker:
+    """
+    Ordnet DevTools-Ereignisse einander zu: ``responseReceived`` merkt relevante Anfragen,
+    ``loadingFinished`` meldet sie als abholbereit, ``loadingFailed`` verwirft sie.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[str, CapturedResponse] = {}
+
+    def feed(self, entries: Iterable[dict]) -> list[CapturedResponse]:
+        """
+        :param entries: Einträge aus ``driver.get_log("performance")``
+        :return: Fertig geladene Antworten in Ereignisreihenfolge
+        """
+        finished: list[CapturedResponse] = []
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params") or {}
+            request_id = params.get("requestId")
+            if method == "Network.responseReceived":
+                response = params.get("response") or {}
+                kind = _classify(response.get("url", ""), params.get("type", ""))
+                if kind and response.get("status", 200) == 200:
+                    self._pending[request_id] = CapturedResponse(request_id, response["url"], kind)
+            elif method == "Network.loadingFinished" and request_id in self._pending:
+                finished.append(self._pending.pop(request_id))
+            elif method == "Network.loadingFailed":
+                self._pending.pop(request_id, None)
+        return finished
+
+
+def decode_response_body(body: dict, kind: str) -> HistoryPage:
+    """
+    Dekodiert das Ergebnis von ``Network.getResponseBody``.
+
+    :param body: ``{"body": str, "base64Encoded": bool}``
+    :param kind: "document" (HTML mit ytInitialData) oder "browse" (JSON)
+    :return: HistoryPage
+    :raises ValueError: Wenn der Inhalt nicht lesbar ist
+    """
+    text = body.get("body") or ""
+    if body.get("base64Encoded"):
+        text = base64.b64decode(text).decode("utf-8")
+    payload = extract_initial_data(text) if kind == "document" else json.loads(text)
+    return parse_history_payload(payload)
+
+
+# ------------------- Capture -------------------
+
+class NetworkCapture:
+    """
+    Liest relevante Antworten aus dem Performance-Log und liefert daraus neue Videos
+    (je Video-ID einmal, in Verlaufsreihenfolge).
+    """
+
+    def __init__(self, driver: WebDriver) -> None:
+        self.driver = driver
+        self.tracker = ResponseTracker()
+        self.seen: set[str] = set()
+        self.responses = 0
+        self.continuation: Optional[str] = None
+
+    def start(self) -> None:
+        """Aktiviert das Netzwerk-Tracking und verwirft ältere Log-Einträge."""
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.get_log("performance")
+
+    @property
+    def exhausted(self) -> bool:
+        """True, wenn eine Antwort gelesen wurde und keine weitere Seite angekündigt ist."""
+        return self.responses > 0 and not self.continuation
+
+    def poll(self) -> Iterator[ScannedVideo]:
+        """Holt und dekodiert alle seit dem letzten Aufruf abgeschlossenen Antworten."""
+        for response in self.tracker.feed(self.driver.get_log("performance")):
+            try:
+                body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": response.request_id})
+                page = decode_response_body(body, response.kind)
+            except Exception as e:
+                print(f"[⚠️] Antwort nicht lesbar ({response.kind}): {e}")
+                continue
+            yield from self.accept(page)
+
+    def accept(self, page: HistoryPage) -> Iterator[ScannedVideo]:
+        self.responses += 1
+        self.continuation = page.continuation
+        for video in page.videos:
+            if video.video_id not in self.seen:
+                self.seen.add(video.video_id)
+                yield video
+
+
+def stream_history_capture(driver: WebDriver, max_pages: int = 50,
+                           stop_at: Sequence[str] = ()) -> Iterator[ScannedVideo]:
+    """
+    Öffnet den Verlauf und liefert Videos, sobald ihre Antworten eintreffen. Weitere Seiten
+    lädt die Seite selbst beim Scrollen nach; gelesen wird nur der Antwortinhalt.
+
+    :param driver: WebDriver mit Performance-Log
+    :param max_pages: Maximale Nachladerunden (0 = nur erste Seite)
+    :param stop_at: Video-IDs einer Verlaufsmarke – das Lesen endet an der Marke (siehe ``MarkMatcher``)
+    :raises ValueError: Wenn weder eine Antwort noch ytInitialData lesbar ist
+    """
+    capture = NetworkCapture(driver)
+    capture.start()
+    driver.get(HISTORY_URL)
+    scroller = AdaptiveScroller(driver)
+    scroller.wait_ready()
+
+    marks = MarkMatcher(stop_at)
+    first = list(capture.poll())
+    if not capture.responses:
+        # Dokument kam z. B. aus dem Cache – erste Seite wie im Reader "data" lesen
+        raw = driver.execute_script("return window.ytInitialData ? JSON.stringify(window.ytInitialData) : null;")
+        if not raw:
+            raise ValueError("Keine Verlaufsantwort im Performance-Log (Capture aktiviert?)")
+        first = list(capture.accept(parse_history_payload(json.loads(raw))))
+
+    batch, pages, index = first, 0, 0
+    while True:
+        for video in (ready for video in batch for ready in marks.feed(video)):
+            video.index = index
+            index += 1
+            yield video
+        if marks.reached:
+            return
+        if capture.exhausted or pages >= max_pages:
+            return
+        new_items = scroller.step()
+        pages += 1
+        batch = list(capture.poll())
+        if not batch and not new_items:
+            return
+
+
+def read_history_capture(driver: WebDriver, max_pages: int = 50, stop_at: Sequence[str] = ()) -> list[ScannedVideo]:
+    """Wie ``read_history_data``, aber aus mitgeschnittenen Netzwerkantworten."""
+    videos = list(stream_history_capture(driver, max_pages, stop_at))
+    print(f"[🧾] {len(videos)} Videos aus Netzwerkantworten gelesen.")
+    return videos
+
+
+# Reader-Modi, die ohne DOM-Auswertung lesen (Rückfall auf den DOM beim Aufrufer)
+HISTORY_READERS: dict[str, Callable[..., list[ScannedVideo]]] = {
+    "data": read_history_data,
+    "capture": read_history_capture,
+}
@@ -1,73 +1,65 @@
-import time
-from typing import Set
-from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
+from typing import Iterable
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.webdriver import WebDriver
-from selenium.common.exceptions import NoSuchElementException
 
+import watchangel.globals as app_globals
+from watchangel.analysis.network_capture import HISTORY_READERS
+from watchangel.cleaner.cleaner import scroll_and_process
 from watchangel.model.scanned_video import ScannedVideo
-from watchangel.utils.scrolling import scroll_to_end
 
 
 def scan_watch_history(driver: WebDriver) -> list[ScannedVideo]:
     """
-    Scrollt durch den Verlauf und extrahiert alle Videos.
-    """
-    driver.get("https://www.youtube.com/feed/history")
-    time.sleep(2)
+    Liest den kompletten Verlauf (je Video-ID einmal).
 
-    scroll_to_end(driver)  # zentrale Scroll-Logik
-    blocks = driver.find_elements(By.CSS_SELECTOR, "ytd-video-renderer")
+    Im Reader-Modus "data" aus den Strukturdaten der Seite, im Modus "capture" aus den
+    mitgeschnittenen Netzwerkantworten, sonst – oder wenn das fehlschlägt – durch Scrollen
+    über den gerenderten DOM.
+    """
+    reader = HISTORY_READERS.get(app_globals.READER_MODE)
+    if reader is not None:
+        try:
+            return reader(driver)
+        except (ValueError, WebDriverException) as e:
+            print(f"[⚠️] Strukturdaten nicht lesbar ({e}) – weiter über den DOM.")
 
-    seen: Set[str] = set()
     videos: list[ScannedVideo] = []
 
-    for block in blocks:
-        key = block.get_attribute("outerHTML")
-        if key in seen:
-            continue
-        seen.add(key)
+    def collect(video: ScannedVideo) -> bool:
+        videos.append(video)
+        return False
 
-        video = _extract_video_metadata(block)
-        if video:
-            videos.append(video)
+    scroll_and_process(driver, collect)
 
     print(f"[📦] {len(videos)} Videos erfasst.")
     return videos
 
 
-def _extract_video_metadata(block: WebElement) -> ScannedVideo | None:
+def attach_elements(driver: WebDriver, videos: Iterable[ScannedVideo]) -> int:
     """
-    Extrahiert die Metadaten aus einem einzelnen Video-Block.
+    Trägt fehlende DOM-Elemente (z. B. nach dem Lesen über Strukturdaten) in einem
+    DOM-Durchlauf nach. Gescrollt wird nur, bis alle gesuchten Videos gefunden sind.
 
-    :param block: DOM-Element des Videos
-    :return: ScannedVideo-Objekt oder None
+    :param driver: Aktiver WebDriver
+    :param videos: Videos, deren ``element`` None ist, werden gesucht
+    :return: Anzahl gefundener Elemente
     """
-    try:
-        title_el = block.find_element(By.CSS_SELECTOR, "#video-title")
-        title = title_el.text.strip()
-
-        channel_el = block.find_element(By.CSS_SELECTOR, "ytd-channel-name a")
-        channel_name = channel_el.text.strip()
+    missing: dict[str, list[ScannedVideo]] = {}
+    for video in videos:
+        if video.element is None:
+            missing.setdefault(video.video_id, []).append(video)
+    if not missing:
+        return 0
 
-        hrefs = block.find_elements(By.CSS_SELECTOR, "a#thumbnail")
-        video_id = None
-        url: str | None = None
-        for href in hrefs:
-            url = href.get_attribute("href")
-            if url and "watch?v=" in url:
-                video_id = url.split("watch?v=")[-1].split("&")[0]
-                break
+    wanted = len(missing)
 
-        if not video_id:
-            return None
+    def resolve(found: ScannedVideo) -> bool:
+        for video in missing.pop(found.video_id, ()):
+            video.element = found.element
+            video.index = found.index
+        return not missing
 
-        return ScannedVideo(
-            title=title,
-            channel_name=channel_name,
-            channel_url=url,
-            video_id=video_id,
-            element=block,
-        )
-    except NoSuchElementException:
-        return None
+    scroll_and_process(driver, resolve)
+    if missing:
+        print(f"[⚠️] {len(missing)} Video(s) nicht mehr im Verlauf gefunden.")
+    return wanted - len(missing)
@@ -8,6 +8,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 
+from watchangel.browser.supervisor import is_dead_session
+from watchangel.storage.moderation_state import get_moderation_store
 from .constants import HIDE_LABEL, BLOCK_LABEL, CSS_SELECTORS
 from .ui_navigation import (
     wait_for_about_modal,
@@ -17,25 +19,39 @@ from .ui_navigation import (
 )
 
 
-def block_channel(driver: WebDriver, channel_url: str) -> None:
+def block_channel(driver: WebDriver, channel_url: str, force: bool = False) -> bool:
     """
     Startet den vollständigen Blockiervorgang für einen Kanal.
+
+    Kanäle, die laut Moderationsspeicher bereits versteckt und für Kids blockiert sind,
+    werden ohne Browser übersprungen.
+
+    :param force: Auch bereits erledigte Kanäle im Browser prüfen (Nachprüfung)
+    :return: True, wenn mindestens eine Aktion (Hide oder Block) geklappt hat
     """
+    state = get_moderation_store().get(channel_url)
+    if state is not None and state.done and not force:
+        print(f"[⏭️] Bereits blockiert (gespeichert): {channel_url}")
+        return True
+
     driver.get(channel_url + "/about")
 
     if not wait_for_about_modal(driver):
         print("[❌] About-Modal ist nicht erschienen")
-        return
+        return False
 
     try:
         open_report_menu(driver)
         menu_items = get_report_menu_items(driver)
-        handle_channel_menu(driver, menu_items, channel_url)
+        return handle_channel_menu(driver, menu_items, channel_url)
     except Exception as e:
+        if is_dead_session(e):
+            raise  # Neustart über den BrowserSupervisor
         print(f"[❌] Fehler beim Blockieren: {e}")
+        return False
 
 
-def handle_channel_menu(driver: WebDriver, menu_items: List, channel_url: str) -> None:
+def handle_channel_menu(driver: WebDriver, menu_items: List, channel_url: str) -> bool:
     actions: Dict[str, bool] = {BLOCK_LABEL: False, HIDE_LABEL: False}
     menu_texts = {HIDE_LABEL: None, BLOCK_LABEL: None}
 
@@ -64,6 +80,8 @@ def handle_channel_menu(driver: WebDriver, menu_items: List, channel_url: str) -
         time.sleep(1)
 
     summarize_blocking(actions, channel_url)
+    get_moderation_store().record(channel_url, hidden=actions[HIDE_LABEL], blocked_for_kids=actions[BLOCK_LABEL])
+    return any(actions.values())
 
 
 def handle_block_kids(driver: WebDriver, item) -> bool:
@@ -141,6 +159,12 @@ def unhide_user_from_channel(driver: WebDriver, channel_url: str) -> bool:
     falls 'Unhide user from my channel' im Menü gefunden wird.
     Gibt True zurück, wenn erfolgreich oder bereits nicht versteckt.
     """
+    store = get_moderation_store()
+    state = store.get(channel_url)
+    if state is not None and state.status == "unhidden":
+        print(f"[⏭️] Bereits entsperrt (gespeichert): {channel_url}")
+        return True
+
     driver.get(channel_url.rstrip("/") + "/about")
 
     if not wait_for_about_modal(driver):
@@ -153,7 +177,68 @@ def unhide_user_from_channel(driver: WebDriver, channel_url: str) -> bool:
         menu_items = get_report_menu_items(driver)
         for item in menu_items:
             is_unhidden = handle_hide_user(driver, item, unhide=True)
+        if is_unhidden:
+            store.record(channel_url, hidden=False, status="unhidden")
         return True if is_unhidden else False
     except Exception as e:
+        if is_dead_session(e):
+            raise  # Neustart über den BrowserSupervisor
         print(f"[❌] Fehler beim Unhide: {e}")
         return False
+
+
+def hide_user_from_channel(driver: WebDriver, channel_url: str) -> bool:
+    """
+    Öffnet die /about-Seite des Kanals und führt nur 'Hide user from my channel' aus.
+    Gibt True zurück, wenn erfolgreich oder bereits versteckt.
+    """
+    store = get_moderation_store()
+    state = store.get(channel_url)
+    if state is not None and state.hidden:
+        print(f"[⏭️] Bereits versteckt (gespeichert): {channel_url}")
+        return True
+
+    driver.get(channel_url.rstrip("/") + "/about")
+
+    if not wait_for_about_modal(driver):
+        print("[❌] About-Modal ist nicht erschienen")
+        return False
+
+    try:
+        open_report_menu(driver)
+        for item in get_report_menu_items(driver):
+            if HIDE_LABEL in item.text.strip().lower():
+                hidden = handle_hide_user(driver, item)
+                if hidden:
+                    store.record(channel_url, hidden=True)
+                return hidden
+        print("[⚠️] Kein passender Menüeintrag gefunden")
+        return False
+    except Exception as e:
+        if is_dead_session(e):
+            raise  # Neustart über den BrowserSupervisor
+        print(f"[❌] Fehler beim Hide: {e}")
+        return False
+
+
+def reverify_channels(driver: WebDriver, max_age_days: float, limit: int = 20) -> int:
+    """
+    Langsame Nachprüfung: öffnet erledigte Kanäle, deren letzte Prüfung älter als
+    ``max_age_days`` ist, erneut im Browser und aktualisiert ihren gespeicherten Zustand.
+
+    :param limit: Höchstens so viele Kanäle je Aufruf
+    :return: Anzahl der weiterhin vollständig blockierten Kanäle
+    """
+    store = get_moderation_store()
+    due = store.due_for_reverify(max_age_days, limit)
+    if not due:
+        return 0
+
+    print(f"[🔎] Prüfe {len(due)} gespeicherte Kanäle erneut ...")
+    confirmed = 0
+    for state in due:
+        block_channel(driver, state.channel_url, force=True)
+        current = store.get(state.channel_url)
+        confirmed += int(current is not None and current.done)
+    print(f"[🔎] {confirmed}/{len(due)} weiterhin vollständig blockiert.")
+    return confirmed
@@ -0,0 +1,206 @@
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from .actions import block_channel, unhide_user_from_channel
+
+DriverFactory = Callable[[int], WebDriver]
+
+# Profil-Dateien, die nicht in Worker-Kopien gehören (Sperren, Caches)
+_PROFILE_SKIP = ("Singleton*", "lockfile", "*Cache*", "Crashpad", "GrShaderCache", "ShaderCache")
+
+JOB_ACTIONS: dict[str, Callable[[WebDriver, str], bool]] = {
+    "block": block_channel,
+    "unhide": unhide_user_from_channel,
+}
+
+
+@dataclass
+class ChannelJob:
+    """Eine Aktion für einen Kanal (``block`` oder ``unhide``)."""
+    action: str
+    channel_url: str
+    channel_name: str = ""
+
+
+@dataclass
+class JobResult:
+    job: ChannelJob
+    ok: bool
+    worker: int
+    seconds: float
+    error: Optional[str] = None
+
+
+@dataclass
+class WorkerStats:
+    """Ergebnis eines einzelnen Workers."""
+    worker: int
+    done: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def jobs_per_minute(self) -> float:
+        return (self.done + self.failed) / self.seconds * 60 if self.seconds else 0.0
+
+
+@dataclass
+class PoolReport:
+    """Ergebnis eines Pool-Laufs: Einzelergebnisse, je Worker und gesamt."""
+    results: list[JobResult] = field(default_factory=list)
+    workers: list[WorkerStats] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> list[JobResult]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def jobs_per_minute(self) -> float:
+        return len(self.results) / self.seconds * 60 if self.seconds else 0.0
+
+    def summary(self) -> str:
+        lines = [f"[📈] {len(self.succeeded)}/{len(self.results)} Aufträge erfolgreich in {self.seconds:.1f}s "
+                 f"({self.jobs_per_minute:.1f}/min mit {len(self.workers)} Worker(n))"]
+        for stats in self.workers:
+            lines.append(f"     Worker {stats.worker}: {stats.done} ok, {stats.failed} fehlgeschlagen, "
+                         f"{stats.jobs_per_minute:.1f}/min")
+        return "\n".join(lines)
+
+
+class BlockingPool:
+    """
+    Verteilt Block- und Unhide-Aufträge auf mehrere Browser-Sitzungen.
+
+    Jeder Worker-Thread öffnet über ``driver_factory`` eine eigene Sitzung und holt sich
+    Aufträge aus einer gemeinsamen Warteschlange. Ein WebDriver wird nie von zwei Threads
+    gleichzeitig benutzt; Tabs einer Sitzung ließen sich nicht parallel steuern.
+    """
+
+    def __init__(self, driver_factory: DriverFactory, workers: int = 2) -> None:
+        self.driver_factory = driver_factory
+        self.workers = max(1, workers)
+
+    def run(self, jobs: Iterable[ChannelJob]) -> PoolReport:
+        """
+        Arbeitet alle Aufträge ab und schließt die Sitzungen danach.
+
+        :param jobs: Aufträge
+        :return: PoolReport mit Ergebnis je Auftrag und je Worker
+        """
+        pending: queue.Queue[ChannelJob] = queue.Queue()
+        for job in jobs:
+            pending.put(job)
+
+        report = PoolReport()
+        lock = threading.Lock()
+        count = min(self.workers, pending.qsize())
+        started = time.perf_counter()
+
+        threads = [
+            threading.Thread(target=self._work, args=(worker, pending, report, lock), daemon=True)
+            for worker in range(count)
+        ]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            # Factories mit eigenen Ressourcen (z. B. Profilkopien) räumen nach dem Lauf auf
+            close = getattr(self.driver_factory, "close", None)
+            if close is not None:
+                close()
+
+        report.seconds = time.perf_counter() - started
+        report.workers.sort(key=lambda stats: stats.worker)
+        return report
+
+    def _work(self, worker: int, pending: "queue.Queue[ChannelJob]", report: PoolReport,
+              lock: threading.Lock) -> None:
+        stats = WorkerStats(worker)
+        started = time.perf_counter()
+        try:
+            driver = self.driver_factory(worker)
+        except Exception as e:
+            print(f"[❌] Worker {worker}: Browser konnte nicht gestartet werden: {e}")
+            with lock:
+                report.workers.append(stats)
+            return
+
+        try:
+            while True:
+                try:
+                    job = pending.get_nowait()
+                except queue.Empty:
+                    break
+                result = _run_job(driver, job, worker)
+                stats.done += int(result.ok)
+                stats.failed += int(not result.ok)
+                with lock:
+                    report.results.append(result)
+        finally:
+            stats.seconds = time.perf_counter() - started
+            with lock:
+                report.workers.append(stats)
+            driver.quit()
+
+
+def _run_job(driver: WebDriver, job: ChannelJob, worker: int) -> JobResult:
+    started = time.perf_counter()
+    action = JOB_ACTIONS.get(job.action)
+    if action is None:
+        return JobResult(job, False, worker, 0.0, f"unbekannte Aktion: {job.action}")
+    try:
+        ok = bool(action(driver, job.channel_url))
+        error = None
+    except Exception as e:
+        ok, error = False, str(e)
+    return JobResult(job, ok, worker, time.perf_counter() - started, error)
+
+
+class ClonedProfileFactory:
+    """
+    Factory für Worker-Sitzungen mit demselben Login: Chrome sperrt ein Profil für eine
+    einzige Instanz, daher erhält jeder Worker eine Kopie (ohne Caches und Sperrdateien)
+    in einem eigenen temporären Verzeichnis. ``close()`` löscht alle Kopien wieder.
+    """
+
+    def __init__(self, profile_dir: Path, create_driver: Callable[[Path], WebDriver]) -> None:
+        self.profile_dir = profile_dir
+        self.create_driver = create_driver
+        self.clones: list[Path] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, worker: int) -> WebDriver:
+        root = Path(tempfile.mkdtemp(prefix=f"watchangel-worker-{worker}-"))
+        with self._lock:
+            self.clones.append(root)
+        clone = root / self.profile_dir.name
+        shutil.copytree(self.profile_dir, clone, ignore=shutil.ignore_patterns(*_PROFILE_SKIP), symlinks=True)
+        return self.create_driver(clone)
+
+    def close(self) -> None:
+        """Entfernt alle Profilkopien; läuft erst, wenn die Sitzungen beendet sind."""
+        with self._lock:
+            clones, self.clones = self.clones, []
+        for root in clones:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def cloned_profile_factory(profile_dir: Path, create_driver: Callable[[Path], WebDriver]) -> ClonedProfileFactory:
+    """
+    Factory für Worker-Sitzungen mit Kopien des angemeldeten Profils.
+
+    :param profile_dir: Angemeldetes Chrome-Profil
+    :param create_driver: Startet Chrome mit einem Profilverzeichnis
+    :return: Factory, deren Kopien ``BlockingPool.run`` beim Beenden löscht
+    """
+    return ClonedProfileFactory(profile_dir, create_driver)
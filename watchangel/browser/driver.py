@@ -0,0 +1,113 @@
+from dataclasses import dataclass, replace
+from pathlib import Path
+from selenium import webdriver
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+# Bilder: Thumbnails und Avatare (Thumbnails für die Beweissicherung lädt save_thumbnail separat)
+IMAGE_PATTERNS = (
+    "*://i.ytimg.com/*", "*://i9.ytimg.com/*", "*://yt3.ggpht.com/*", "*://yt3.googleusercontent.com/*",
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*",
+)
+# Videostreams und Vorschau-Clips
+MEDIA_PATTERNS = (
+    "*://*.googlevideo.com/*", "*://i.ytimg.com/an_webp/*", "*.mp4*", "*.webm*",
+)
+# Werbung und Telemetrie
+AD_PATTERNS = (
+    "*://*.doubleclick.net/*", "*://*.googlesyndication.com/*", "*://*.googleadservices.com/*",
+    "*://*.google-analytics.com/*", "*://www.youtube.com/pagead/*", "*://www.youtube.com/api/stats/*",
+    "*://www.youtube.com/ptracking*", "*://www.youtube.com/youtubei/v1/log_event*",
+    "*://www.youtube.com/generate_204*", "*://play.google.com/log*",
+)
+
+
+@dataclass(frozen=True)
+class DriverProfile:
+    """
+    Browser-Einstellungen je Aufgabe.
+
+    :param headless: Ohne sichtbares Fenster starten
+    :param eager: ``pageLoadStrategy`` "eager" – ``get()`` kehrt nach DOMContentLoaded zurück
+    :param block_images: Bilder per DevTools-Protokoll blockieren
+    :param block_media: Videostreams und Vorschauen blockieren
+    :param block_ads: Werbe- und Telemetrie-Hosts blockieren
+    :param extra_blocked: Zusätzliche URL-Muster (Platzhalter ``*``)
+    :param capture_network: Performance-Log aktivieren (für den Reader "capture")
+    """
+    headless: bool = False
+    eager: bool = False
+    block_images: bool = False
+    block_media: bool = False
+    block_ads: bool = False
+    extra_blocked: tuple[str, ...] = ()
+    capture_network: bool = False
+    window_size: str = "1280,1600"
+
+    def blocked_urls(self) -> list[str]:
+        patterns = list(self.extra_blocked)
+        if self.block_images:
+            patterns += IMAGE_PATTERNS
+        if self.block_media:
+            patterns += MEDIA_PATTERNS
+        if self.block_ads:
+            patterns += AD_PATTERNS
+        return list(dict.fromkeys(patterns))
+
+
+# Bisheriges Verhalten: sichtbares Chrome, nichts blockiert
+FULL_PROFILE = DriverProfile()
+# Für den Dauerbetrieb: headless, früh zurückkehren, nur Seitenstruktur und Skripte laden
+LEAN_PROFILE = DriverProfile(headless=True, eager=True, block_images=True, block_media=True, block_ads=True)
+
+DRIVER_PROFILES = {"full": FULL_PROFILE, "lean": LEAN_PROFILE}
+
+
+def driver_profile(mode: str, keep_images: bool = False, capture_network: bool = False) -> DriverProfile:
+    """
+    :param mode: "full" oder "lean"
+    :param keep_images: Bilder trotz Lean-Modus laden (z. B. für Aufgaben mit Bildauswertung)
+    :param capture_network: Netzwerkantworten über das Performance-Log mitschneiden
+    """
+    profile = DRIVER_PROFILES[mode]
+    if keep_images:
+        profile = replace(profile, block_images=False)
+    return replace(profile, capture_network=True) if capture_network else profile
+
+
+def build_options(profile_dir: Path, profile: DriverProfile = FULL_PROFILE) -> webdriver.ChromeOptions:
+    options = webdriver.ChromeOptions()
+    options.add_argument(f"user-data-dir={str(profile_dir)}")
+    if profile.eager:
+        options.page_load_strategy = "eager"
+    if profile.headless:
+        options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={profile.window_size}")
+    if profile.capture_network:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    if profile.block_media:
+        options.add_argument("--mute-audio")
+        options.add_argument("--autoplay-policy=user-gesture-required")
+    return options
+
+
+def apply_resource_blocking(driver: WebDriver, patterns: list[str]) -> None:
+    """
+    Blockiert Anfragen auf URL-Muster über das DevTools-Protokoll (gilt für den aktuellen Tab
+    und bleibt über Navigationen hinweg bestehen).
+    """
+    if not patterns:
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def create_driver(profile_dir: Path, profile: DriverProfile = FULL_PROFILE) -> WebDriver:
+    """
+    Startet Chrome mit dem angegebenen Profilverzeichnis.
+
+    :param profile_dir: Chrome-Profil (angemeldet)
+    :param profile: Browser-Einstellungen, z. B. ``LEAN_PROFILE`` für den Watcher
+    """
+    driver = webdriver.Chrome(options=build_options(profile_dir, profile))
+    apply_resource_blocking(driver, profile.blocked_urls())
+    return driver
@@ -0,0 +1,222 @@
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, TypeVar
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, WebDriverException
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+T = TypeVar("T")
+
+PROC_ROOT = Path("/proc")
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# Fehlertexte, an denen eine tote Sitzung erkennbar ist (Browser abgestürzt, Tab gecrasht, Treiber weg)
+_DEAD_SESSION_MARKERS = (
+    "invalid session id", "session deleted", "chrome not reachable", "disconnected",
+    "tab crashed", "target crashed", "no such window", "target window already closed",
+)
+
+
+@dataclass
+class SupervisorLimits:
+    """
+    Schwellwerte für das Recycling der Browser-Sitzung.
+
+    :param max_renderer_mb: Summe der Renderer-RSS
+    :param max_total_mb: Summe aller Chrome-Prozesse (Browser, GPU, Renderer, …)
+    :param max_latency: Mittlere Antwortzeit eines Test-Kommandos (Sekunden)
+    :param latency_window: Anzahl Messungen für den Mittelwert
+    :param max_session_age: Höchstalter einer Sitzung (Sekunden, 0 = unbegrenzt)
+    :param max_restarts: Wiederherstellungen in Folge, bevor der Fehler weitergereicht wird
+    """
+    max_renderer_mb: float = 1200.0
+    max_total_mb: float = 2500.0
+    max_latency: float = 3.0
+    latency_window: int = 5
+    max_session_age: float = 12 * 60 * 60
+    max_restarts: int = 3
+
+
+@dataclass
+class BrowserMemory:
+    """RSS der Chrome-Prozesse unterhalb des Treibers in MB."""
+    browser_mb: float = 0.0
+    renderer_mb: float = 0.0
+    processes: int = 0
+
+    @property
+    def total_mb(self) -> float:
+        return self.browser_mb + self.renderer_mb
+
+
+def is_dead_session(error: BaseException) -> bool:
+    """True, wenn der Fehler auf eine nicht mehr nutzbare Sitzung hindeutet."""
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError)):
+        return True
+    if isinstance(error, WebDriverException):
+        message = (error.msg or str(error)).lower()
+        return any(marker in message for marker in _DEAD_SESSION_MARKERS)
+    # Treiberprozess weg: urllib3 meldet abgelehnte Verbindungen als MaxRetryError
+    return type(error).__name__ in ("MaxRetryError", "NewConnectionError", "ProtocolError")
+
+
+def measure_memory(root_pid: int, proc_root: Path = PROC_ROOT) -> Optional[BrowserMemory]:
+    """
+    Summiert die RSS aller Nachfahren von ``root_pid`` aus ``/proc`` (nur Linux).
+
+    Renderer werden am Kommandozeilen-Argument ``--type=renderer`` erkannt.
+
+    :return: BrowserMemory oder None, wenn ``/proc`` nicht lesbar ist
+    """
+    if not proc_root.is_dir():
+        return None
+
+    children: dict[int, list[int]] = {}
+    for entry in proc_root.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # Feld 2 (comm) kann Leerzeichen enthalten – ab der letzten Klammer weiterlesen
+        ppid = int(stat[stat.rindex(")") + 2:].split()[1])
+        children.setdefault(ppid, []).append(int(entry.name))
+
+    memory = BrowserMemory()
+    stack = list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            rss_pages = int((proc_root / str(pid) / "statm").read_text().split()[1])
+            cmdline = (proc_root / str(pid) / "cmdline").read_bytes()
+        except (OSError, IndexError, ValueError):
+            continue
+        mb = rss_pages * _PAGE_SIZE / (1024 * 1024)
+        memory.processes += 1
+        if b"--type=renderer" in cmdline:
+            memory.renderer_mb += mb
+        else:
+            memory.browser_mb += mb
+    return memory
+
+
+class BrowserSupervisor:
+    """
+    Verwaltet die Browser-Sitzung eines Dauerlaufs.
+
+    - Misst nach jeder Aufgabe RSS (Browser/Renderer) und die Antwortzeit eines Test-Kommandos
+    - Startet die Sitzung vorsorglich neu, wenn ein Schwellwert überschritten ist
+    - Erkennt tote Sitzungen, startet neu und wiederholt die laufende Aufgabe
+    """
+
+    def __init__(
+            self,
+            driver_factory: Callable[[], WebDriver],
+            limits: Optional[SupervisorLimits] = None,
+            proc_root: Path = PROC_ROOT,
+    ) -> None:
+        self.driver_factory = driver_factory
+        self.limits = limits or SupervisorLimits()
+        self.proc_root = proc_root
+        self.latencies: deque[float] = deque(maxlen=self.limits.latency_window)
+        self.recycles = 0
+        self._driver: Optional[WebDriver] = None
+        self._started_at = 0.0
+
+    @property
+    def driver(self) -> WebDriver:
+        """Aktive Sitzung (wird bei Bedarf gestartet)."""
+        if self._driver is None:
+            self._driver = self.driver_factory()
+            self._started_at = time.monotonic()
+            self.latencies.clear()
+        return self._driver
+
+    def run(self, task: Callable[[WebDriver], T]) -> T:
+        """
+        Führt eine Aufgabe mit der aktiven Sitzung aus.
+
+        Stirbt die Sitzung währenddessen, wird sie ersetzt und die Aufgabe wiederholt –
+        Aufgaben müssen daher wiederholbar sein. Danach wird der Zustand geprüft.
+
+        :param task: Aufgabe, die den WebDriver erhält
+        :return: Ergebnis der Aufgabe
+        """
+        restarts = 0
+        while True:
+            try:
+                result = task(self.driver)
+                break
+            except Exception as e:
+                if not is_dead_session(e) or restarts >= self.limits.max_restarts:
+                    raise
+                restarts += 1
+                print(f"[💥] Browser-Sitzung verloren ({type(e).__name__}) – starte neu "
+                      f"({restarts}/{self.limits.max_restarts}) und setze fort...")
+                self.recycle("Sitzung verloren")
+
+        reason = self.check_health()
+        if reason:
+            self.recycle(reason)
+        return result
+
+    def probe(self) -> float:
+        """Misst die Antwortzeit eines leeren Script-Aufrufs (Sekunden)."""
+        started = time.perf_counter()
+        self.driver.execute_script("return 1;")
+        latency = time.perf_counter() - started
+        self.latencies.append(latency)
+        return latency
+
+    def memory(self) -> Optional[BrowserMemory]:
+        process = getattr(getattr(self._driver, "service", None), "process", None)
+        pid = getattr(process, "pid", None)
+        if not isinstance(pid, int):
+            return None
+        return measure_memory(pid, self.proc_root)
+
+    def check_health(self) -> Optional[str]:
+        """
+        :return: Grund für ein Recycling oder None, wenn die Sitzung gesund ist
+        """
+        limits = self.limits
+        try:
+            self.probe()
+        except Exception as e:
+            if is_dead_session(e):
+                return "Sitzung antwortet nicht"
+            raise
+
+        latency = sum(self.latencies) / len(self.latencies)
+        if len(self.latencies) == self.latencies.maxlen and latency > limits.max_latency:
+            return f"Antwortzeit {latency:.2f}s > {limits.max_latency:.2f}s"
+
+        memory = self.memory()
+        if memory is not None:
+            if memory.renderer_mb > limits.max_renderer_mb:
+                return f"Renderer-Speicher {memory.renderer_mb:.0f} MB > {limits.max_renderer_mb:.0f} MB"
+            if memory.total_mb > limits.max_total_mb:
+                return f"Browser-Speicher {memory.total_mb:.0f} MB > {limits.max_total_mb:.0f} MB"
+
+        if limits.max_session_age and time.monotonic() - self._started_at > limits.max_session_age:
+            return "Sitzung zu alt"
+        return None
+
+    def recycle(self, reason: str) -> None:
+        """Beendet die aktuelle Sitzung; die nächste Aufgabe startet eine neue."""
+        print(f"[♻️] Browser wird neu gestartet: {reason}")
+        self.recycles += 1
+        self.close()
+
+    def close(self) -> None:
+        if self._driver is None:
+            return
+        driver, self._driver = self._driver, None
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"[⚠️] Browser ließ sich nicht sauber beenden: {e}")
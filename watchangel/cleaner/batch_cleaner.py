@@ -1,82 +1,68 @@
-import time
-from typing import Sequence
+from typing import Optional, Sequence
 from selenium.webdriver.chrome.webdriver import WebDriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import TimeoutException
 
+from watchangel.analysis.scanner import attach_elements
+from watchangel.cleaner.removal_engine import RemovalConfig, RemovalEngine
 from watchangel.model.matched_video import MatchedVideo
-from watchangel.rules.block_rules import BlockRuleEngine
+from watchangel.rules.engine_instance import get_log_rules
 from watchangel.watcher.video_handler import log_block_action
 
 
-def clean_matched_videos(driver: WebDriver, matches: Sequence[MatchedVideo]) -> int:
+def clean_matched_videos(
+        driver: WebDriver,
+        matches: Sequence[MatchedVideo],
+        config: Optional[RemovalConfig] = None,
+) -> int:
     """
     Entfernt Videos aus dem Verlauf, die als blockwürdig bewertet wurden.
 
     - Zuerst von unten nach oben (stabil)
-    - Optionaler zweiter Durchlauf bei Bedarf
+    - In Batches über die RemovalEngine, fehlgeschlagene Einträge werden wiederholt
 
     :param driver: Aktive WebDriver-Instanz
     :param matches: Liste blockwürdiger Videos mit DOM-Referenz
+    :param config: Tempo/Drosselung (Standard aus den Einstellungen in globals)
     :return: Anzahl gelöschter Videos
     """
 
-    deleted = 0
-    rules = BlockRuleEngine.from_logs()
+    rules = get_log_rules()
     seen_channels: set[str] = set()
 
     print(f"[🧹] Bereinige {len(matches)} Videos aus dem Verlauf...")
 
+    # Aus Strukturdaten gelesene Videos haben noch kein DOM-Element
+    attach_elements(driver, [match.block for match in matches])
+
+    targets = []
     for match in reversed(matches):
         channel_name = match.block.channel_name
-        channel_key = channel_name.lower()
-
-        if channel_key in rules.whitelist_channels:
+        if channel_name.lower() in rules.whitelist_channels:
             print(f"[🛑] SKIP: '{channel_name}' steht auf Whitelist.")
             continue
+        targets.append(match.block)
 
-        if remove_video_element(driver, match.block.element, channel_name):
-            deleted += 1
-
-            # Logging & Persistenz
-            if channel_key not in rules.block_channels and channel_key not in seen_channels:
-                log_block_action({
-                    "channel_name": channel_name,
-                    "channel_url": match.block.channel_url,
-                    "title": match.block.title,
-                    "video_id": match.block.video_id
-                })
-                seen_channels.add(channel_key)
-
-            time.sleep(1)
-
-    print(f"[✅] {deleted} Video(s) erfolgreich entfernt.")
-    return deleted
+    config = config or RemovalConfig.from_settings()
+    report = RemovalEngine(driver, config).remove(targets)
 
+    for outcome in report.outcomes:
+        video = outcome.video
+        if not outcome.removed:
+            print(f"[⚠️] Entfernen bei '{video.channel_name}' fehlgeschlagen ({outcome.status}, "
+                  f"{outcome.attempts} Versuch(e))")
+            continue
 
-def remove_video_element(driver: WebDriver, element: WebElement, channel_name: str) -> bool:
-    """
-    Klickt den Button „Aus Verlauf entfernen“ im gegebenen DOM-Element.
+        # Logging & Persistenz
+        channel_key = video.channel_name.lower()
+        if not rules.is_blocked_channel(video.channel_name) and channel_key not in seen_channels:
+            log_block_action({
+                "channel_name": video.channel_name,
+                "channel_url": video.channel_url,
+                "title": video.title,
+                "video_id": video.video_id
+            })
+            seen_channels.add(channel_key)
+
+    print(report.summary())
+    print(f"[✅] {len(report.removed)} Video(s) erfolgreich entfernt.")
+    return len(report.removed)
 
-    :param driver: Aktiver WebDriver
-    :param element: DOM-Element des Videos
-    :param channel_name: Name für Logging
-    :return: True bei Erfolg, sonst False
-    """
-    try:
-        remove_btn = WebDriverWait(element, 5).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[aria-label="Remove from watch history"]'))
-        )
-        driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", element)
-        remove_btn.click()
-        print(f"[🗑️] Video von Kanal '{channel_name}' entfernt.")
-        return True
-    except TimeoutException:
-        print(f"[⚠️] Entfernen bei '{channel_name}' nicht möglich (nicht klickbar)")
-        return False
-    except Exception as e:
-        print(f"[⚠️] Fehler bei '{channel_name}': {e}")
-        return False
@@ -1,47 +1,21 @@
-import time
-from typing import Callable, Optional, Set
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
 from selenium.webdriver.chrome.webdriver import WebDriver
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.remote.webelement import WebElement
 
+from watchangel.analysis.extractor import HistoryCursor
+from watchangel.cleaner.removal_engine import RemovalConfig, RemovalEngine
 from watchangel.model.scanned_video import ScannedVideo
 from watchangel.rules.block_rules import BlockRuleEngine
-
-from watchangel.matching.matching import match_video
-from watchangel.model.matched_video import MatchedVideo
-
-def try_match_element(element: WebElement, rules: BlockRuleEngine) -> Optional[MatchedVideo]:
-    """
-    Erstellt ein ScannedVideo aus einem WebElement und führt ein Matching durch.
-    Gibt ein MatchedVideo zurück, wenn blockwürdig – sonst None.
-    """
-    try:
-        channel_element = element.find_element(By.CSS_SELECTOR, "ytd-channel-name a")
-        title_element = element.find_element(By.ID, "video-title")
-        href = title_element.get_attribute("href") or ""
-        channel_url = channel_element.get_attribute("href") or ""
-
-        scanned = ScannedVideo(
-            video_id=href.split("v=")[-1],
-            title=title_element.text.strip(),
-            channel_name=channel_element.text.strip(),
-            channel_url=channel_url,
-            element=element
-        )
-        return match_video(scanned, rules)
-    except Exception:
-        return None
+from watchangel.rules.engine_instance import get_log_rules
+from watchangel.utils.scrolling import AdaptiveScroller
 
 
 def remove_all_from_channel(driver: WebDriver, video_id: str) -> None:
     """
     Entfernt ein Zielvideo sowie alle Videos desselben Kanals, sofern blockiert.
+
+    Für mehrere Kanäle auf einmal :func:`purge_channels` verwenden.
     """
-    rules: BlockRuleEngine = BlockRuleEngine.from_logs()
     print(f"[📺] Ermittle Kanal zu Video {video_id} ...")
     channel_name: Optional[str] = find_channel_name(driver, video_id)
 
@@ -49,28 +23,87 @@ def remove_all_from_channel(driver: WebDriver, video_id: str) -> None:
         print("[⚠️] Kanal nicht gefunden – keine Löschung")
         return
 
-    deleted_count: int = 0
+    purge_channels(driver, [channel_name])
 
-    def processor(block: WebElement) -> bool:
-        nonlocal deleted_count
-        try:
-            current_name: str = block.find_element(By.CSS_SELECTOR, "ytd-channel-name a").text.strip()
-        except NoSuchElementException:
-            return False
 
-        if current_name != channel_name:
-            return False
+@dataclass
+class PurgeResult:
+    """
+    Ergebnis eines Purge-Durchlaufs.
+
+    :param removed: Kanalname (wie im Verlauf angezeigt) → Anzahl entfernter Videos
+    :param failed: Angefragter Kanal (normalisiert) → Anzahl nicht entfernter Einträge
+    """
+    removed: dict[str, int] = field(default_factory=dict)
+    failed: dict[str, int] = field(default_factory=dict)
+
+    def failed_for(self, channel: str) -> int:
+        """Fehlgeschlagene Einträge eines angefragten Kanals (Name oder URL wie übergeben)."""
+        return self.failed.get(_purge_key(channel), 0)
 
-        match = try_match_element(block, rules)
-        if not match:
-            return False
 
-        if click_remove_from_history(driver, block, current_name):
-            deleted_count += 1
+def purge_channels(
+        driver: WebDriver,
+        channels: Iterable[str],
+        config: Optional[RemovalConfig] = None,
+) -> PurgeResult:
+    """
+    Entfernt alle Verlaufseinträge der angegebenen Kanäle in einem einzigen Durchlauf.
+
+    Der Verlauf wird einmal gelesen (jeder Eintrag einzeln, auch wiederholt angesehene
+    Videos), die Treffer werden danach gesammelt über die RemovalEngine entfernt.
+    Kanäle auf der Whitelist oder der Undo-Liste und Titel, auf die ein Whitelist-Pattern
+    passt, werden nicht angetastet.
+
+    :param driver: Aktiver WebDriver
+    :param channels: Kanalnamen oder Kanal-URLs (Groß-/Kleinschreibung egal)
+    :param config: Tempo/Drosselung (Standard aus den Einstellungen in globals)
+    :return: Entfernte Videos je Kanal und fehlgeschlagene Einträge je angefragtem Kanal
+    """
+    targets = {_purge_key(channel) for channel in channels} - {""}
+    result = PurgeResult()
+    if not targets:
+        return result
+
+    rules: BlockRuleEngine = get_log_rules()
+    matches: list[ScannedVideo] = []
+
+    def collector(video: ScannedVideo) -> bool:
+        if _purge_key(video.channel_name) not in targets and _purge_key(video.channel_url) not in targets:
+            return False
+        if rules.exemption(video.title, video.channel_name) is None:
+            matches.append(video)
         return False
 
-    scroll_and_process(driver, processor)
-    print_result(deleted_count, prefix=channel_name)
+    print(f"[🧹] Bereinige Verlauf von {len(targets)} Kanal/Kanälen in einem Durchlauf ...")
+    scroll_and_process(driver, collector, dedupe="index")
+
+    # Von unten nach oben entfernen, wie bei der Bereinigung nach dem Scan
+    report = RemovalEngine(driver, config or RemovalConfig.from_settings()).remove(matches[::-1])
+
+    # Anzeigename je Kanal – Schreibweisen im Verlauf können abweichen
+    labels: dict[str, str] = {}
+    for outcome in report.outcomes:
+        video = outcome.video
+        if not outcome.removed:
+            print(f"[⚠️] Entfernen fehlgeschlagen bei '{video.channel_name}' ({outcome.status})")
+            for key in {_purge_key(video.channel_name), _purge_key(video.channel_url)} & targets:
+                result.failed[key] = result.failed.get(key, 0) + 1
+            continue
+        label = labels.setdefault(video.channel_name.strip().lower(), video.channel_name)
+        result.removed[label] = result.removed.get(label, 0) + 1
+
+    for channel_name, count in result.removed.items():
+        print_result(count, prefix=channel_name)
+    if not result.removed:
+        print_result(0)
+    if report.outcomes:
+        print(report.summary())
+    return result
+
+
+def _purge_key(channel: Optional[str]) -> str:
+    return (channel or "").strip().lower().rstrip("/")
 
 
 def find_channel_name(driver: WebDriver, video_id: str) -> Optional[str]:
@@ -83,90 +116,62 @@ def find_channel_name(driver: WebDriver, video_id: str) -> Optional[str]:
     """
     result: Optional[str] = None
 
-    def finder(block: WebElement) -> bool:
+    def finder(video: ScannedVideo) -> bool:
         nonlocal result
-        hrefs = block.find_elements(By.CSS_SELECTOR, "a#thumbnail")
-        urls = [href.get_attribute("href") for href in hrefs]
-        if any(video_id in (url or "") for url in urls):
-            try:
-                result = block.find_element(By.CSS_SELECTOR, "ytd-channel-name a").text.strip()
-                return True
-            except NoSuchElementException:
-                return False
+        if video.video_id == video_id:
+            result = video.channel_name
+            return True
         return False
 
     scroll_and_process(driver, finder)
     return result
 
 
-def scroll_and_process(driver: WebDriver, processor: Callable[[WebElement], bool], max_scrolls: int = 50) -> None:
+def scroll_and_process(
+        driver: WebDriver,
+        processor: Callable[[ScannedVideo], bool],
+        max_scrolls: int = 50,
+        dedupe: str = "video_id",
+) -> None:
     """
-    Scrollt durch die Verlaufseite und ruft eine Callback-Funktion für jeden neuen Block auf.
+    Scrollt durch die Verlaufseite und ruft eine Callback-Funktion für jeden neuen Eintrag auf.
+
+    Je Scroll-Runde werden nur die neu geladenen Einträge mit einem einzigen Script-Aufruf
+    ausgelesen; jedes Video (Video-ID) bzw. mit ``dedupe="index"`` jeder Verlaufseintrag
+    wird genau einmal übergeben.
     """
-    seen: Set[str] = set()
     driver.get("https://www.youtube.com/feed/history")
-    time.sleep(2)
+    scroller = AdaptiveScroller(driver)
+    scroller.wait_ready()
+    cursor = HistoryCursor(driver, dedupe)
 
-    scroll_round: int = 0
     idle_rounds: int = 0
     MAX_IDLE: int = 3
 
     print("[📜] Scanne Verlauf ...")
 
-    while scroll_round < max_scrolls:
-        blocks = driver.find_elements(By.CSS_SELECTOR, "ytd-video-renderer")
-        new_blocks = 0
+    while scroller.stats.rounds < max_scrolls:
+        videos = cursor.next_batch()
 
-        for block in blocks:
-            key = block.get_attribute("outerHTML")
-            if key in seen:
-                continue
-            seen.add(key)
-            new_blocks += 1
-
-            if processor(block):
+        for video in videos:
+            if processor(video):
                 print("[✅] Ziel erreicht – Vorgang abgeschlossen.")
                 return
 
-        if new_blocks == 0:
+        if not videos:
             idle_rounds += 1
             print(f"[⏳] Keine neuen Einträge – Versuch {idle_rounds}/{MAX_IDLE} ...")
         else:
             idle_rounds = 0
-            print(f"[🔍] {new_blocks} neue Blöcke analysiert (gesamt: {len(seen)})")
+            print(f"[🔍] {len(videos)} neue Blöcke analysiert (gesamt: {len(cursor)})")
 
-        if idle_rounds >= MAX_IDLE:
+        if idle_rounds >= MAX_IDLE or (not videos and scroller.at_end):
             print("[🛑] Keine neuen Inhalte mehr – Abbruch.")
             break
 
-        if blocks:
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'end'});", blocks[-1])
-        time.sleep(2.0)
-        scroll_round += 1
-
-
-def click_remove_from_history(driver: WebDriver, block: WebElement, channel_name: str) -> bool:
-    """
-    Klickt den Button „Aus Verlauf entfernen“ im angegebenen Block.
+        scroller.step()
 
-    :param driver: Aktiver WebDriver
-    :param block: DOM-Element mit dem Zielvideo
-    :param channel_name: Kanalname für Logging
-    :return: True bei Erfolg, sonst False
-    """
-    try:
-        button: WebElement = block.find_element(By.CSS_SELECTOR, 'button[aria-label="Remove from watch history"]')
-        driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", block)
-        time.sleep(0.5)
-        WebDriverWait(block.parent, 5).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[aria-label="Remove from watch history"]'))
-        )
-        ActionChains(block.parent).move_to_element(button).click().perform()
-        print(f"[🗑️] Video von Kanal '{channel_name}' wurde entfernt.")
-        return True
-    except Exception as e:
-        print(f"[⚠️] Entfernen fehlgeschlagen bei '{channel_name}': {e}")
-        return False
+    print(scroller.report())
 
 
 def print_result(count: int, prefix: str = "") -> None:
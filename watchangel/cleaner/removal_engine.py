@@ -0,0 +1,180 @@
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+import watchangel.globals as app_globals
+from watchangel.model.scanned_video import ScannedVideo
+
+# Klickt „Aus Verlauf entfernen“ für mehrere Einträge direkt in der Seite und bestätigt
+# jede Entfernung daran, dass der Knoten verschwindet (oder als entfernt markiert wird).
+# Geprüft wird nur nach dem Klick auf den jeweiligen Knoten (clickedBefore: in einem früheren
+# Versuch geklickt) – verborgene oder getrennte, nie geklickte Knoten gelten nicht als entfernt.
+# Ergebnis je Element: "removed", "detached", "no_button", "timeout" oder "error: …".
+REMOVE_BATCH_JS = """
+const [nodes, clickedBefore, clickIntervalMs, confirmTimeoutMs, buttonSelector] = arguments;
+const done = arguments[arguments.length - 1];
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+const gone = (node) => !node.isConnected || node.hasAttribute('is-dismissed');
+
+(async () => {
+    const status = nodes.map(() => null);
+    for (let i = 0; i < nodes.length; i++) {
+        const node = nodes[i];
+        try {
+            if (clickedBefore[i] && gone(node)) {
+                status[i] = 'removed';
+                continue;
+            }
+            if (!node.isConnected) {
+                status[i] = 'detached';
+                continue;
+            }
+            const button = node.querySelector(buttonSelector);
+            if (!button) {
+                status[i] = 'no_button';
+                continue;
+            }
+            button.click();
+        } catch (e) {
+            status[i] = 'error: ' + e;
+        }
+        if (clickIntervalMs) await sleep(clickIntervalMs);
+    }
+    const deadline = performance.now() + confirmTimeoutMs;
+    while (status.some((s) => s === null) && performance.now() < deadline) {
+        nodes.forEach((node, i) => { if (status[i] === null && gone(node)) status[i] = 'removed'; });
+        await sleep(50);
+    }
+    done(status.map((s) => s === null ? 'timeout' : s));
+})().catch((e) => done(nodes.map(() => 'error: ' + e)));
+"""
+
+REMOVE_BUTTON_SELECTOR = 'button[aria-label="Remove from watch history"]'
+
+# Ergebnisse, die REMOVE_BATCH_JS nur nach einem Klick auf den Knoten meldet
+CLICKED_STATUSES = ("removed", "timeout")
+
+
+@dataclass
+class RemovalConfig:
+    """
+    Tempo der Verlaufsbereinigung – gegen YouTubes Drosselung abwägen.
+
+    :param batch_size: Einträge je Script-Aufruf
+    :param click_interval: Pause zwischen zwei Klicks innerhalb eines Batches (Sekunden)
+    :param batch_delay: Pause zwischen zwei Batches (Sekunden)
+    :param confirm_timeout: Wartezeit auf das Verschwinden der Knoten je Batch (Sekunden)
+    :param max_retries: Wiederholungen für fehlgeschlagene Einträge
+    """
+    batch_size: int = 10
+    click_interval: float = 0.15
+    batch_delay: float = 1.0
+    confirm_timeout: float = 5.0
+    max_retries: int = 2
+
+    @classmethod
+    def from_settings(cls) -> "RemovalConfig":
+        """Batchgröße und Pause aus den Einstellungen in globals (``--removal-batch``/``--removal-delay``)."""
+        return cls(batch_size=app_globals.REMOVAL_BATCH_SIZE, batch_delay=app_globals.REMOVAL_BATCH_DELAY)
+
+
+@dataclass
+class RemovalOutcome:
+    """Ergebnis für einen einzelnen Verlaufseintrag."""
+    video: ScannedVideo
+    status: str = "pending"
+    attempts: int = 0
+    clicked: bool = False
+
+    @property
+    def removed(self) -> bool:
+        return self.status == "removed"
+
+
+@dataclass
+class RemovalReport:
+    """Ergebnis eines Bereinigungslaufs mit Durchsatz."""
+    outcomes: list[RemovalOutcome] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def removed(self) -> list[RemovalOutcome]:
+        return [outcome for outcome in self.outcomes if outcome.removed]
+
+    @property
+    def failed(self) -> list[RemovalOutcome]:
+        return [outcome for outcome in self.outcomes if not outcome.removed]
+
+    @property
+    def items_per_second(self) -> float:
+        return len(self.removed) / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        return (f"[📈] {len(self.removed)}/{len(self.outcomes)} entfernt in {self.seconds:.1f}s "
+                f"({self.items_per_second:.1f}/s, {len(self.failed)} fehlgeschlagen)")
+
+
+class RemovalEngine:
+    """
+    Entfernt Verlaufseinträge in Batches über ein Seitenskript statt einzeln per WebDriver.
+
+    Je Batch ein Script-Aufruf: Klicks mit ``click_interval`` Abstand, danach Bestätigung über
+    das Verschwinden der Knoten. Nur fehlgeschlagene Einträge werden erneut versucht.
+    """
+
+    def __init__(self, driver: WebDriver, config: Optional[RemovalConfig] = None) -> None:
+        self.driver = driver
+        self.config = config or RemovalConfig()
+
+    def remove(self, videos: Sequence[ScannedVideo]) -> RemovalReport:
+        """
+        :param videos: Zu entfernende Einträge (mit DOM-Element), in Klickreihenfolge
+        :return: RemovalReport mit Ergebnis je Eintrag
+        """
+        config = self.config
+        started = time.perf_counter()
+        report = RemovalReport([RemovalOutcome(video) for video in videos if video.element is not None])
+        report.outcomes += [RemovalOutcome(video, "no_element") for video in videos if video.element is None]
+
+        self.driver.set_script_timeout(
+            config.batch_size * config.click_interval + config.confirm_timeout + 10
+        )
+
+        pending = [outcome for outcome in report.outcomes if outcome.status == "pending"]
+        for attempt in range(config.max_retries + 1):
+            if not pending:
+                break
+            if attempt:
+                print(f"[🔁] Wiederhole {len(pending)} fehlgeschlagene Einträge (Versuch {attempt + 1}) ...")
+
+            for start in range(0, len(pending), config.batch_size):
+                if start:
+                    time.sleep(config.batch_delay)
+                self._run_batch(pending[start:start + config.batch_size])
+
+            pending = [outcome for outcome in pending if not outcome.removed]
+            if pending:
+                time.sleep(config.batch_delay)
+
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def _run_batch(self, batch: list[RemovalOutcome]) -> None:
+        try:
+            statuses = self.driver.execute_async_script(
+                REMOVE_BATCH_JS,
+                [outcome.video.element for outcome in batch],
+                [outcome.clicked for outcome in batch],
+                int(self.config.click_interval * 1000),
+                int(self.config.confirm_timeout * 1000),
+                REMOVE_BUTTON_SELECTOR,
+            )
+        except WebDriverException as e:
+            statuses = [f"error: {e.msg or type(e).__name__}"] * len(batch)
+
+        for outcome, status in zip(batch, statuses):
+            outcome.attempts += 1
+            outcome.status = status
+            outcome.clicked = outcome.clicked or status in CLICKED_STATUSES
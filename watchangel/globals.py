@@ -1 +1,9 @@
-VERBOSE: bool = False
\ No newline at end of file
+VERBOSE: bool = False
+
+# Verlauf lesen über "dom" (gerenderte Seite), "data" (ytInitialData + Fortsetzungen) oder
+# "capture" (mitgeschnittene Netzwerkantworten der Seite); DOM jeweils als Rückfall
+READER_MODE: str = "dom"
+
+# Verlaufsbereinigung: Einträge je Batch und Pause zwischen Batches (Sekunden)
+REMOVAL_BATCH_SIZE: int = 10
+REMOVAL_BATCH_DELAY: float = 1.0
@@ -1,35 +1,80 @@
 import argparse
+from functools import partial
 from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.chrome.webdriver import WebDriver
 
+import watchangel.globals as app_globals
+from watchangel.blocker.actions import reverify_channels
+from watchangel.blocker.worker_pool import BlockingPool, ChannelJob, cloned_profile_factory
+from watchangel.browser.driver import DRIVER_PROFILES, DriverProfile, create_driver, driver_profile
+from watchangel.browser.supervisor import BrowserSupervisor
+from watchangel.rules import instrumentation
 from watchangel.rules.undo_handler import apply_undo_channels_from_log
+from watchangel.utils.paths import rule_stats_path
 from watchangel.run.watch_loop_run import run_watch_loop
 from watchangel.run.main_clean_run import run_cleanup_pipeline
 
 
-def create_driver(profile_dir: Path) -> WebDriver:
-    options = webdriver.ChromeOptions()
-    options.add_argument(f"user-data-dir={str(profile_dir)}")
-    return webdriver.Chrome(options=options)
+def run_block_list(block_list: Path, profile_path: Path, workers: int, profile: DriverProfile) -> None:
+    """Blockiert alle Kanäle aus einer Datei über den Worker-Pool."""
+    urls = [line.strip() for line in block_list.read_text(encoding="utf-8").splitlines() if line.strip()]
+    print(f"[👮] Blockiere {len(urls)} Kanäle mit {workers} Worker(n) ...")
+    pool = BlockingPool(cloned_profile_factory(profile_path, partial(create_driver, profile=profile)), workers=workers)
+    report = pool.run(ChannelJob("block", url) for url in urls)
+    print(report.summary())
 
 
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--cleanup", action="store_true", help="Watch History von geblockten Kanälen bereinigen")
+    parser.add_argument("--profile-rules", action="store_true",
+                        help="Laufzeit und Treffer je Regelstufe messen (Ausgabe nach dem Cleanup bzw. per SIGUSR1)")
+    parser.add_argument("--reader", choices=("dom", "data", "capture"), default=app_globals.READER_MODE,
+                        help="Verlauf über gerenderte Seite (dom), Strukturdaten (data) oder "
+                             "mitgeschnittene Netzwerkantworten (capture) lesen")
+    parser.add_argument("--removal-batch", type=int, default=app_globals.REMOVAL_BATCH_SIZE,
+                        help="Verlaufseinträge je Entfern-Batch")
+    parser.add_argument("--removal-delay", type=float, default=app_globals.REMOVAL_BATCH_DELAY,
+                        help="Pause zwischen Entfern-Batches in Sekunden (gegen Drosselung)")
+    parser.add_argument("--block-list", type=Path,
+                        help="Kanal-URLs (eine pro Zeile) vor dem Start parallel blockieren")
+    parser.add_argument("--block-workers", type=int, default=2,
+                        help="Anzahl paralleler Browser-Sitzungen für --block-list")
+    parser.add_argument("--browser", choices=tuple(DRIVER_PROFILES), default="full",
+                        help="full: sichtbares Chrome; lean: headless, ohne Bilder, Medien und Werbung")
+    parser.add_argument("--keep-images", action="store_true",
+                        help="Im Lean-Modus trotzdem Bilder laden")
+    parser.add_argument("--reverify-days", type=float,
+                        help="Blockierte Kanäle erneut im Browser prüfen, wenn die letzte Prüfung älter ist")
     args = parser.parse_args()
 
+    app_globals.READER_MODE = args.reader
+    app_globals.REMOVAL_BATCH_SIZE = max(1, args.removal_batch)
+    app_globals.REMOVAL_BATCH_DELAY = max(0.0, args.removal_delay)
+
+    if args.profile_rules:
+        instrumentation.enable()
+        if instrumentation.install_dump_signal(rule_stats_path):
+            print("[📊] Regel-Statistik aktiv – Ausgabe mit: kill -USR1 <pid>")
+
     print("[🚀] Starte WatchAngel...")
     profile_path = Path.home() / ".ytwatcher"
-    driver = create_driver(profile_path)
+    browser_profile = driver_profile(args.browser, keep_images=args.keep_images,
+                                     capture_network=args.reader == "capture")
+
+    if args.block_list:
+        # Vor dem Hauptbrowser: die Worker arbeiten auf Kopien des noch ungesperrten Profils
+        run_block_list(args.block_list, profile_path, args.block_workers, browser_profile)
+
+    supervisor = BrowserSupervisor(partial(create_driver, profile_path, browser_profile))
 
-    apply_undo_channels_from_log(driver)
+    supervisor.run(apply_undo_channels_from_log)
+    if args.reverify_days is not None:
+        supervisor.run(lambda driver: reverify_channels(driver, args.reverify_days))
 
-    deleted = run_cleanup_pipeline(driver)
+    deleted = supervisor.run(run_cleanup_pipeline)
     print(f"[🧼] Insgesamt {deleted} Video(s) bereinigt.")
 
-    run_watch_loop(driver)
-    driver.quit()
+    run_watch_loop(supervisor)
 
 
 if __name__ == "__main__":
@@ -1,22 +1,80 @@
-from watchangel.rules.block_rules import BlockRuleEngine
+from typing import Optional, Sequence
+
+from watchangel.rules.block_rules import BlockDecision, BlockRuleEngine
 from watchangel.model.scanned_video import ScannedVideo
 from watchangel.model.matched_video import MatchedVideo
+from watchangel.storage.decision_cache import DecisionCache
 
 
-def match_video(video: ScannedVideo, rules: BlockRuleEngine) -> MatchedVideo | None:
+def match_video(video: ScannedVideo, rules: BlockRuleEngine, cache: Optional[DecisionCache] = None) -> MatchedVideo | None:
     """
     Bewertet ein Videoobjekt mit der BlockRuleEngine.
 
     :param video: Das erkannte Video
     :param rules: Regelwerk zur Bewertung
+    :param cache: Optionaler Entscheidungs-Cache (video_id + Regelstand)
     :return: Matching-Ergebnis oder None
     """
-    decision = rules.explain_block_decision(
-        title=video.title,
-        channel_name=video.channel_name,
-        video_url=f"https://www.youtube.com/watch?v={video.video_id}",
-    )
+    decision = None
+    if cache is not None:
+        cached = cache.get(video.video_id, rules.fingerprint)
+        if cached is not None:
+            decision = rules.refresh_cached_decision(cached, video.channel_name)
+
+    if decision is None:
+        decision = rules.explain_block_decision(
+            title=video.title,
+            channel_name=video.channel_name,
+            video_url=_video_url(video),
+        )
+        if cache is not None:
+            cache.put(video.video_id, rules.fingerprint, decision)
 
     if decision.block:
         return MatchedVideo(block=video, decision=decision)
     return None
+
+
+def match_videos(
+        videos: Sequence[ScannedVideo],
+        rules: BlockRuleEngine,
+        cache: Optional[DecisionCache] = None,
+) -> list[MatchedVideo]:
+    """
+    Bewertet viele Videos in einem Rutsch (dedupliziert, ggf. parallel).
+
+    Mit Cache werden nur Videos neu bewertet, die unter dem aktuellen Regelstand
+    noch nicht entschieden wurden.
+
+    :param videos: Erkannte Videos
+    :param rules: Regelwerk zur Bewertung
+    :param cache: Optionaler Entscheidungs-Cache (video_id + Regelstand)
+    :return: Blockwürdige Videos in Eingabereihenfolge
+    """
+    decisions: dict[str, BlockDecision] = {}
+    if cache is not None:
+        channels = {video.video_id: video.channel_name for video in videos}
+        for video_id, cached in cache.get_many(channels, rules.fingerprint).items():
+            refreshed = rules.refresh_cached_decision(cached, channels[video_id])
+            if refreshed is not None:
+                decisions[video_id] = refreshed
+
+    pending = [video for video in videos if video.video_id not in decisions]
+    fresh = rules.explain_block_decisions([
+        (video.title, video.channel_name, _video_url(video)) for video in pending
+    ])
+    new_decisions = {video.video_id: decision for video, decision in zip(pending, fresh)}
+    decisions.update(new_decisions)
+
+    if cache is not None:
+        cache.put_many(new_decisions, rules.fingerprint)
+
+    return [
+        MatchedVideo(block=video, decision=decisions[video.video_id])
+        for video in videos
+        if decisions[video.video_id].block
+    ]
+
+
+def _video_url(video: ScannedVideo) -> str:
+    return f"https://www.youtube.com/watch?v={video.video_id}"
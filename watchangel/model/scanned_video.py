@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 from selenium.webdriver.remote.webelement import WebElement
 
 
@@ -7,9 +8,14 @@ class ScannedVideo:
     """
     Repräsentiert ein einzelnes Videoelement aus dem YouTube-Verlauf.
     Enthält Metadaten zur späteren Bewertung und Entfernung.
+
+    Aus Strukturdaten gelesene Einträge haben kein DOM-Element; es wird bei Bedarf
+    (z. B. zum Entfernen) über einen DOM-Durchlauf nachgetragen.
     """
     title: str
     channel_name: str
     channel_url: str
     video_id: str
-    element: WebElement
+    element: Optional[WebElement] = None
+    # Stabile Knotennummer auf der Seite (-1 = unbekannt)
+    index: int = -1
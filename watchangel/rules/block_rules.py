@@ -1,17 +1,47 @@
+import hashlib
 import json
+import os
+import pickle
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import ClassVar, Iterable, Optional
-
-from langdetect import detect, LangDetectException
+from functools import cached_property
+from pathlib import Path
+from typing import ClassVar, Iterable, Mapping, Optional, Sequence, Union
 
 from watchangel.blocker.constants import COMMON_MISDETECTIONS_FOR_ENGLISH
+from watchangel.rules import instrumentation
+from watchangel.rules.compiled_blocklist import ChannelUnion, CompiledChannelSet, load_compiled
+from watchangel.rules.instrumentation import RuleStats
+from watchangel.rules.language import LanguageDetector, language_detector
+from watchangel.rules.pattern_matcher import PatternMatcher, compile_matcher, normalize_entry
+from watchangel.rules.scripts import parse_script_rules, script_profile
+from watchangel.storage.channel_store import ChannelStore, get_channel_store
 from watchangel.utils.config_loader import load_lines
-from watchangel.utils.paths import log_path, wl_path, wl_patterns_path, undo_path
+from watchangel.utils.paths import (
+    compiled_blocklist_path, compiled_whitelist_path, wl_path, wl_patterns_path, undo_path,
+)
 from watchangel.globals import VERBOSE
 
 EMOJI_PATTERN = re.compile(r"[\U00010000-\U0010ffff]", flags=re.UNICODE)
 
+# Ab dieser Anzahl eindeutiger Videos lohnt sich der Start eines Prozess-Pools
+PARALLEL_MIN_ITEMS = 500
+# Obergrenze für gemerkte Kanalprüfungen je Regelstand
+CHANNEL_MEMO_SIZE = 20_000
+
+VideoKey = tuple[str, str, str]
+
+# Kanalmengen, die direkt abgefragt statt in ein Set kopiert werden
+ChannelLookup = Union[set[str], ChannelStore, CompiledChannelSet, ChannelUnion]
+_LOOKUP_TYPES = (ChannelStore, CompiledChannelSet, ChannelUnion)
+
+# Bei Änderungen an der Entscheidungslogik erhöhen – invalidiert persistente Caches
+DECISION_LOGIC_VERSION = 1
+
+EXPLICIT_BLOCK_REASON = "explicitly blocked channel"
+
 
 @dataclass
 class BlockDecision:
@@ -31,19 +61,37 @@ class BlockRuleEngine:
             self,
             keywords: Iterable[str],
             phrases: Iterable[str],
-            block_channels: Iterable[str],
-            whitelist_channels: Iterable[str] = (),
+            block_channels: Union[Iterable[str], ChannelLookup],
+            whitelist_channels: Union[Iterable[str], ChannelLookup] = (),
             whitelist_patterns: Iterable[str] = (),
             undo_channels: Iterable[str] = (),
             allowed_languages: Iterable[str] = ("de", "en", "ja"),
+            script_rules: Optional[Mapping[str, float]] = None,
     ) -> None:
-        self.keywords = {kw.lower() for kw in keywords}
-        self.phrases = {ph.lower() for ph in phrases}
-        self.block_channels = {ch.lower() for ch in block_channels}
-        self.whitelist_channels = {wl.lower() for wl in whitelist_channels}
-        self.whitelist_patterns = [p.lower() for p in whitelist_patterns]
+        keyword_list = _ordered_entries(keywords)
+        phrase_list = _ordered_entries(phrases)
+
+        self.keywords = set(keyword_list)
+        self.phrases = set(phrase_list)
+        # Kanal-Datenbank und kompilierte Listen werden direkt abgefragt statt in ein Set kopiert
+        self.block_channels: ChannelLookup = _channel_lookup(block_channels)
+        self.whitelist_channels: ChannelLookup = _channel_lookup(whitelist_channels)
+        self.whitelist_patterns = _ordered_entries(whitelist_patterns)
         self.undo_channels = {uc.lower() for uc in undo_channels}
         self.allowed_languages = set(allowed_languages)
+        # Schrift → Anteil, ab dem geblockt wird (z. B. {"cyrillic": 0.5})
+        self.script_rules = dict(script_rules or {})
+        self.language_detector: LanguageDetector = language_detector
+        self._channel_memo: dict[tuple[str, str], bool] = {}
+        # Wird von RulesSnapshot bei jedem Neuaufbau gesetzt
+        self.version: int = 0
+
+        # Ein Automat für Whitelist-Patterns, Phrasen und Keywords (einmal je Regelstand)
+        self.matcher: PatternMatcher = compile_matcher((
+            ("whitelist", tuple(self.whitelist_patterns)),
+            ("phrases", tuple(phrase_list)),
+            ("keywords", tuple(keyword_list)),
+        ))
 
     # ------------------- Initialisierung -------------------
 
@@ -53,28 +101,19 @@ class BlockRuleEngine:
         return cls(
             keywords=load_lines("block_keywords.txt"),
             phrases=load_lines("block_phrases.txt"),
-            block_channels=load_lines("block_channels.txt"),
-            whitelist_channels=load_lines("whitelist_channels.txt"),
+            block_channels=_with_compiled(load_lines("block_channels.txt"), compiled_blocklist_path),
+            whitelist_channels=_with_compiled(load_lines("whitelist_channels.txt"), compiled_whitelist_path),
             whitelist_patterns=load_lines("whitelist_patterns.txt"),
             undo_channels=load_lines("undo_block_channels.txt"),
+            script_rules=parse_script_rules(load_lines("block_scripts.txt")),
         )
 
     @classmethod
-    def from_logs(cls, verbose: bool = VERBOSE) -> "BlockRuleEngine":
-        """Erstellt Instanz aus Logdatei, Whitelist und Undo-Liste."""
-
-        blocked, whitelist, wl_patterns, undo = [], [], [], []
-
-        if log_path.exists():
-            with log_path.open(encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        obj = json.loads(line.strip())
-                        name = obj.get("channel_name", "").strip()
-                        if name:
-                            blocked.append(name)
-                    except json.JSONDecodeError:
-                        continue
+    def from_logs(cls, verbose: bool = VERBOSE, store: Optional[ChannelStore] = None) -> "BlockRuleEngine":
+        """Erstellt Instanz aus Kanal-Datenbank, Whitelist und Undo-Liste."""
+
+        whitelist, wl_patterns, undo = [], [], []
+        store = store or get_channel_store()
 
         if wl_path.exists():
             whitelist = [l.strip() for l in wl_path.read_text(encoding="utf-8").splitlines() if l.strip()]
@@ -83,38 +122,34 @@ class BlockRuleEngine:
         if undo_path.exists():
             undo = [l.strip() for l in undo_path.read_text(encoding="utf-8").splitlines() if l.strip()]
 
-        # ⛔️ Entferne manuell entblockte Channels aus der Logliste
-        blocked = [c for c in blocked if c.lower() not in {u.lower() for u in undo}]
-
+        # Manuell entblockte Kanäle bleiben in der Datenbank (samt URL für das Undo),
+        # werden aber über undo_channels bzw. is_blocked_channel ausgenommen.
         if verbose:
-            print(f"[📄] {len(blocked)} Kanäle aus Logdatei geladen.")
-
-        if undo:
-            undo_set = {u.lower() for u in undo}
-            original_count = len(blocked)
-            blocked = [c for c in blocked if c.lower() not in undo_set]
-            removed = original_count - len(blocked)
-
-            if removed > 0:
-                # Logdatei aktualisieren (nicht abhängig von verbose!)
-                with log_path.open("w", encoding="utf-8") as f:
-                    for c in blocked:
-                        f.write(json.dumps({"channel_name": c}) + "\n")
-
-                if verbose:
-                    print(f"[🧹] {removed} Kanäle aus blocked_channels.log entfernt (manuell entblockt).")
+            print(f"[📄] {len(store)} Kanäle in der Datenbank, {len(undo)} zum Entblocken vorgemerkt.")
 
         return cls(
             keywords=[],
             phrases=[],
-            block_channels=blocked,
-            whitelist_channels=whitelist,
+            block_channels=store,
+            whitelist_channels=_with_compiled(whitelist, compiled_whitelist_path),
             whitelist_patterns=wl_patterns,
             undo_channels=undo,
+            script_rules=parse_script_rules(load_lines("block_scripts.txt")),
         )
 
+    def close(self) -> None:
+        """Gibt die Mappings kompilierter Kanallisten frei (beim Ersetzen des Regelstands)."""
+        for lookup in (self.block_channels, self.whitelist_channels):
+            if isinstance(lookup, (CompiledChannelSet, ChannelUnion)):
+                lookup.close()
+
     # ------------------- Hauptlogik -------------------
 
+    def is_blocked_channel(self, channel_name: str) -> bool:
+        """Gibt zurück, ob ein Kanal geblockt ist und nicht zum Entblocken vorgemerkt wurde."""
+        name = channel_name.strip().lower()
+        return name in self.block_channels and name not in self.undo_channels
+
     def is_blockworthy(self, title: str, channel_name: str, video_url: str = "") -> bool:
         """Gibt zurück, ob das Video blockiert werden soll."""
         return self.explain_block_decision(title, channel_name, video_url).block
@@ -122,58 +157,278 @@ class BlockRuleEngine:
     def explain_block_decision(self, title: str, channel_name: str, video_url: str = "") -> BlockDecision:
         """
         Liefert eine Entscheidung samt Begründung, warum ein Video blockiert wurde.
+
+        Die Stufen laufen in der Reihenfolge von ``_STAGES``; die erste Stufe mit
+        Ergebnis entscheidet. Ist die Instrumentierung aktiv, wird jede Stufe gemessen.
         """
-        name = channel_name.strip().lower()
-        lower_title = title.strip().lower()
+        subject = _Subject(title, channel_name, video_url, instrumentation.current())
+
+        if subject.stats is None:
+            for _, stage in self._STAGES:
+                decision = stage(self, subject)
+                if decision is not None:
+                    return decision
+            return BlockDecision(False, None)
+
+        for name, stage in self._STAGES:
+            start = time.perf_counter()
+            decision = stage(self, subject)
+            subject.stats.record_stage(
+                name, time.perf_counter() - start, decision is not None, bool(decision and decision.block)
+            )
+            if decision is not None:
+                return decision
+        return BlockDecision(False, None)
+
+    def exemption(self, title: str, channel_name: str) -> Optional[BlockDecision]:
+        """
+        Prüft nur die Ausnahmen (Whitelist-Kanal, Whitelist-Pattern, Undo-Liste) – für das
+        Bereinigen ganzer Kanäle, deren Einträge unabhängig von den übrigen Regeln entfernt werden.
+
+        :param title: Videotitel
+        :param channel_name: Kanalname
+        :return: Entscheidung der greifenden Ausnahme oder None
+        """
+        subject = _Subject(title, channel_name, "", instrumentation.current())
+        return self._stage_whitelist(subject) or self._stage_undo(subject)
+
+    # ------------------- Stufen -------------------
 
+    def _stage_mix(self, s: "_Subject") -> Optional[BlockDecision]:
         # 0. Mix-Video
-        if video_url and self.is_mix(title, video_url):
+        if s.video_url and self.is_mix(s.title, s.video_url):
             return BlockDecision(True, "Mix-Video erkannt")
+        return None
 
+    def _stage_whitelist(self, s: "_Subject") -> Optional[BlockDecision]:
         # 1. Whitelist-Kanalname (genau)
-        if name in self.whitelist_channels:
+        if s.name in self.whitelist_channels:
+            if s.stats is not None:
+                # Vor dem Rücksprung zählen – sonst gilt der Eintrag in der Statistik als ungenutzt
+                s.stats.record_rule_matches([s.name])
+                s.stats.record_rule_decision(s.name)
+                self._title_hits(s)
             return BlockDecision(False, "whitelisted")
 
-        # 2. Whitelist-Pattern (entweder im Titel oder Kanalname)
-        for pattern in self.whitelist_patterns:
-            if pattern in name or pattern in lower_title:
+        # 2. Whitelist-Pattern (entweder im Titel oder Kanalname) – ein Durchlauf je Text
+        if self.matcher.has_group("whitelist"):
+            hits = self._title_hits(s) | self.matcher.scan(s.name)
+            pattern = self.matcher.first_match("whitelist", hits)
+            if pattern:
+                if s.stats is not None:
+                    s.stats.record_rule_decision(pattern)
                 return BlockDecision(False, f"whitelisted pattern: {pattern}")
+        return None
 
+    def _stage_undo(self, s: "_Subject") -> Optional[BlockDecision]:
         # 3. Undo
-        if name in self.undo_channels:
+        if s.name in self.undo_channels:
             return BlockDecision(False, "manually unblocked")
+        return None
 
+    def _stage_arabic(self, s: "_Subject") -> Optional[BlockDecision]:
         # 4. Arabisch
-        if self.is_arabic(channel_name):
+        if self._channel_flag("arabic", s.channel_name):
             return BlockDecision(True, "arabic channel name")
-        if self.is_arabic(title):
+        if self.is_arabic(s.title):
             return BlockDecision(True, "arabic title")
-
+        return None
+
+    def _stage_script(self, s: "_Subject") -> Optional[BlockDecision]:
+        # 4b. Schriftregeln aus block_scripts.txt
+        if self.script_rules:
+            script = self.match_script_rule(s.channel_name)
+            if script:
+                return BlockDecision(True, f"{script} channel name")
+            script = self.match_script_rule(s.title)
+            if script:
+                return BlockDecision(True, f"{script} title")
+        return None
+
+    def _stage_language(self, s: "_Subject") -> Optional[BlockDecision]:
         # 5. Sprache
-        if self.is_unsupported_language(channel_name):
+        if self._channel_flag("language", s.channel_name):
             return BlockDecision(True, "unsupported channel language")
-        if self.is_unsupported_language(title):
+        if self.is_unsupported_language(s.title):
             return BlockDecision(True, "unsupported title language")
+        return None
 
+    def _stage_blocklist(self, s: "_Subject") -> Optional[BlockDecision]:
         # 6. Blockliste
-        if name in self.block_channels:
-            return BlockDecision(True, "explicitly blocked channel")
+        if s.name in self.block_channels:
+            return BlockDecision(True, EXPLICIT_BLOCK_REASON)
+        return None
 
+    def _stage_keywords(self, s: "_Subject") -> Optional[BlockDecision]:
         # 7. Keywords/Phrasen im Titel
-        for phrase in self.phrases:
-            if phrase in lower_title:
-                return BlockDecision(True, f"matched phrase: {phrase}")
-        for keyword in self.keywords:
-            if keyword in lower_title:
-                return BlockDecision(True, f"matched keyword: {keyword}")
+        hits = self._title_hits(s)
+        phrase = self.matcher.first_match("phrases", hits)
+        if phrase:
+            if s.stats is not None:
+                s.stats.record_rule_decision(phrase)
+            return BlockDecision(True, f"matched phrase: {phrase}")
+        keyword = self.matcher.first_match("keywords", hits)
+        if keyword:
+            if s.stats is not None:
+                s.stats.record_rule_decision(keyword)
+            return BlockDecision(True, f"matched keyword: {keyword}")
+        return None
+
+    def _title_hits(self, s: "_Subject") -> frozenset[int]:
+        """Scannt den Titel höchstens einmal je Entscheidung."""
+        if s.title_hits is None:
+            s.title_hits = self.matcher.scan(s.lower_title)
+            if s.stats is not None:
+                s.stats.record_rule_matches(self.matcher.labels(s.title_hits))
+        return s.title_hits
+
+    _STAGES: ClassVar[tuple] = (
+        ("mix", _stage_mix),
+        ("whitelist", _stage_whitelist),
+        ("undo", _stage_undo),
+        ("arabic", _stage_arabic),
+        ("script", _stage_script),
+        ("language", _stage_language),
+        ("blocklist", _stage_blocklist),
+        ("keywords", _stage_keywords),
+    )
+
+    def explain_block_decisions(
+            self,
+            videos: Sequence[VideoKey],
+            workers: Optional[int] = None,
+    ) -> list[BlockDecision]:
+        """
+        Bewertet viele Videos auf einmal – Ergebnis wie bei einzelnen explain_block_decision-Aufrufen.
 
-        return BlockDecision(False, None)
+        Identische (Titel, Kanal)-Paare werden nur einmal bewertet, Kanalprüfungen
+        je Kanal nur einmal. Große Mengen werden auf einen Prozess-Pool verteilt.
+
+        :param videos: Folge von (title, channel_name, video_url)
+        :param workers: Anzahl Prozesse (None = CPU-Anzahl, 1 = seriell)
+        :return: Entscheidungen in Eingabereihenfolge
+        """
+        unique: dict[tuple[str, str, str], VideoKey] = {}
+        keys: list[tuple[str, str, str]] = []
+        for title, channel_name, video_url in videos:
+            key = (title, channel_name, self._url_class(video_url))
+            unique.setdefault(key, (title, channel_name, video_url))
+            keys.append(key)
+
+        # Nach Kanal sortiert, damit Kanalprüfungen im selben Prozess wiederverwendet werden
+        pending = sorted(unique, key=lambda k: k[1])
+        workers = workers or os.cpu_count() or 1
+        if instrumentation.current() is not None:
+            # Messwerte aus Worker-Prozessen gingen verloren
+            workers = 1
+
+        if workers > 1 and len(pending) >= PARALLEL_MIN_ITEMS:
+            decided = self._explain_parallel([unique[k] for k in pending], workers)
+        else:
+            decided = [self.explain_block_decision(*unique[k]) for k in pending]
+
+        results = dict(zip(pending, decided))
+        return [results[key] for key in keys]
+
+    def _explain_parallel(self, items: list[VideoKey], workers: int) -> list[BlockDecision]:
+        chunk_size = max(1, len(items) // (workers * 4))
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(pickle.dumps(self),),
+        ) as pool:
+            decided: list[BlockDecision] = []
+            for part in pool.map(_explain_chunk, chunks):
+                decided.extend(part)
+        return decided
+
+    def _url_class(self, video_url: str) -> str:
+        """Reduziert die URL auf das, was die Entscheidung beeinflusst (für die Deduplizierung)."""
+        if not video_url:
+            return ""
+        return "mix" if self._is_mix_url(video_url) else "plain"
+
+    def _channel_flag(self, check: str, channel_name: str) -> bool:
+        """Merkt sich reine Kanalprüfungen, die sonst für jedes Video desselben Kanals laufen."""
+        key = (check, channel_name)
+        flag = self._channel_memo.get(key)
+        if flag is None:
+            if check == "arabic":
+                flag = self.is_arabic(channel_name)
+            else:
+                flag = self.is_unsupported_language(channel_name)
+            if len(self._channel_memo) >= CHANNEL_MEMO_SIZE:
+                self._channel_memo.clear()
+            self._channel_memo[key] = flag
+        return flag
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        Inhaltsbasierter Schlüssel des Regelstands – stabil über Neustarts hinweg.
+
+        Eine live abgefragte Kanal-Datenbank fließt nicht ein, damit nicht jeder neu
+        geblockte Kanal alle gespeicherten Entscheidungen verwirft; siehe
+        :meth:`refresh_cached_decision`.
+        """
+        parts = {
+            "logic": DECISION_LOGIC_VERSION,
+            "keywords": sorted(self.keywords),
+            "phrases": sorted(self.phrases),
+            "whitelist_channels": _lookup_fingerprint(self.whitelist_channels),
+            "whitelist_patterns": self.whitelist_patterns,
+            "undo_channels": sorted(self.undo_channels),
+            "allowed_languages": sorted(self.allowed_languages),
+            "script_rules": sorted(self.script_rules.items()),
+            "block_channels": _lookup_fingerprint(self.block_channels),
+        }
+        return hashlib.sha1(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def refresh_cached_decision(self, decision: BlockDecision, channel_name: str) -> Optional[BlockDecision]:
+        """
+        Prüft eine gespeicherte Entscheidung gegen den aktuellen Stand der Kanal-Datenbank.
+
+        Nur Entscheidungen, die in der Reihenfolge nach der Blockliste gefallen sind
+        (Phrasen, Keywords, keine Regel), können sich durch neu geblockte Kanäle ändern.
+
+        :return: Gültige Entscheidung oder None, wenn neu bewertet werden muss
+        """
+        if not _is_live(self.block_channels):
+            return decision
+
+        name = channel_name.strip().lower()
+        if decision.reason == EXPLICIT_BLOCK_REASON:
+            return decision if name in self.block_channels else None
+        if decision.reason is None or decision.reason.startswith(("matched phrase:", "matched keyword:")):
+            if name in self.block_channels:
+                return BlockDecision(True, EXPLICIT_BLOCK_REASON)
+        return decision
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_channel_memo"] = {}
+        return state
 
     # ------------------- Regel-Helfer -------------------
 
     def is_arabic(self, text: str) -> bool:
         """Erkennt arabische Schriftzeichen im Text."""
-        return any("\u0600" <= ch <= "\u06FF" or "\u0750" <= ch <= "\u077F" for ch in text)
+        return script_profile(text).count("arabic") > 0
+
+    def match_script_rule(self, text: str) -> Optional[str]:
+        """
+        Gibt die erste Schrift zurück, deren Anteil im Text die konfigurierte Schwelle übersteigt.
+
+        :param text: Titel oder Kanalname
+        :return: Name der Schrift oder None
+        """
+        profile = script_profile(text)
+        for script, threshold in self.script_rules.items():
+            if profile.share(script) > threshold:
+                return script
+        return None
 
     def is_unsupported_language(self, text: str) -> bool:
         cleaned = self.strip_emojis(text)
@@ -183,17 +438,18 @@ class BlockRuleEngine:
         if len(letters_only) < 5 or len(words) < 3:
             return False
 
-        try:
-            lang = detect(cleaned)
-            if VERBOSE:
-                print(f"[🧪] Language detected: {lang} ← {cleaned!r}")
-            # Wenn fälschlich Somali etc. erkannt wurde, als Englisch behandeln
-            if lang in COMMON_MISDETECTIONS_FOR_ENGLISH and "a" in cleaned.lower():
-                lang = "en"
-            return lang not in self.allowed_languages
-        except LangDetectException:
+        # Vorfilter + Cache: langdetect läuft nur für noch unbekannte, uneindeutige Texte
+        lang = self.language_detector.detect(cleaned)
+        if lang is None:
             return self.is_arabic(text)
 
+        if VERBOSE:
+            print(f"[🧪] Language detected: {lang} ← {cleaned!r}")
+        # Wenn fälschlich Somali etc. erkannt wurde, als Englisch behandeln
+        if lang in COMMON_MISDETECTIONS_FOR_ENGLISH and "a" in cleaned.lower():
+            lang = "en"
+        return lang not in self.allowed_languages
+
     def is_mix(self, title: str, video_url: str) -> bool:
         """
         Erkennt YouTube-Mix-Videos anhand von URL oder Titelstruktur.
@@ -205,12 +461,80 @@ class BlockRuleEngine:
                 or "playlist" in title_lc
                 or "best of" in title_lc
                 or "youTube mix" in title_lc
-                or "list=rd" in video_url.lower()
-                or "list=ul" in video_url.lower()
-                or "/mix/" in video_url.lower()
+                or self._is_mix_url(video_url)
         )
 
+    @staticmethod
+    def _is_mix_url(video_url: str) -> bool:
+        url_lc = video_url.lower()
+        return "list=rd" in url_lc or "list=ul" in url_lc or "/mix/" in url_lc
+
     @staticmethod
     def strip_emojis(text: str) -> str:
         """Entfernt Emojis (Unicode 10000+)."""
         return EMOJI_PATTERN.sub("", text)
+
+
+class _Subject:
+    """Eingaben und Zwischenergebnisse einer einzelnen Entscheidung."""
+    __slots__ = ("title", "channel_name", "video_url", "name", "lower_title", "title_hits", "stats")
+
+    def __init__(self, title: str, channel_name: str, video_url: str, stats: Optional[RuleStats]) -> None:
+        self.title = title
+        self.channel_name = channel_name
+        self.video_url = video_url
+        self.name = channel_name.strip().lower()
+        self.lower_title = title.strip().lower()
+        self.title_hits: Optional[frozenset[int]] = None
+        self.stats = stats
+
+
+# ------------------- Prozess-Pool -------------------
+
+_worker_engine: Optional[BlockRuleEngine] = None
+
+
+def _init_worker(snapshot: bytes) -> None:
+    global _worker_engine
+    _worker_engine = pickle.loads(snapshot)
+
+
+def _explain_chunk(items: list[VideoKey]) -> list[BlockDecision]:
+    assert _worker_engine is not None
+    return [_worker_engine.explain_block_decision(*item) for item in items]
+
+
+def _channel_lookup(channels: Union[Iterable[str], ChannelLookup]) -> ChannelLookup:
+    if isinstance(channels, _LOOKUP_TYPES):
+        return channels
+    return {ch.lower() for ch in channels}
+
+
+def _with_compiled(channels: Iterable[str], path: Path) -> Union[Iterable[str], ChannelUnion]:
+    """Ergänzt eine Kanalliste um ihre kompilierte Fassung, sofern diese existiert."""
+    compiled = load_compiled(path)
+    if compiled is None:
+        return channels
+    return ChannelUnion({ch.lower() for ch in channels}, compiled)
+
+
+def _lookup_fingerprint(lookup: ChannelLookup):
+    if isinstance(lookup, ChannelStore):
+        return "store"
+    if isinstance(lookup, CompiledChannelSet):
+        return f"compiled:{lookup.digest}"
+    if isinstance(lookup, ChannelUnion):
+        return [_lookup_fingerprint(part) for part in lookup.parts]
+    return sorted(lookup)
+
+
+def _is_live(lookup: ChannelLookup) -> bool:
+    """True, wenn die Kanalmenge eine live abgefragte Datenbank enthält."""
+    if isinstance(lookup, ChannelUnion):
+        return any(_is_live(part) for part in lookup.parts)
+    return isinstance(lookup, ChannelStore)
+
+
+def _ordered_entries(entries: Iterable[str]) -> list[str]:
+    """Normalisiert Regeleinträge und entfernt Duplikate unter Beibehaltung der Reihenfolge."""
+    return list(dict.fromkeys(e for e in (normalize_entry(entry) for entry in entries) if e))
@@ -0,0 +1,229 @@
+"""
+Kompaktes, per mmap gelesenes Kanalverzeichnis für sehr große Block- und Whitelists.
+
+Dateiaufbau (Little Endian)::
+
+    Header   magic "WABL", version (I), count (Q), bloom_bits (Q), bloom_k (I), sha1 (20s)
+    Bloom    bloom_bits / 8 Bytes
+    Offsets  (count + 1) × Q – Start jedes Eintrags im Datenbereich
+    Daten    UTF-8 der kleingeschriebenen Kanalnamen, bytewise sortiert, ohne Trenner
+
+Abfragen prüfen zuerst den Bloom-Filter (die meisten Kanäle stehen nicht auf der
+Liste) und suchen dann binär in der sortierten Tabelle – ohne die Liste in den
+Python-Heap zu laden.
+
+Aufbau::
+
+    python -m watchangel.rules.compiled_blocklist config/block_channels.txt import/*.txt
+    python -m watchangel.rules.compiled_blocklist --whitelist
+"""
+import argparse
+import hashlib
+import mmap
+import struct
+import weakref
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+from watchangel.utils.paths import CONFIG_DIR, compiled_blocklist_path, compiled_whitelist_path
+
+MAGIC = b"WABL"
+VERSION = 1
+_HEADER = struct.Struct("<4sIQQI20s")
+_OFFSET = struct.Struct("<Q")
+_OFFSET_PAIR = struct.Struct("<QQ")
+
+
+# Offene Mappings – build_blocklist schließt sie, bevor es die Datei ersetzt
+_open_sets: "weakref.WeakSet[CompiledChannelSet]" = weakref.WeakSet()
+
+
+def _normalize(name: str) -> bytes:
+    return name.strip().lower().encode("utf-8")
+
+
+def _bloom_positions(key: bytes, bits: int, k: int) -> Iterator[int]:
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    for i in range(k):
+        yield (h1 + i * h2) % bits
+
+
+class CompiledChannelSet:
+    """
+    Schreibgeschützte Kanalmenge aus einer kompilierten Datei (siehe Modulbeschreibung).
+
+    Unterstützt ``in``, ``len()`` und Iteration; wird beim Pickeln nur über den Pfad übertragen.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, bloom_bits, bloom_k, digest = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"Keine kompilierte Kanalliste (Version {VERSION}): {path}")
+
+        self._count = count
+        self._bloom_bits = bloom_bits
+        self._bloom_k = bloom_k
+        self.digest = digest.hex()
+        self._bloom_base = _HEADER.size
+        self._offset_base = self._bloom_base + bloom_bits // 8
+        self._data_base = self._offset_base + (count + 1) * _OFFSET.size
+        _open_sets.add(self)
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        key = _normalize(name)
+        mm = self._mm
+
+        if self._bloom_k:
+            base = self._bloom_base
+            for pos in _bloom_positions(key, self._bloom_bits, self._bloom_k):
+                if not mm[base + (pos >> 3)] & (1 << (pos & 7)):
+                    return False
+
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start, end = _OFFSET_PAIR.unpack_from(mm, self._offset_base + mid * _OFFSET.size)
+            probe = mm[self._data_base + start:self._data_base + end]
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            start, end = _OFFSET_PAIR.unpack_from(self._mm, self._offset_base + i * _OFFSET.size)
+            yield self._mm[self._data_base + start:self._data_base + end].decode("utf-8")
+
+    def close(self) -> None:
+        """Gibt das Mapping frei; weitere Abfragen sind danach nicht mehr möglich."""
+        _open_sets.discard(self)
+        self._mm.close()
+
+    def __getstate__(self) -> dict:
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["path"])
+
+
+class ChannelUnion:
+    """Fasst mehrere Kanalmengen (Set, Datenbank, kompilierte Datei) zu einer Abfrage zusammen."""
+
+    def __init__(self, *parts) -> None:
+        self.parts = parts
+
+    def close(self) -> None:
+        """Schließt die kompilierten Teile; die gemeinsame Kanal-Datenbank bleibt offen."""
+        for part in self.parts:
+            if isinstance(part, CompiledChannelSet):
+                part.close()
+
+    def __contains__(self, name: object) -> bool:
+        return any(name in part for part in self.parts)
+
+    def __len__(self) -> int:
+        # Obergrenze – Überschneidungen der Teile werden nicht abgezogen
+        return sum(len(part) for part in self.parts)
+
+    def __iter__(self) -> Iterator[str]:
+        for part in self.parts:
+            yield from part
+
+
+def load_compiled(path: Path) -> Union[CompiledChannelSet, None]:
+    """Öffnet eine kompilierte Liste, falls vorhanden (fehlerhafte Dateien werden gemeldet)."""
+    if not path.exists():
+        return None
+    try:
+        return CompiledChannelSet(path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"[⚠️] Kompilierte Kanalliste nicht lesbar ({path.name}): {e}")
+        return None
+
+
+def read_channel_names(sources: Iterable[Path]) -> Iterator[str]:
+    """Liest Kanalnamen zeilenweise; leere Zeilen und #-Kommentare werden übersprungen."""
+    for source in sources:
+        with source.open(encoding="utf-8") as f:
+            for line in f:
+                name = line.strip()
+                if name and not name.startswith("#"):
+                    yield name
+
+
+def build_blocklist(names: Iterable[str], output: Path, bloom_bits_per_entry: int = 10) -> int:
+    """
+    Schreibt eine kompilierte Kanalliste (atomar über eine temporäre Datei).
+
+    :param names: Kanalnamen (Groß-/Kleinschreibung und Duplikate egal)
+    :param output: Zieldatei
+    :param bloom_bits_per_entry: Größe des Bloom-Filters (10 ≈ 1 % Fehlalarme, 0 = aus)
+    :return: Anzahl eindeutiger Einträge
+    """
+    keys = sorted({_normalize(name) for name in names} - {b""})
+    count = len(keys)
+
+    bloom_bits = (max(64, count * bloom_bits_per_entry) + 7) // 8 * 8 if bloom_bits_per_entry else 0
+    bloom_k = max(1, round(bloom_bits_per_entry * 0.69)) if bloom_bits else 0
+    bloom = bytearray(bloom_bits // 8)
+    for key in keys if bloom_bits else ():
+        for pos in _bloom_positions(key, bloom_bits, bloom_k):
+            bloom[pos >> 3] |= 1 << (pos & 7)
+
+    digest = hashlib.sha1(b"\n".join(keys)).digest()
+    tmp_path = output.with_suffix(output.suffix + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, count, bloom_bits, bloom_k, digest))
+        f.write(bloom)
+        offset = 0
+        for key in keys:
+            f.write(_OFFSET.pack(offset))
+            offset += len(key)
+        f.write(_OFFSET.pack(offset))
+        for key in keys:
+            f.write(key)
+    # Ein noch gemapptes Ziel lässt sich unter Windows nicht ersetzen
+    for compiled in list(_open_sets):
+        if compiled.path.resolve() == output.resolve():
+            compiled.close()
+    tmp_path.replace(output)
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Kanallisten in das kompakte mmap-Format übersetzen")
+    parser.add_argument("sources", nargs="*", type=Path,
+                        help="Textdateien mit einem Kanalnamen pro Zeile (Standard: config/block_channels.txt)")
+    parser.add_argument("-o", "--output", type=Path, help="Zieldatei (Standard: config/block_channels.wabl)")
+    parser.add_argument("--whitelist", action="store_true",
+                        help="Whitelist statt Blockliste bauen (whitelist_channels.txt → whitelist_channels.wabl)")
+    parser.add_argument("--bloom-bits", type=int, default=10, help="Bloom-Bits pro Eintrag (0 = kein Filter)")
+    args = parser.parse_args()
+
+    if args.whitelist:
+        default_source, default_output = CONFIG_DIR / "whitelist_channels.txt", compiled_whitelist_path
+    else:
+        default_source, default_output = CONFIG_DIR / "block_channels.txt", compiled_blocklist_path
+
+    output = args.output or default_output
+    count = build_blocklist(read_channel_names(args.sources or [default_source]), output, args.bloom_bits)
+    print(f"[📦] {count} Kanäle nach {output} geschrieben.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,104 @@
-from watchangel.utils.config_loader import load_lines
+import itertools
+import threading
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
 from watchangel.rules.block_rules import BlockRuleEngine
+from watchangel.utils.paths import (
+    CONFIG_DIR, compiled_blocklist_path, compiled_whitelist_path, wl_path, wl_patterns_path, undo_path,
+)
+
+# Prozessweit eindeutige, aufsteigende Regelstände
+_versions = itertools.count(1)
+
+FileSignature = tuple[tuple[int, int], ...]
+
+
+class RulesSnapshot:
+    """
+    Hält eine kompilierte BlockRuleEngine vor und baut sie nur neu, wenn sich
+    eine der Quelldateien (mtime oder Größe) geändert hat.
+
+    Jeder Neuaufbau erhält eine neue Versionsnummer (``engine.version``), auf die
+    Aufrufer und Caches ihre Schlüssel beziehen können.
+    """
+
+    def __init__(self, build: Callable[[], BlockRuleEngine], sources: Sequence[Path]) -> None:
+        self._build = build
+        self._sources = tuple(sources)
+        self._signature: Optional[FileSignature] = None
+        self._engine: Optional[BlockRuleEngine] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> BlockRuleEngine:
+        """
+        Liefert den aktuellen Regelstand, bei geänderten Quelldateien neu aufgebaut.
+
+        :return: Kompilierte BlockRuleEngine
+        """
+        with self._lock:
+            signature = self._read_signature()
+            if self._engine is None or signature != self._signature:
+                # Signatur vor dem Aufbau festhalten: eine Änderung während des Aufbaus
+                # löst beim nächsten Zugriff einen weiteren Neuaufbau aus, statt verloren zu gehen
+                engine = self._build()
+                engine.version = next(_versions)
+                previous, self._engine = self._engine, engine
+                self._signature = signature
+                if previous is not None:
+                    previous.close()
+            return self._engine
 
-engine = BlockRuleEngine(
-    keywords=load_lines("block_keywords.txt"),
-    phrases=load_lines("block_phrases.txt"),
-    block_channels=load_lines("block_channels.txt"),  # ✅ korrekt
-    whitelist_channels=load_lines("whitelist_channels.txt"),
-    whitelist_patterns=load_lines("whitelist_patterns.txt"),
-    undo_channels=load_lines("undo_block_channels.txt"),
+    @property
+    def version(self) -> int:
+        """Versionsnummer des aktuellen Regelstands."""
+        return self.get().version
+
+    def invalidate(self) -> None:
+        """Erzwingt einen Neuaufbau beim nächsten Zugriff."""
+        with self._lock:
+            self._signature = None
+
+    def _read_signature(self) -> FileSignature:
+        signature = []
+        for path in self._sources:
+            try:
+                stat = path.stat()
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append((0, -1))
+        return tuple(signature)
+
+
+# Regelwerk aus den TXT-Dateien in config/ (Keywords, Phrasen, Kanallisten)
+config_rules = RulesSnapshot(
+    BlockRuleEngine.load_once,
+    sources=[
+        CONFIG_DIR / "block_keywords.txt",
+        CONFIG_DIR / "block_phrases.txt",
+        CONFIG_DIR / "block_channels.txt",
+        CONFIG_DIR / "whitelist_channels.txt",
+        CONFIG_DIR / "whitelist_patterns.txt",
+        CONFIG_DIR / "undo_block_channels.txt",
+        CONFIG_DIR / "block_scripts.txt",
+        compiled_blocklist_path,
+        compiled_whitelist_path,
+    ],
+)
+
+# Regelwerk aus Kanal-Datenbank samt Whitelist und Undo-Liste.
+# Die Datenbank wird live abgefragt und löst daher keinen Neuaufbau aus.
+log_rules = RulesSnapshot(
+    BlockRuleEngine.from_logs,
+    sources=[wl_path, wl_patterns_path, undo_path, CONFIG_DIR / "block_scripts.txt", compiled_whitelist_path],
 )
+
+
+def get_engine() -> BlockRuleEngine:
+    """Aktueller Regelstand aus den Konfigurationsdateien."""
+    return config_rules.get()
+
+
+def get_log_rules() -> BlockRuleEngine:
+    """Aktueller Regelstand aus Kanal-Datenbank, Whitelist und Undo-Liste."""
+    return log_rules.get()
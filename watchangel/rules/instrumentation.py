@@ -0,0 +1,155 @@
+import json
+import signal
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass
+class StageStats:
+    """Kumulierte Messwerte einer Regelstufe."""
+    calls: int = 0
+    hits: int = 0
+    blocks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def avg_us(self) -> float:
+        return self.seconds / self.calls * 1e6 if self.calls else 0.0
+
+
+@dataclass
+class RuleStats:
+    """
+    Laufzeit- und Trefferstatistik der BlockRuleEngine.
+
+    Je Stufe werden Aufrufe, Entscheidungen ("hits"), davon Blockierungen und die
+    Wandzeit gezählt; je Einzelregel (Whitelist-Pattern, Phrase, Keyword) alle
+    Treffer im Text sowie, wie oft sie die Entscheidung getroffen hat.
+    """
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    rule_matches: Counter = field(default_factory=Counter)
+    rule_decisions: Counter = field(default_factory=Counter)
+    decisions: int = 0
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+
+    def record_stage(self, stage: str, seconds: float, decided: bool, blocked: bool) -> None:
+        with self._lock:
+            stats = self.stages.get(stage)
+            if stats is None:
+                stats = self.stages[stage] = StageStats()
+            stats.calls += 1
+            stats.seconds += seconds
+            if decided:
+                stats.hits += 1
+                stats.blocks += int(blocked)
+                self.decisions += 1
+
+    def record_rule_matches(self, labels: list[str]) -> None:
+        with self._lock:
+            self.rule_matches.update(labels)
+
+    def record_rule_decision(self, label: str) -> None:
+        with self._lock:
+            self.rule_decisions[label] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stages.clear()
+            self.rule_matches.clear()
+            self.rule_decisions.clear()
+            self.decisions = 0
+
+    # ------------------- Ausgabe -------------------
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "decisions": self.decisions,
+                "stages": {
+                    name: {
+                        "calls": s.calls,
+                        "hits": s.hits,
+                        "blocks": s.blocks,
+                        "seconds": round(s.seconds, 6),
+                        "avg_us": round(s.avg_us, 2),
+                    }
+                    for name, s in self.stages.items()
+                },
+                "rule_matches": dict(self.rule_matches.most_common()),
+                "rule_decisions": dict(self.rule_decisions.most_common()),
+            }
+
+    def save(self, path: Path) -> None:
+        """Schreibt die Statistik als JSON."""
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def as_table(self, top_rules: int = 15) -> str:
+        """Formatiert die Statistik als Texttabelle."""
+        data = self.to_dict()
+        total = sum(s["seconds"] for s in data["stages"].values()) or 1.0
+        lines = [
+            f"{'Stufe':<20}{'Aufrufe':>10}{'Treffer':>10}{'Blocks':>10}{'Zeit (s)':>12}{'Ø µs':>10}{'Anteil':>8}",
+        ]
+        for name, s in data["stages"].items():
+            lines.append(
+                f"{name:<20}{s['calls']:>10}{s['hits']:>10}{s['blocks']:>10}"
+                f"{s['seconds']:>12.4f}{s['avg_us']:>10.1f}{s['seconds'] / total:>8.0%}"
+            )
+        if data["rule_matches"]:
+            lines.append("")
+            lines.append(f"{'Regel':<40}{'Treffer':>10}{'Entscheidend':>14}")
+            for label, count in list(data["rule_matches"].items())[:top_rules]:
+                lines.append(f"{label[:39]:<40}{count:>10}{data['rule_decisions'].get(label, 0):>14}")
+        return "\n".join(lines)
+
+    def unused_rules(self, labels: list[str]) -> list[str]:
+        """Regeln, die seit Messbeginn kein einziges Mal getroffen haben."""
+        with self._lock:
+            return [label for label in labels if not self.rule_matches.get(label)]
+
+
+_active: Optional[RuleStats] = None
+
+
+def enable() -> RuleStats:
+    """Schaltet die Messung prozessweit ein (bestehende Werte bleiben erhalten)."""
+    global _active
+    if _active is None:
+        _active = RuleStats()
+    return _active
+
+
+def disable() -> None:
+    global _active
+    _active = None
+
+
+def current() -> Optional[RuleStats]:
+    """Aktive Statistik oder None, wenn die Messung aus ist."""
+    return _active
+
+
+def install_dump_signal(path: Optional[Path] = None) -> bool:
+    """
+    Gibt die Statistik bei SIGUSR1 aus (z. B. ``kill -USR1 <pid>`` im laufenden Watch-Loop).
+
+    :param path: Optional zusätzlich als JSON schreiben
+    :return: False, wenn das Signal auf dieser Plattform nicht verfügbar ist
+    """
+    if not hasattr(signal, "SIGUSR1"):
+        return False
+
+    def _dump(signum, frame) -> None:
+        stats = current()
+        if stats is None:
+            print("[📊] Regel-Statistik ist nicht aktiv.")
+            return
+        print("\n[📊] Regel-Statistik:\n" + stats.as_table())
+        if path:
+            stats.save(path)
+
+    signal.signal(signal.SIGUSR1, _dump)
+    return True
@@ -0,0 +1,137 @@
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from langdetect import DetectorFactory, LangDetectException, detect
+
+from watchangel.rules.scripts import script_profile
+from watchangel.utils.paths import lang_cache_path
+
+# langdetect ist sonst zwischen zwei Aufrufen nicht deterministisch
+DetectorFactory.seed = 0
+
+
+@dataclass
+class LanguageCacheStats:
+    """Zähler, wie viel Erkennungsarbeit eingespart wurde."""
+    hits: int = 0
+    misses: int = 0
+    prefiltered: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses + self.prefiltered
+        return (self.hits + self.prefiltered) / total if total else 0.0
+
+
+def normalize_text(text: str) -> str:
+    """Vereinheitlicht Leerraum, damit gleiche Texte denselben Cache-Schlüssel erhalten."""
+    return " ".join(text.split())
+
+
+def prefilter_language(text: str) -> Optional[str]:
+    """
+    Entscheidet eindeutige Fälle anhand der Schriftzeichen, ohne das N-Gramm-Modell zu bemühen.
+
+    :param text: Normalisierter Text ohne Emojis
+    :return: Sprachcode oder None, wenn langdetect entscheiden muss
+    """
+    profile = script_profile(text)
+    if not profile.letters:
+        return None
+
+    if profile.count("kana"):
+        return "ja"
+    if profile.share("arabic") > 0.5:
+        return "ar"
+    if profile.share("hangul") > 0.5:
+        return "ko"
+    if profile.share("thai") > 0.5:
+        return "th"
+    if profile.share("han") == 1.0:
+        return "zh-cn"
+    # Lateinische Schrift verrät die Sprache nicht – auch kurze ASCII-Titel entscheidet langdetect
+    return None
+
+
+class LanguageDetector:
+    """
+    Sprach-Erkennung mit Schriftzeichen-Vorfilter und begrenztem LRU-Cache.
+
+    Ergebnisse von langdetect werden je normalisiertem Text gespeichert und können
+    als JSON-Snapshot auf Platte geschrieben und beim nächsten Start geladen werden.
+    """
+
+    def __init__(self, max_entries: int = 50_000, snapshot_path: Optional[Path] = None) -> None:
+        self.max_entries = max_entries
+        self.snapshot_path = snapshot_path
+        self.stats = LanguageCacheStats()
+        self._cache: OrderedDict[str, Optional[str]] = OrderedDict()
+        self._loaded = snapshot_path is None
+        self._dirty = False
+
+    def detect(self, text: str) -> Optional[str]:
+        """
+        Liefert den Sprachcode eines Textes oder None, wenn keine Erkennung möglich ist.
+
+        :param text: Text ohne Emojis
+        :return: Sprachcode (z. B. "de") oder None
+        """
+        key = normalize_text(text)
+
+        lang = prefilter_language(key)
+        if lang is not None:
+            self.stats.prefiltered += 1
+            return lang
+
+        if not self._loaded:
+            self.load()
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.stats.hits += 1
+            return self._cache[key]
+
+        self.stats.misses += 1
+        try:
+            lang = detect(key)
+        except LangDetectException:
+            lang = None
+
+        self._cache[key] = lang
+        self._dirty = True
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return lang
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    # ------------------- Snapshot -------------------
+
+    def load(self) -> None:
+        """Lädt einen vorhandenen Snapshot (beschädigte Dateien werden ignoriert)."""
+        self._loaded = True
+        if not self.snapshot_path or not self.snapshot_path.exists():
+            return
+        try:
+            entries = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            print(f"[⚠️] Sprach-Cache nicht lesbar: {self.snapshot_path.name}")
+            return
+        for key, lang in entries[-self.max_entries:]:
+            self._cache[key] = lang
+
+    def save(self) -> None:
+        """Schreibt den Cache (in LRU-Reihenfolge) als Snapshot, sofern sich etwas geändert hat."""
+        if not self.snapshot_path or not self._dirty:
+            return
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(list(self._cache.items()), ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self.snapshot_path)
+        self._dirty = False
+
+
+language_detector = LanguageDetector(snapshot_path=lang_cache_path)
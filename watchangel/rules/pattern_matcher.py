@@ -0,0 +1,210 @@
+import re
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional
+
+# Präfixe für Sonderregeln in den Konfigurationsdateien
+WORD_PREFIX = "word:"
+REGEX_PREFIX = "re:"
+
+
+def normalize_entry(entry: str) -> str:
+    """
+    Normalisiert einen Regeleintrag für den Abgleich mit kleingeschriebenem Text.
+
+    Reguläre Ausdrücke bleiben unverändert (``\\W`` ≠ ``\\w``), alle anderen
+    Einträge werden kleingeschrieben.
+    """
+    entry = entry.strip()
+    if entry.startswith(REGEX_PREFIX):
+        return entry
+    return entry.lower()
+
+
+@dataclass(frozen=True)
+class _Pattern:
+    """Ein einzelner kompilierter Regeleintrag."""
+    label: str
+    needle: str
+    kind: str  # "plain", "word" oder "regex"
+
+
+class PatternMatcher:
+    """
+    Aho-Corasick-Automat über mehrere benannte Regelgruppen.
+
+    Alle Einträge aller Gruppen landen in einem einzigen Automaten, sodass ein
+    Text nur einmal durchlaufen werden muss. Einträge mit ``word:``-Präfix
+    treffen nur an Wortgrenzen, Einträge mit ``re:``-Präfix werden als
+    regulärer Ausdruck (case-insensitive) ausgewertet.
+
+    Die Reihenfolge der Einträge innerhalb einer Gruppe bestimmt die Priorität
+    bei :meth:`first_match`.
+    """
+
+    def __init__(self, groups: Iterable[tuple[str, Iterable[str]]]) -> None:
+        self._patterns: list[_Pattern] = []
+        self._ranges: dict[str, tuple[int, int]] = {}
+        self._regexes: list[tuple[int, re.Pattern[str]]] = []
+
+        for group, entries in groups:
+            start = len(self._patterns)
+            for entry in entries:
+                pattern = _parse_entry(normalize_entry(entry))
+                if not pattern.needle:
+                    continue
+                if pattern.kind == "regex":
+                    try:
+                        regex = re.compile(pattern.needle, re.IGNORECASE)
+                    except re.error as e:
+                        print(f"[⚠️] Ungültiger regulärer Ausdruck ignoriert: {entry!r} ({e})")
+                        continue
+                    self._regexes.append((len(self._patterns), regex))
+                self._patterns.append(pattern)
+            self._ranges[group] = (start, len(self._patterns))
+
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._plain_out: list[tuple[int, ...]] = [()]
+        self._word_out: list[tuple[tuple[int, int], ...]] = [()]
+        self._build_automaton()
+
+        regex_ids = [pid for pid, _ in self._regexes]
+        # Sammel-Regex als Vorfilter: Einzelregexe nur prüfen, wenn überhaupt einer trifft
+        self._regex_any: Optional[re.Pattern[str]] = None
+        if regex_ids:
+            try:
+                self._regex_any = re.compile(
+                    "|".join(f"(?:{self._patterns[pid].needle})" for pid in regex_ids), re.IGNORECASE
+                )
+            except re.error:
+                # z. B. Rückverweise, die in der Verkettung ihre Nummer verlieren
+                self._regex_any = None
+
+    # ------------------- Aufbau -------------------
+
+    def _build_automaton(self) -> None:
+        plain_out: list[list[int]] = [[]]
+        word_out: list[list[tuple[int, int]]] = [[]]
+
+        for pid, pattern in enumerate(self._patterns):
+            if pattern.kind == "regex":
+                continue
+            state = 0
+            for ch in pattern.needle:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    plain_out.append([])
+                    word_out.append([])
+                state = nxt
+            if pattern.kind == "word":
+                word_out[state].append((pid, len(pattern.needle)))
+            else:
+                plain_out[state].append(pid)
+
+        # Fehlerlinks per Breitensuche, Ausgaben der Suffixe übernehmen
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                plain_out[nxt].extend(plain_out[self._fail[nxt]])
+                word_out[nxt].extend(word_out[self._fail[nxt]])
+
+        self._plain_out = [tuple(o) for o in plain_out]
+        self._word_out = [tuple(o) for o in word_out]
+
+    # ------------------- Abfrage -------------------
+
+    def scan(self, text: str) -> frozenset[int]:
+        """
+        Liefert die IDs aller Einträge, die im (bereits kleingeschriebenen) Text vorkommen.
+
+        :param text: Zu durchsuchender Text
+        :return: Menge der getroffenen Pattern-IDs
+        """
+        hits: set[int] = set()
+        goto, fail = self._goto, self._fail
+        plain_out, word_out = self._plain_out, self._word_out
+        state = 0
+
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if plain_out[state]:
+                hits.update(plain_out[state])
+            for pid, length in word_out[state]:
+                if _is_word_bounded(text, i - length + 1, i + 1):
+                    hits.add(pid)
+
+        if self._regexes and (self._regex_any is None or self._regex_any.search(text)):
+            hits.update(pid for pid, regex in self._regexes if regex.search(text))
+
+        return frozenset(hits)
+
+    def first_match(self, group: str, hits: Iterable[int]) -> Optional[str]:
+        """
+        Gibt den Eintrag mit der höchsten Priorität einer Gruppe zurück, der getroffen wurde.
+
+        :param group: Name der Regelgruppe
+        :param hits: Ergebnis(se) von :meth:`scan`
+        :return: Eintrag (wie konfiguriert, normalisiert) oder None
+        """
+        start, end = self._ranges.get(group, (0, 0))
+        best = min((pid for pid in hits if start <= pid < end), default=None)
+        return None if best is None else self._patterns[best].label
+
+    def labels(self, hits: Iterable[int]) -> list[str]:
+        """Übersetzt Pattern-IDs in die konfigurierten Einträge."""
+        return [self._patterns[pid].label for pid in hits]
+
+    def all_labels(self) -> list[str]:
+        """Alle Einträge in Prioritätsreihenfolge."""
+        return [pattern.label for pattern in self._patterns]
+
+    def has_group(self, group: str) -> bool:
+        """Gibt zurück, ob eine Gruppe mindestens einen Eintrag enthält."""
+        start, end = self._ranges.get(group, (0, 0))
+        return end > start
+
+
+def _parse_entry(label: str) -> _Pattern:
+    if label.startswith(REGEX_PREFIX):
+        return _Pattern(label, label[len(REGEX_PREFIX):], "regex")
+    if label.startswith(WORD_PREFIX):
+        return _Pattern(label, label[len(WORD_PREFIX):], "word")
+    return _Pattern(label, label, "plain")
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _is_word_bounded(text: str, start: int, end: int) -> bool:
+    if start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if end < len(text) and _is_word_char(text[end]):
+        return False
+    return True
+
+
+@lru_cache(maxsize=8)
+def compile_matcher(groups: tuple[tuple[str, tuple[str, ...]], ...]) -> PatternMatcher:
+    """
+    Baut einen PatternMatcher und hält ihn für identische Regelstände vor.
+
+    :param groups: Gruppenname → Einträge (als Tupel, damit hashbar)
+    :return: Kompilierter Matcher
+    """
+    return PatternMatcher(groups)
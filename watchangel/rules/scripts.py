@@ -0,0 +1,103 @@
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Optional
+
+# Unicode-Blöcke je Schrift (Start, Ende inklusive)
+SCRIPT_RANGES: dict[str, tuple[tuple[int, int], ...]] = {
+    "latin": ((0x0041, 0x005A), (0x0061, 0x007A), (0x00C0, 0x00D6), (0x00D8, 0x00F6),
+              (0x00F8, 0x024F), (0x1E00, 0x1EFF)),
+    "greek": ((0x0370, 0x03FF), (0x1F00, 0x1FFF)),
+    "cyrillic": ((0x0400, 0x052F), (0x2DE0, 0x2DFF), (0xA640, 0xA69F)),
+    "armenian": ((0x0530, 0x058F),),
+    "hebrew": ((0x0590, 0x05FF),),
+    "arabic": ((0x0600, 0x06FF), (0x0750, 0x077F), (0x08A0, 0x08FF), (0xFB50, 0xFDFF), (0xFE70, 0xFEFC)),
+    "devanagari": ((0x0900, 0x097F),),
+    "bengali": ((0x0980, 0x09FF),),
+    "tamil": ((0x0B80, 0x0BFF),),
+    "thai": ((0x0E00, 0x0E7F),),
+    "georgian": ((0x10A0, 0x10FF),),
+    "hangul": ((0x1100, 0x11FF), (0x3130, 0x318F), (0xAC00, 0xD7AF)),
+    "kana": ((0x3040, 0x30FF), (0x31F0, 0x31FF)),
+    "han": ((0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF)),
+}
+
+# Sammelbegriffe für Regeln wie "cjk: 0.5"
+SCRIPT_GROUPS: dict[str, tuple[str, ...]] = {
+    "cjk": ("han", "kana", "hangul"),
+}
+
+SCRIPT_NAMES = frozenset(SCRIPT_RANGES) | frozenset(SCRIPT_GROUPS) | {"other"}
+
+
+def _char_class(ranges: Iterable[tuple[int, int]]) -> str:
+    return "".join(f"\\U{start:08X}-\\U{end:08X}" for start, end in ranges)
+
+
+# Ein Regex für alle Schriften: jede Schrift als benannte Gruppe über ganze Läufe,
+# übrige Buchstaben landen in "other". Ein Durchlauf, die Schleife läuft je Lauf statt je Zeichen.
+_SCRIPT_RUNS = re.compile(
+    "|".join(f"(?P<{name}>[{_char_class(ranges)}]+)" for name, ranges in SCRIPT_RANGES.items())
+    + f"|(?P<other>[^\\W\\d_{''.join(_char_class(r) for r in SCRIPT_RANGES.values())}]+)"
+)
+
+
+@dataclass(frozen=True)
+class ScriptProfile:
+    """Anzahl der Buchstaben je Schrift in einem Text."""
+    counts: dict[str, int] = field(default_factory=dict)
+    letters: int = 0
+
+    def count(self, script: str) -> int:
+        """Buchstaben einer Schrift oder Schriftgruppe (z. B. "cjk")."""
+        return sum(self.counts.get(s, 0) for s in SCRIPT_GROUPS.get(script, (script,)))
+
+    def share(self, script: str) -> float:
+        """Anteil einer Schrift an allen Buchstaben (0.0 – 1.0)."""
+        return self.count(script) / self.letters if self.letters else 0.0
+
+    def dominant(self) -> Optional[str]:
+        """Schrift mit den meisten Buchstaben oder None bei Texten ohne Buchstaben."""
+        return max(self.counts, key=self.counts.__getitem__) if self.counts else None
+
+
+@lru_cache(maxsize=4096)
+def script_profile(text: str) -> ScriptProfile:
+    """
+    Zählt die Buchstaben je Schrift in einem Durchlauf.
+
+    :param text: Beliebiger Text
+    :return: ScriptProfile (gecacht, nicht verändern)
+    """
+    counts: dict[str, int] = {}
+    for match in _SCRIPT_RUNS.finditer(text):
+        # Die Blöcke enthalten auch Ziffern, Zeichen und Diakritika – gezählt werden nur Buchstaben
+        letters = sum(ch.isalpha() for ch in match.group())
+        if letters:
+            script = match.lastgroup
+            counts[script] = counts.get(script, 0) + letters
+    return ScriptProfile(counts, sum(counts.values()))
+
+
+def parse_script_rules(lines: Iterable[str]) -> dict[str, float]:
+    """
+    Liest Schriftregeln im Format ``schrift: schwelle`` (z. B. ``arabic: 0.5``).
+
+    Ein Video wird geblockt, wenn der Anteil der Schrift die Schwelle übersteigt.
+
+    :param lines: Zeilen aus block_scripts.txt
+    :return: Schrift → Schwelle
+    """
+    rules: dict[str, float] = {}
+    for line in lines:
+        name, sep, threshold = line.partition(":")
+        name = name.strip().lower()
+        try:
+            value = float(threshold)
+        except ValueError:
+            value = -1.0
+        if not sep or name not in SCRIPT_NAMES or not 0.0 <= value < 1.0:
+            print(f"[⚠️] Ungültige Schriftregel ignoriert: {line!r}")
+            continue
+        rules[name] = value
+    return rules
@@ -4,8 +4,12 @@ from watchangel.model.scanned_video import ScannedVideo
 from watchangel.analysis.scanner import scan_watch_history
 from watchangel.cleaner.batch_cleaner import clean_matched_videos
 from watchangel.model.matched_video import MatchedVideo
-from watchangel.matching.matching import match_video
-from watchangel.rules.block_rules import BlockRuleEngine
+from watchangel.matching.matching import match_videos
+from watchangel.rules.engine_instance import get_log_rules
+from watchangel.rules import instrumentation
+from watchangel.rules.language import language_detector
+from watchangel.storage.decision_cache import get_decision_cache
+from watchangel.utils.paths import rule_stats_path
 
 
 def run_cleanup_pipeline(driver: WebDriver) -> int:
@@ -23,20 +27,35 @@ def run_cleanup_pipeline(driver: WebDriver) -> int:
     videos: list[ScannedVideo] = scan_watch_history(driver)
     print(f"[📦] {len(videos)} Videos im Verlauf gefunden.")
 
-    rules = BlockRuleEngine.from_logs()
+    rules = get_log_rules()
 
     seen_ids: set[str] = set()
-    matches: list[MatchedVideo] = []
+    unique_videos: list[ScannedVideo] = []
 
     for video in videos:
         if video.video_id in seen_ids:
             continue
         seen_ids.add(video.video_id)
+        unique_videos.append(video)
 
-        match = match_video(video, rules)
-        if match:
-            matches.append(match)
+    cache = get_decision_cache()
+    matches: list[MatchedVideo] = match_videos(unique_videos, rules, cache=cache)
 
     print(f"[⚖️] {len(matches)} blockwürdige Videos erkannt.")
+    print(f"[🗃️] Entscheidungs-Cache: {cache.stats.hits} Treffer, {cache.stats.misses} neu bewertet "
+          f"({cache.stats.hit_rate:.0%} aus Cache)")
+
+    stats = language_detector.stats
+    print(f"[🧪] Spracherkennung: {stats.prefiltered} per Vorfilter, {stats.hits} aus Cache, "
+          f"{stats.misses} berechnet ({stats.hit_rate:.0%} eingespart)")
+    language_detector.save()
+
+    rule_stats = instrumentation.current()
+    if rule_stats is not None:
+        print("[📊] Regel-Statistik:\n" + rule_stats.as_table())
+        unused = rule_stats.unused_rules(rules.matcher.all_labels())
+        if unused:
+            print(f"[🪦] {len(unused)} Regel(n) ohne Treffer: {', '.join(unused[:20])}")
+        rule_stats.save(rule_stats_path)
 
     return clean_matched_videos(driver, matches)
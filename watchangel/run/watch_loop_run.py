@@ -1,26 +1,36 @@
 import time
 
-from selenium.webdriver.chrome.webdriver import WebDriver
-
+from watchangel.browser.supervisor import BrowserSupervisor
+from watchangel.storage.job_queue import get_job_queue
+from watchangel.watcher.job_runner import drain_jobs
 from watchangel.watcher.watch_loop import check_history_once
 
 
-def run_watch_loop(driver: WebDriver) -> None:
+def run_watch_loop(supervisor: BrowserSupervisor) -> None:
     """
         Startet die Überwachungsschleife für den YouTube-Wiedergabeverlauf.
 
         Führt in regelmäßigen Abständen `check_history_once(...)` aus, um neue Videos
         zu prüfen und ggf. automatisch zu blockieren oder zu entfernen.
 
+        Offene Aufträge aus einem früheren Lauf werden vor der ersten Prüfung abgearbeitet.
+        Der Supervisor startet den Browser bei zu hohem Speicherverbrauch, langsamen
+        Antworten oder einer verlorenen Sitzung neu.
+
         Beendet sich sauber bei KeyboardInterrupt (Strg+C).
 
-        :param driver: Aktive Selenium WebDriver-Instanz
+        :param supervisor: Supervisor der Browser-Sitzung
         """
     try:
+        jobs = get_job_queue()
+        pending = jobs.counts().get("pending", 0)
+        if pending:
+            print(f"[📥] Setze {pending} offene(n) Auftrag/Aufträge fort...")
+            supervisor.run(lambda driver: drain_jobs(driver, jobs))
         while True:
-            check_history_once(driver)
+            supervisor.run(check_history_once)
             time.sleep(0.5)
     except KeyboardInterrupt:
         print("\n[⛔️] Manuell beendet")
     finally:
-        driver.quit()
+        supervisor.close()
@@ -0,0 +1,215 @@
+import datetime
+import json
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from watchangel.storage import db
+from watchangel.utils.paths import db_path, log_path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocked_channels (
+    channel_key TEXT PRIMARY KEY,
+    channel_name TEXT NOT NULL,
+    channel_url TEXT,
+    video_title TEXT,
+    video_id TEXT,
+    log_time TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+"""
+
+_INSERT = """
+INSERT OR IGNORE INTO blocked_channels (channel_key, channel_name, channel_url, video_title, video_id, log_time)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Ältere Einträge (z. B. nur mit Kanalnamen) um fehlende Felder ergänzen
+_FILL_MISSING = """
+UPDATE blocked_channels SET
+    channel_url = COALESCE(channel_url, :url),
+    video_title = COALESCE(video_title, :title),
+    video_id = COALESCE(video_id, :video_id)
+WHERE channel_key = :key AND (
+    (channel_url IS NULL AND :url IS NOT NULL)
+    OR (video_title IS NULL AND :title IS NOT NULL)
+    OR (video_id IS NULL AND :video_id IS NOT NULL)
+)
+"""
+
+_COLUMNS = ("channel_name", "channel_url", "video_title", "video_id", "log_time")
+
+
+def channel_key(channel_name: str) -> str:
+    """Schlüssel eines Kanals – entspricht der Normalisierung der BlockRuleEngine."""
+    return channel_name.strip().lower()
+
+
+class ChannelStore:
+    """
+    Indizierter Speicher (SQLite) für blockierte Kanäle.
+
+    Ersetzt das Anhängen an ``blocked_channels.log``: Mitgliedschaftsprüfungen,
+    Einfügen und Löschen laufen über den Primärschlüssel (B-Baum, O(log n)) und
+    jede Änderung ist eine eigene Transaktion. Beim ersten Öffnen wird eine
+    vorhandene Logdatei einmalig übernommen.
+    """
+
+    def __init__(self, path: Path = db_path, legacy_log: Optional[Path] = log_path) -> None:
+        self.path = path
+        self.legacy_log = legacy_log
+        self._lock = threading.Lock()
+        self._conn = db.connect(path)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+        self._migrate_legacy_log()
+
+    # ------------------- Abfragen -------------------
+
+    def __contains__(self, channel_name: object) -> bool:
+        if not isinstance(channel_name, str):
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM blocked_channels WHERE channel_key = ?", (channel_key(channel_name),)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM blocked_channels").fetchone()[0]
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            keys = [row[0] for row in self._conn.execute("SELECT channel_key FROM blocked_channels")]
+        return iter(keys)
+
+    def get(self, channel_name: str) -> Optional[dict]:
+        """
+        Liefert den gespeicherten Eintrag eines Kanals.
+
+        :param channel_name: Kanalname (Groß-/Kleinschreibung egal)
+        :return: Eintrag als dict oder None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM blocked_channels WHERE channel_key = ?",
+                (channel_key(channel_name),),
+            ).fetchone()
+        return dict(zip(_COLUMNS, row)) if row else None
+
+    def revision(self) -> int:
+        """Zähler, der bei jeder Änderung steigt (für Caches)."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+        return int(row[0]) if row else 0
+
+    # ------------------- Änderungen -------------------
+
+    def add(self, entry: dict) -> bool:
+        """
+        Speichert einen blockierten Kanal. Vorhandene Einträge werden nur ergänzt.
+
+        :param entry: dict mit channel_name und optional channel_url, title/video_title, video_id, log_time
+        :return: True, wenn der Kanal neu war
+        """
+        return self.add_many([entry]) > 0
+
+    def add_many(self, entries: Iterable[dict]) -> int:
+        """
+        Speichert mehrere Kanäle in einer Transaktion.
+
+        :return: Anzahl neu hinzugekommener Kanäle
+        """
+        rows = [_to_row(entry) for entry in entries]
+        added = changed = 0
+        with self._lock, self._conn:
+            for row in rows:
+                if not row[0]:
+                    continue
+                if self._conn.execute(_INSERT, row).rowcount:
+                    added += 1
+                else:
+                    changed += self._conn.execute(
+                        _FILL_MISSING, {"key": row[0], "url": row[2], "title": row[3], "video_id": row[4]}
+                    ).rowcount
+            if added or changed:
+                self._bump_revision()
+        return added
+
+    def remove(self, channel_names: Iterable[str]) -> int:
+        """
+        Entfernt Kanäle (z. B. nach erfolgreichem Undo).
+
+        :return: Anzahl entfernter Kanäle
+        """
+        keys = [(channel_key(name),) for name in channel_names]
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("DELETE FROM blocked_channels WHERE channel_key = ?", keys)
+            removed = self._conn.total_changes - before
+            if removed:
+                self._bump_revision()
+        return removed
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # ------------------- Intern -------------------
+
+    def _bump_revision(self) -> None:
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('revision', 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+        )
+
+    def _migrate_legacy_log(self) -> None:
+        """Übernimmt blocked_channels.log einmalig und benennt die Datei danach um."""
+        if not self.legacy_log or not self.legacy_log.exists():
+            return
+
+        entries: list[dict] = []
+        with self.legacy_log.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line.strip()))
+                except json.JSONDecodeError:
+                    continue
+
+        added = self.add_many(entries)
+        self.legacy_log.replace(self.legacy_log.with_name(self.legacy_log.name + ".migrated"))
+        print(f"[📦] {added} Kanäle aus {self.legacy_log.name} in die Datenbank übernommen.")
+
+    # ------------------- Pickling (Prozess-Pool) -------------------
+
+    def __getstate__(self) -> dict:
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict) -> None:
+        # Keine erneute Migration im Worker-Prozess
+        self.__init__(state["path"], legacy_log=None)
+
+
+def _to_row(entry: dict) -> tuple:
+    name = (entry.get("channel_name") or "").strip()
+    return (
+        channel_key(name),
+        name,
+        entry.get("channel_url") or None,
+        entry.get("video_title") or entry.get("title") or None,
+        entry.get("video_id") or None,
+        entry.get("log_time") or datetime.datetime.now().isoformat(),
+    )
+
+
+def _open_shared(path: Path) -> ChannelStore:
+    # Die alte Logdatei gehört zur Standard-Datenbank, nicht zu umgeleiteten (Tests, Benchmarks)
+    return ChannelStore(path, legacy_log=log_path if path == db_path else None)
+
+
+def get_channel_store() -> ChannelStore:
+    """Prozessweiter Speicher unter ``db_path`` (wird beim ersten Zugriff geöffnet)."""
+    return db.shared("channel_store", _open_shared)
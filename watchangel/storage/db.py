@@ -0,0 +1,65 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, TypeVar
+
+from watchangel.utils.paths import db_path
+
+T = TypeVar("T")
+
+# Datenbank der prozessweiten Speicher und die bereits geöffneten Instanzen je Name
+_path: Path = db_path
+_instances: dict[str, object] = {}
+_default_lock = threading.RLock()
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """
+    Öffnet eine Verbindung, die mehrere Threads (hinter dem Lock des Speichers) teilen.
+    Im WAL-Modus blockieren Leser und Schreiber verschiedener Speicher einander nicht.
+
+    :param path: SQLite-Datei
+    :return: Offene Verbindung
+    """
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
+
+
+def shared(name: str, factory: Callable[[Path], T]) -> T:
+    """
+    Prozessweite Instanz eines Speichers, beim ersten Zugriff unter der aktuellen Datenbank geöffnet.
+
+    :param name: Eindeutiger Name des Speichers
+    :param factory: Öffnet den Speicher für einen Datenbankpfad
+    :return: Gemeinsame Instanz
+    """
+    with _default_lock:
+        instance = _instances.get(name)
+        if instance is None:
+            instance = _instances[name] = factory(_path)
+        return instance
+
+
+@contextmanager
+def use_database(path: Path) -> Iterator[None]:
+    """
+    Leitet alle prozessweiten Speicher für die Dauer des Blocks auf ``path`` um (Tests,
+    Benchmarks). Danach werden die dort geöffneten Speicher geschlossen und die vorherigen
+    Instanzen wieder verwendet.
+
+    :param path: SQLite-Datei für den Block
+    """
+    global _path, _instances
+    with _default_lock:
+        saved = _path, _instances
+        _path, _instances = path, {}
+    try:
+        yield
+    finally:
+        with _default_lock:
+            opened = list(_instances.values())
+            _path, _instances = saved
+        for instance in opened:
+            instance.close()
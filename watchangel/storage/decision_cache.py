@@ -0,0 +1,139 @@
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from watchangel.rules.block_rules import BlockDecision
+from watchangel.storage import db
+from watchangel.utils.paths import db_path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decision_cache (
+    video_id TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    block INTEGER NOT NULL,
+    reason TEXT,
+    used_at REAL NOT NULL,
+    PRIMARY KEY (video_id, fingerprint)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS decision_cache_used_at ON decision_cache (used_at);
+"""
+
+# SQLite-Grenze für Parameter je Statement (konservativ)
+_CHUNK = 500
+
+
+@dataclass
+class DecisionCacheStats:
+    """Trefferquote des Entscheidungs-Caches."""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class DecisionCache:
+    """
+    Persistenter Cache für Blockentscheidungen je Video und Regelstand.
+
+    Schlüssel ist ``(video_id, rules.fingerprint)`` – ändern sich die Regeln,
+    ändert sich der Fingerprint und alte Einträge treffen nicht mehr. Die Größe
+    ist begrenzt, verdrängt werden die am längsten ungenutzten Einträge.
+    """
+
+    def __init__(self, path: Path = db_path, max_entries: int = 200_000) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.stats = DecisionCacheStats()
+        self._lock = threading.Lock()
+        self._conn = db.connect(path)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def get(self, video_id: str, fingerprint: str) -> Optional[BlockDecision]:
+        """
+        Liefert eine gespeicherte Entscheidung oder None.
+
+        :param video_id: YouTube-Video-ID
+        :param fingerprint: Fingerprint des Regelstands
+        """
+        return self.get_many([video_id], fingerprint).get(video_id)
+
+    def get_many(self, video_ids: Iterable[str], fingerprint: str) -> dict[str, BlockDecision]:
+        """
+        Liefert alle gespeicherten Entscheidungen für die angegebenen Videos.
+
+        :return: video_id → BlockDecision (nur Treffer)
+        """
+        ids = list(dict.fromkeys(video_ids))
+        found: dict[str, BlockDecision] = {}
+        with self._lock, self._conn:
+            for start in range(0, len(ids), _CHUNK):
+                chunk = ids[start:start + _CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT video_id, block, reason FROM decision_cache "
+                    f"WHERE fingerprint = ? AND video_id IN ({','.join('?' * len(chunk))})",
+                    [fingerprint, *chunk],
+                )
+                for video_id, block, reason in rows:
+                    found[video_id] = BlockDecision(bool(block), reason)
+
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE decision_cache SET used_at = ? WHERE video_id = ? AND fingerprint = ?",
+                [(now, video_id, fingerprint) for video_id in found],
+            )
+
+        self.stats.hits += len(found)
+        self.stats.misses += len(ids) - len(found)
+        return found
+
+    def put(self, video_id: str, fingerprint: str, decision: BlockDecision) -> None:
+        """Speichert eine Entscheidung."""
+        self.put_many({video_id: decision}, fingerprint)
+
+    def put_many(self, decisions: dict[str, BlockDecision], fingerprint: str) -> None:
+        """
+        Speichert mehrere Entscheidungen in einer Transaktion und verdrängt bei Bedarf alte Einträge.
+        """
+        if not decisions:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO decision_cache (video_id, fingerprint, block, reason, used_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(video_id, fingerprint, int(d.block), d.reason, now) for video_id, d in decisions.items()],
+            )
+            self._evict()
+
+    def clear(self) -> None:
+        """Verwirft alle Einträge."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM decision_cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM decision_cache").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _evict(self) -> None:
+        count = self._conn.execute("SELECT COUNT(*) FROM decision_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM decision_cache WHERE (video_id, fingerprint) IN ("
+                "SELECT video_id, fingerprint FROM decision_cache ORDER BY used_at LIMIT ?)",
+                (overflow,),
+            )
+
+
+def get_decision_cache() -> DecisionCache:
+    """Prozessweiter Entscheidungs-Cache unter ``db_path``."""
+    return db.shared("decision_cache", DecisionCache)
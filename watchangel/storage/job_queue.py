@@ -0,0 +1,186 @@
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from watchangel.storage.channel_store import channel_key
+from watchangel.storage import db
+from watchangel.utils.paths import db_path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    action TEXT NOT NULL,
+    channel_name TEXT NOT NULL,
+    idempotency_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_run_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+-- Höchstens ein offener Auftrag je Aktion und Kanal
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_active_key ON jobs (idempotency_key)
+    WHERE status IN ('pending', 'running');
+CREATE INDEX IF NOT EXISTS jobs_due ON jobs (status, next_run_at);
+"""
+
+JOB_ACTIONS = ("block", "hide", "unhide", "purge")
+
+DAY = 24 * 60 * 60
+
+
+@dataclass
+class Job:
+    """Ein Auftrag aus der Warteschlange."""
+    id: int
+    action: str
+    channel_name: str
+    payload: dict = field(default_factory=dict)
+    attempts: int = 0
+
+
+class JobQueue:
+    """
+    Persistente Warteschlange (SQLite) für Block-, Hide-, Unhide- und Purge-Aufträge.
+
+    - Idempotent: je Aktion und Kanal ist höchstens ein Auftrag offen
+    - Fehlgeschlagene Aufträge werden mit exponentiellem Backoff wiederholt
+    - Nach einem Absturz werden laufende Aufträge beim Öffnen wieder freigegeben
+    - Erledigte und endgültig fehlgeschlagene Aufträge werden nach ``retention_days`` gelöscht
+    """
+
+    def __init__(
+            self,
+            path: Path = db_path,
+            max_attempts: int = 5,
+            base_delay: float = 30.0,
+            max_delay: float = 3600.0,
+            retention_days: float = 14,
+    ) -> None:
+        self.path = path
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retention = retention_days * DAY
+        self._lock = threading.Lock()
+        self._conn = db.connect(path)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+        self.prune()
+        resumed = self.recover()
+        if resumed:
+            print(f"[♻️] {resumed} unterbrochene(r) Auftrag/Aufträge wieder eingeplant.")
+
+    def enqueue(self, action: str, channel_name: str, payload: Optional[dict] = None) -> bool:
+        """
+        Plant einen Auftrag ein.
+
+        :param action: "block", "hide", "unhide" oder "purge"
+        :param channel_name: Kanalname (Idempotenz-Schlüssel zusammen mit der Aktion)
+        :param payload: Zusatzdaten (z. B. channel_url)
+        :return: False, wenn für diesen Kanal bereits ein gleicher Auftrag offen ist
+        """
+        if action not in JOB_ACTIONS:
+            raise ValueError(f"Unbekannte Aktion: {action}")
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO jobs (action, channel_name, idempotency_key, payload, next_run_at, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (action, channel_name, f"{action}:{channel_key(channel_name)}",
+                 json.dumps(payload or {}, ensure_ascii=False), now, now, now),
+            )
+        return cursor.rowcount > 0
+
+    def claim(self, actions: tuple[str, ...] = JOB_ACTIONS, now: Optional[float] = None) -> Optional[Job]:
+        """
+        Holt den ältesten fälligen Auftrag und markiert ihn als laufend.
+
+        :param actions: Nur Aufträge dieser Aktionen
+        :return: Job oder None, wenn nichts fällig ist
+        """
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                f"SELECT id, action, channel_name, payload, attempts FROM jobs "
+                f"WHERE status = 'pending' AND next_run_at <= ? AND action IN ({','.join('?' * len(actions))}) "
+                f"ORDER BY id LIMIT 1",
+                (now, *actions),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE jobs SET status = 'running', updated_at = ? WHERE id = ?", (now, row[0])
+            )
+        return Job(row[0], row[1], row[2], json.loads(row[3]), row[4])
+
+    def complete(self, job: Job) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'done', attempts = attempts + 1, last_error = NULL, updated_at = ? "
+                "WHERE id = ?",
+                (time.time(), job.id),
+            )
+
+    def fail(self, job: Job, error: str) -> bool:
+        """
+        Verbucht einen Fehlschlag und plant den Auftrag mit Backoff neu ein.
+
+        :return: True, wenn der Auftrag erneut versucht wird; False, wenn er endgültig fehlschlägt
+        """
+        attempts = job.attempts + 1
+        now = time.time()
+        retry = attempts < self.max_attempts
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, attempts = ?, next_run_at = ?, last_error = ?, updated_at = ? "
+                "WHERE id = ?",
+                ("pending" if retry else "failed", attempts, now + delay, error, now, job.id),
+            )
+        return retry
+
+    def release(self, job: Job) -> None:
+        """Gibt einen laufenden Auftrag ohne Fehlversuch wieder frei (z. B. wenn der Browser abstürzt)."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'pending', updated_at = ? WHERE id = ? AND status = 'running'",
+                (time.time(), job.id),
+            )
+
+    def recover(self) -> int:
+        """Gibt nach einem Absturz hängengebliebene Aufträge wieder frei."""
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "UPDATE jobs SET status = 'pending', updated_at = ? WHERE status = 'running'", (time.time(),)
+            ).rowcount
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Löscht erledigte und endgültig fehlgeschlagene Aufträge, die älter als die Aufbewahrungsfrist sind.
+
+        :return: Anzahl gelöschter Aufträge
+        """
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "DELETE FROM jobs WHERE status IN ('done', 'failed') AND updated_at < ?", (now - self.retention,)
+            ).rowcount
+
+    def counts(self) -> dict[str, int]:
+        """Anzahl Aufträge je Status."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def get_job_queue() -> JobQueue:
+    """Prozessweite Auftrags-Warteschlange unter ``db_path``."""
+    return db.shared("job_queue", JobQueue)
@@ -0,0 +1,141 @@
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from watchangel.storage import db
+from watchangel.utils.paths import db_path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS moderation_state (
+    channel_key TEXT PRIMARY KEY,
+    channel_url TEXT NOT NULL,
+    hidden INTEGER NOT NULL DEFAULT 0,
+    blocked_for_kids INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    checked_at REAL NOT NULL,
+    changed_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS moderation_state_checked ON moderation_state (status, checked_at);
+"""
+
+DAY = 24 * 60 * 60
+
+
+def channel_url_key(channel_url: str) -> str:
+    """Vergleichsschlüssel für Kanal-URLs (ohne Schrägstrich am Ende, ohne ``/about``)."""
+    key = channel_url.strip().rstrip("/").lower()
+    return key[:-len("/about")] if key.endswith("/about") else key
+
+
+@dataclass(frozen=True)
+class ModerationState:
+    """
+    Zuletzt im Browser festgestellter Zustand eines Kanals.
+
+    :param status: "done" (versteckt und für Kids blockiert), "partial", "failed" oder "unhidden"
+    :param checked_at: Letzte Prüfung im Browser
+    :param changed_at: Letzte Änderung von ``hidden``/``blocked_for_kids``
+    """
+    channel_url: str
+    hidden: bool = False
+    blocked_for_kids: bool = False
+    status: str = "failed"
+    checked_at: float = 0.0
+    changed_at: float = 0.0
+
+    @property
+    def done(self) -> bool:
+        return self.status == "done"
+
+
+def _status(hidden: bool, blocked_for_kids: bool) -> str:
+    if hidden and blocked_for_kids:
+        return "done"
+    return "partial" if hidden or blocked_for_kids else "failed"
+
+
+class ModerationStore:
+    """
+    Persistiert das Ergebnis der Kanal-Moderation je Kanal-URL in der SQLite-Datenbank,
+    damit bereits erledigte Kanäle nicht erneut im Browser geöffnet werden.
+    """
+
+    def __init__(self, path: Path = db_path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = db.connect(path)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def get(self, channel_url: str) -> Optional[ModerationState]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT channel_url, hidden, blocked_for_kids, status, checked_at, changed_at "
+                "FROM moderation_state WHERE channel_key = ?",
+                (channel_url_key(channel_url),),
+            ).fetchone()
+        return _from_row(row) if row else None
+
+    def record(
+            self,
+            channel_url: str,
+            hidden: Optional[bool] = None,
+            blocked_for_kids: Optional[bool] = None,
+            status: Optional[str] = None,
+    ) -> ModerationState:
+        """
+        Speichert das Ergebnis einer Browser-Prüfung.
+
+        :param hidden: Neuer Hide-Zustand (None = unverändert)
+        :param blocked_for_kids: Neuer Kids-Zustand (None = unverändert)
+        :param status: Status überschreiben (sonst aus den beiden Flags abgeleitet)
+        :return: Gespeicherter Zustand
+        """
+        now = time.time()
+        previous = self.get(channel_url) or ModerationState(channel_url)
+        hidden = previous.hidden if hidden is None else hidden
+        blocked_for_kids = previous.blocked_for_kids if blocked_for_kids is None else blocked_for_kids
+        changed = (hidden, blocked_for_kids) != (previous.hidden, previous.blocked_for_kids)
+        state = ModerationState(
+            channel_url=channel_url,
+            hidden=hidden,
+            blocked_for_kids=blocked_for_kids,
+            status=status or _status(hidden, blocked_for_kids),
+            checked_at=now,
+            changed_at=now if changed or not previous.changed_at else previous.changed_at,
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO moderation_state "
+                "(channel_key, channel_url, hidden, blocked_for_kids, status, checked_at, changed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (channel_url_key(channel_url), state.channel_url, int(state.hidden), int(state.blocked_for_kids),
+                 state.status, state.checked_at, state.changed_at),
+            )
+        return state
+
+    def due_for_reverify(self, max_age_days: float, limit: int = 20) -> list[ModerationState]:
+        """
+        Erledigte Kanäle, deren letzte Prüfung älter als ``max_age_days`` ist (älteste zuerst).
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT channel_url, hidden, blocked_for_kids, status, checked_at, changed_at "
+                "FROM moderation_state WHERE status = 'done' AND checked_at < ? ORDER BY checked_at LIMIT ?",
+                (time.time() - max_age_days * DAY, limit),
+            ).fetchall()
+        return [_from_row(row) for row in rows]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _from_row(row: tuple) -> ModerationState:
+    return ModerationState(row[0], bool(row[1]), bool(row[2]), row[3], row[4], row[5])
+
+
+def get_moderation_store() -> ModerationStore:
+    """Prozessweiter Moderationsspeicher unter ``db_path``."""
+    return db.shared("moderation_state", ModerationStore)
@@ -0,0 +1,104 @@
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from watchangel.storage import db
+from watchangel.utils.paths import db_path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_videos (
+    video_id TEXT PRIMARY KEY,
+    seen_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS seen_videos_seen_at ON seen_videos (seen_at);
+"""
+
+DAY = 24 * 60 * 60
+
+
+class SeenVideoSet:
+    """
+    Begrenzte, persistente Menge bereits geprüfter Video-IDs für den Watch-Loop.
+
+    Im Speicher liegt ein LRU (OrderedDict) mit höchstens ``max_entries`` IDs, die nicht
+    älter als ``max_age_days`` sind – der Speicherbedarf bleibt auch nach Wochen Laufzeit
+    konstant. Änderungen werden gesammelt und spätestens alle ``flush_every`` Einträge
+    (bzw. mit :meth:`flush`) in die SQLite-Datenbank geschrieben; beim Start wird nur
+    der begrenzte Bestand geladen.
+    """
+
+    def __init__(
+            self,
+            path: Path = db_path,
+            max_entries: int = 50_000,
+            max_age_days: float = 90,
+            flush_every: int = 200,
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age_days * DAY
+        self.flush_every = flush_every
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self._dirty: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._conn = db.connect(path)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+        self._load()
+
+    def __contains__(self, video_id: object) -> bool:
+        with self._lock:
+            return video_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, video_id: str) -> None:
+        """Merkt eine Video-ID (erneutes Hinzufügen frischt sie auf)."""
+        now = time.time()
+        with self._lock:
+            self._entries[video_id] = now
+            self._entries.move_to_end(video_id)
+            self._dirty[video_id] = now
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            flush = len(self._dirty) >= self.flush_every
+        if flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Schreibt gesammelte Änderungen und kürzt den Bestand auf der Platte auf die Grenzen."""
+        with self._lock, self._conn:
+            if self._dirty:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO seen_videos (video_id, seen_at) VALUES (?, ?)",
+                    list(self._dirty.items()),
+                )
+                self._dirty.clear()
+            self._conn.execute("DELETE FROM seen_videos WHERE seen_at < ?", (time.time() - self.max_age,))
+            self._conn.execute(
+                "DELETE FROM seen_videos WHERE seen_at < ("
+                "SELECT seen_at FROM seen_videos ORDER BY seen_at DESC LIMIT 1 OFFSET ?)",
+                (self.max_entries - 1,),
+            )
+            # Abgelaufene Einträge auch im Speicher verwerfen (älteste stehen vorn)
+            cutoff = time.time() - self.max_age
+            while self._entries and next(iter(self._entries.values())) < cutoff:
+                self._entries.popitem(last=False)
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def _load(self) -> None:
+        rows = self._conn.execute(
+            "SELECT video_id, seen_at FROM seen_videos WHERE seen_at >= ? ORDER BY seen_at DESC LIMIT ?",
+            (time.time() - self.max_age, self.max_entries),
+        ).fetchall()
+        self._entries = OrderedDict(reversed(rows))
+
+
+def get_seen_videos() -> SeenVideoSet:
+    """Prozessweite Menge geprüfter Videos unter ``db_path``."""
+    return db.shared("seen_videos", SeenVideoSet)
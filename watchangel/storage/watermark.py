@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+from watchangel.storage import db
+from watchangel.utils.paths import db_path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    name TEXT PRIMARY KEY,
+    video_ids TEXT NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Mehrere IDs merken: das oberste Video kann inzwischen aus dem Verlauf entfernt worden sein
+WATERMARK_DEPTH = 5
+
+
+@dataclass(frozen=True)
+class HistoryWatermark:
+    """Zuletzt verarbeitete Verlaufsspitze: neueste Video-IDs (neueste zuerst) und Zeitpunkt."""
+    video_ids: tuple[str, ...] = ()
+    updated_at: float = 0.0
+
+    def advance(self, new_ids: Sequence[str], depth: int = WATERMARK_DEPTH) -> "HistoryWatermark":
+        """
+        Neue Marke nach einem Durchlauf.
+
+        :param new_ids: Neu verarbeitete Video-IDs in Verlaufsreihenfolge (neueste zuerst)
+        :return: Marke aus den neuesten ``depth`` IDs
+        """
+        merged = list(dict.fromkeys([*new_ids, *self.video_ids]))[:depth]
+        return HistoryWatermark(tuple(merged), time.time())
+
+
+class MarkMatcher:
+    """
+    Erkennt die Verlaufsmarke in einem Strom von Videos (neueste zuerst).
+
+    Ein Treffer allein beendet das Lesen nicht: ein erneut angesehenes, markiertes Video rückt
+    nach oben und stünde sonst vor neueren, noch ungeprüften Einträgen. Als Marke gilt erst ein
+    Treffer, auf den direkt ein weiterer markierter Eintrag folgt (oder der letzte Eintrag
+    überhaupt). Besteht die Marke nur aus einer ID, genügt ein Treffer.
+    """
+
+    def __init__(self, mark: Sequence[str]) -> None:
+        self.ids = set(mark)
+        self.reached = False
+        self._pending = None
+
+    def feed(self, video) -> list:
+        """
+        :param video: Nächstes Video (mit ``video_id``)
+        :return: Videos oberhalb der Marke, die jetzt feststehen (0–2)
+        """
+        if self.reached:
+            return []
+        ready = []
+        if self._pending is not None:
+            if video.video_id in self.ids:
+                self.reached = True
+                return []
+            # Einzelner Treffer: erneut angesehenes Video, gehört zu den neuen Einträgen
+            ready.append(self._pending)
+            self._pending = None
+        if video.video_id in self.ids:
+            if len(self.ids) == 1:
+                self.reached = True
+            else:
+                self._pending = video
+            return ready
+        ready.append(video)
+        return ready
+
+    def finish(self) -> None:
+        """Ende des Verlaufs: ein noch offener Treffer ist die Marke."""
+        if self._pending is not None:
+            self._pending = None
+            self.reached = True
+
+
+class WatermarkStore:
+    """Persistiert Verlaufsmarken je Name (z. B. "watch_loop") in der SQLite-Datenbank."""
+
+    def __init__(self, path: Path = db_path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = db.connect(path)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def load(self, name: str) -> HistoryWatermark:
+        """
+        :param name: Name der Marke
+        :return: Gespeicherte Marke oder eine leere Marke
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT video_ids, updated_at FROM watermarks WHERE name = ?", (name,)
+            ).fetchone()
+        if row is None:
+            return HistoryWatermark()
+        return HistoryWatermark(tuple(json.loads(row[0])), row[1])
+
+    def save(self, name: str, mark: HistoryWatermark) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watermarks (name, video_ids, updated_at) VALUES (?, ?, ?)",
+                (name, json.dumps(list(mark.video_ids)), mark.updated_at),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def get_watermark_store() -> WatermarkStore:
+    """Prozessweiter Markenspeicher unter ``db_path``."""
+    return db.shared("watermark", WatermarkStore)
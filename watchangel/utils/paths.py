@@ -7,4 +7,9 @@ CONFIG_DIR = PROJECT_ROOT / "config"
 log_path = PROJECT_ROOT / "blocked_channels.log"
 undo_path = CONFIG_DIR / "undo_block_channels.txt"
 wl_path = CONFIG_DIR / "whitelist_channels.txt"
-wl_patterns_path = CONFIG_DIR / "whitelist_patterns.txt"
\ No newline at end of file
+wl_patterns_path = CONFIG_DIR / "whitelist_patterns.txt"
+lang_cache_path = PROJECT_ROOT / "language_cache.json"
+db_path = PROJECT_ROOT / "watchangel.db"
+rule_stats_path = PROJECT_ROOT / "rule_stats.json"
+compiled_blocklist_path = CONFIG_DIR / "block_channels.wabl"
+compiled_whitelist_path = CONFIG_DIR / "whitelist_channels.wabl"
@@ -1,26 +1,142 @@
 import time
+from dataclasses import dataclass
+from typing import Optional
 from selenium.webdriver.chrome.webdriver import WebDriver
 
-def scroll_to_end(driver: WebDriver, max_scrolls: int = 50, pause_time: float = 2.0) -> None:
-    """
-    Scrollt durch eine Seite bis zum Seitenende oder bis max. Anzahl erreicht ist.
-    Wird z. B. in YouTube-Verläufen genutzt.
+# Scrollt ans Seitenende (optional) und wartet im Browser, bis neue Einträge erscheinen.
+# Signal ist ein MutationObserver statt fester Pausen; Ende bei neuen Einträgen, bei
+# verschwundenem Nachlade-Spinner ohne neue Einträge oder spätestens nach timeoutMs.
+# Ohne Scrollen (Bereitschaftsprüfung nach dem Laden) genügt ein einziger Eintrag oder der
+# Nachlade-Spinner: der Spinner bleibt stehen, bis gescrollt wird.
+SCROLL_AND_WAIT_JS = """
+const [tag, doScroll, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const items = document.getElementsByTagName(tag);
+const spinner = () => document.getElementsByTagName('ytd-continuation-item-renderer').length > 0;
+const start = performance.now();
+const startCount = items.length;
+const startHeight = document.documentElement.scrollHeight;
+let sawSpinner = spinner();
+let finished = false;
+
+const finish = () => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    done({
+        new_items: items.length - startCount,
+        items: items.length,
+        grew: document.documentElement.scrollHeight > startHeight,
+        more: spinner(),
+        elapsed_ms: performance.now() - start,
+    });
+};
+const check = () => {
+    if (items.length > startCount) return finish();
+    if (!doScroll && (items.length > 0 || spinner())) return finish();
+    if (spinner()) sawSpinner = true;
+    else if (sawSpinner) finish();
+};
+const observer = new MutationObserver(check);
+observer.observe(document.documentElement, {childList: true, subtree: true});
+const timer = setTimeout(finish, timeoutMs);
+if (doScroll) window.scrollTo(0, startHeight);
+check();
+"""
+
+
+@dataclass
+class ScrollStats:
+    """Messwerte eines Scroll-Vorgangs."""
+    rounds: int = 0
+    items: int = 0
+    timeouts: int = 0
+    seconds: float = 0.0
 
-    :param driver: Aktiver Selenium WebDriver
-    :param max_scrolls: Maximal erlaubte Scrollzyklen
-    :param pause_time: Wartezeit zwischen Scrolls
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+
+class AdaptiveScroller:
     """
-    scrolls = 0
-    last_height = driver.execute_script("return document.documentElement.scrollHeight")
+    Scrollt ereignisgesteuert: jede Runde wartet im Browser auf neue Einträge statt auf
+    eine feste Pause. Die Wartezeit passt sich an die beobachteten Ladezeiten an
+    (gleitender Mittelwert × ``slack``), begrenzt durch ``hard_timeout``. Nach einer Runde
+    ohne neue Einträge wird die nächste mit vollem ``hard_timeout`` wiederholt.
+    """
+
+    def __init__(
+            self,
+            driver: WebDriver,
+            item_tag: str = "ytd-video-renderer",
+            hard_timeout: float = 10.0,
+            min_timeout: float = 0.5,
+            slack: float = 3.0,
+            smoothing: float = 0.3,
+    ) -> None:
+        self.driver = driver
+        self.item_tag = item_tag
+        self.hard_timeout = hard_timeout
+        self.min_timeout = min_timeout
+        self.slack = slack
+        self.smoothing = smoothing
+        self.stats = ScrollStats()
+        # True, sobald die Seite keinen Nachlade-Spinner mehr zeigt und nichts nachkam
+        self.at_end = False
+        self._avg_load: Optional[float] = None
+        self._last_grew = True
+        self._started = time.perf_counter()
+
+        # Browser-seitiges Warten darf nicht am WebDriver-Script-Timeout scheitern
+        driver.set_script_timeout(hard_timeout + 5)
+
+    def current_timeout(self) -> float:
+        """Wartezeit der nächsten Runde in Sekunden."""
+        if self._avg_load is None or not self._last_grew:
+            return self.hard_timeout
+        return min(self.hard_timeout, max(self.min_timeout, self._avg_load * self.slack))
+
+    def wait_ready(self) -> int:
+        """
+        Wartet nach dem Laden der Seite auf die ersten Einträge (ohne zu scrollen).
+
+        :return: Anzahl Einträge auf der Seite
+        """
+        result = self._run(scroll=False, timeout=self.hard_timeout)
+        self._started = time.perf_counter()
+        return int(result["items"])
+
+    def step(self) -> int:
+        """
+        Scrollt ans Seitenende und wartet auf nachgeladene Einträge.
+
+        :return: Anzahl neuer Einträge (0 = Zeitüberschreitung oder Seitenende)
+        """
+        timeout = self.current_timeout()
+        result = self._run(scroll=True, timeout=timeout)
+        new_items = max(0, int(result["new_items"]))
+        elapsed = float(result["elapsed_ms"]) / 1000
+
+        self.stats.rounds += 1
+        self.stats.items += new_items
+        self.stats.seconds = time.perf_counter() - self._started
 
-    while scrolls < max_scrolls:
-        driver.execute_script("window.scrollTo(0, document.documentElement.scrollHeight);")
-        time.sleep(pause_time)
-        new_height = driver.execute_script("return document.documentElement.scrollHeight")
+        if new_items:
+            self._avg_load = elapsed if self._avg_load is None else (
+                self.smoothing * elapsed + (1 - self.smoothing) * self._avg_load
+            )
+        else:
+            self.stats.timeouts += int(elapsed >= timeout * 0.99)
+            self.at_end = not result["more"]
+        self._last_grew = bool(new_items)
+        return new_items
 
-        if new_height == last_height:
-            print("[🛑] Seitenende erreicht – keine weiteren Inhalte.")
-            break
+    def report(self) -> str:
+        avg = f"{self._avg_load * 1000:.0f} ms" if self._avg_load is not None else "–"
+        return (f"[📈] {self.stats.items} Einträge in {self.stats.seconds:.1f}s "
+                f"({self.stats.items_per_second:.1f}/s, {self.stats.rounds} Runden, Ø Ladezeit {avg})")
 
-        last_height = new_height
-        scrolls += 1
+    def _run(self, scroll: bool, timeout: float) -> dict:
+        return self.driver.execute_async_script(SCROLL_AND_WAIT_JS, self.item_tag, scroll, int(timeout * 1000))
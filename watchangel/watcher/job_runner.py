@@ -0,0 +1,102 @@
+import time
+from typing import Callable, Optional
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from watchangel.blocker.actions import block_channel, hide_user_from_channel, unhide_user_from_channel
+from watchangel.browser.supervisor import is_dead_session
+from watchangel.cleaner.cleaner import purge_channels
+from watchangel.storage.job_queue import Job, JobQueue
+
+CHANNEL_ACTIONS: dict[str, Callable[[WebDriver, str], bool]] = {
+    "block": block_channel,
+    "hide": hide_user_from_channel,
+    "unhide": unhide_user_from_channel,
+}
+
+
+def drain_jobs(driver: WebDriver, jobs: JobQueue, time_budget: Optional[float] = None) -> int:
+    """
+    Arbeitet fällige Aufträge aus der Warteschlange ab.
+
+    Kanalaktionen laufen einzeln; alle fälligen Purge-Aufträge werden gesammelt und in
+    einem einzigen Verlaufsdurchlauf erledigt. Ein Purge-Auftrag gilt nur als erledigt, wenn
+    alle Einträge seines Kanals entfernt wurden, sonst wird er wiederholt. Zum Schluss werden
+    alte erledigte Aufträge gelöscht.
+
+    :param driver: Aktiver WebDriver
+    :param jobs: Warteschlange
+    :param time_budget: Höchstdauer in Sekunden (None = bis nichts mehr fällig ist)
+    :return: Anzahl erfolgreich erledigter Aufträge
+    """
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+    done = 0
+
+    while deadline is None or time.monotonic() < deadline:
+        job = jobs.claim(actions=tuple(CHANNEL_ACTIONS))
+        if job is None:
+            break
+        done += _run_channel_job(driver, jobs, job)
+
+    purges: list[Job] = []
+    while (job := jobs.claim(actions=("purge",))) is not None:
+        purges.append(job)
+    if purges:
+        done += _run_purge_jobs(driver, jobs, purges)
+
+    jobs.prune()
+    return done
+
+
+def _run_purge_jobs(driver: WebDriver, jobs: JobQueue, purges: list[Job]) -> int:
+    try:
+        result = purge_channels(driver, [job.channel_name for job in purges])
+    except Exception as e:
+        if is_dead_session(e):
+            # Kein Fehlversuch: der Supervisor startet den Browser neu und wiederholt den Durchlauf
+            for job in purges:
+                jobs.release(job)
+            raise
+        for job in purges:
+            jobs.fail(job, str(e))
+        return 0
+
+    done = 0
+    for job in purges:
+        failed = result.failed_for(job.channel_name)
+        if not failed:
+            jobs.complete(job)
+            done += 1
+            continue
+        error = f"{failed} Eintrag/Einträge nicht entfernt"
+        if jobs.fail(job, error):
+            print(f"[🔁] Purge {job.channel_name}: {error} – wird später wiederholt")
+        else:
+            print(f"[❌] Purge {job.channel_name} endgültig fehlgeschlagen ({error})")
+    return done
+
+
+def _run_channel_job(driver: WebDriver, jobs: JobQueue, job: Job) -> int:
+    channel_url = job.payload.get("channel_url") or ""
+    if not channel_url:
+        jobs.fail(job, "keine Kanal-URL")
+        return 0
+
+    try:
+        ok = CHANNEL_ACTIONS[job.action](driver, channel_url)
+        error = "Aktion nicht bestätigt"
+    except Exception as e:
+        if is_dead_session(e):
+            jobs.release(job)
+            raise
+        ok, error = False, str(e)
+
+    if ok:
+        jobs.complete(job)
+        print(f"[✅] Auftrag erledigt: {job.action} {job.channel_name}")
+        return 1
+
+    if jobs.fail(job, error):
+        print(f"[🔁] Auftrag {job.action} {job.channel_name} fehlgeschlagen – wird später wiederholt ({error})")
+    else:
+        print(f"[❌] Auftrag {job.action} {job.channel_name} endgültig fehlgeschlagen ({error})")
+    return 0
@@ -1,10 +1,18 @@
-from watchangel.rules.engine_instance import engine
+from watchangel.rules.engine_instance import get_engine
 from watchangel.rules.block_rules import BlockDecision
 
-def is_video_blockworthy(title: str, channel_name: str, verbose: bool = False) -> bool:
-    decision = engine.explain_block_decision(title, channel_name)
+def explain_videos(videos: list[dict[str, str]]) -> list[BlockDecision]:
+    """
+    Bewertet alle Videos eines Durchlaufs gesammelt über die Batch-API.
+
+    :param videos: Videos aus dem Verlauf (title, channel_name, ...)
+    :return: Entscheidungen in derselben Reihenfolge
+    """
+    return get_engine().explain_block_decisions([(v["title"], v["channel_name"].strip(), "") for v in videos])
+
+
+def report_decision(decision: BlockDecision, channel_name: str) -> None:
     if decision.block:
         print(f"[⚠️  BLOCK] Verdächtig – {channel_name}")
         print(f"[📛] Grund: {decision.reason}")
-    return decision.block
 
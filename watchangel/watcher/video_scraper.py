@@ -1,47 +1,51 @@
-import time
-from selenium.webdriver.common.by import By
+from typing import Sequence
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.webdriver import WebDriver
 
-from watchangel.utils.scrolling import scroll_to_end
+import watchangel.globals as app_globals
+from watchangel.analysis.extractor import extract_until_mark
+from watchangel.analysis.network_capture import HISTORY_READERS
+from watchangel.model.scanned_video import ScannedVideo
+from watchangel.utils.scrolling import AdaptiveScroller
 
 
-def get_all_history_videos(driver: WebDriver, max_scrolls: int = 25) -> list[dict[str, str]]:
+def get_history_since(driver: WebDriver, mark: Sequence[str], max_scrolls: int = 5) -> list[dict[str, str]]:
     """
-    Scrollt durch den YouTube-Verlauf und extrahiert alle sichtbaren Videos.
+    Liest nur die Verlaufseinträge oberhalb der Verlaufsmarke (zuletzt verarbeitete Videos).
+
+    Ist die Marke das oberste Video, kostet ein Durchlauf das Neuladen der Verlaufsseite, eine
+    sofort zurückkehrende Bereitschaftsprüfung und einen Script-Aufruf. Gescrollt wird nur,
+    solange die Marke noch nicht erreicht ist.
+
+    :param driver: Aktiver WebDriver
+    :param mark: Video-IDs der Marke (leer = nur die obersten Einträge lesen)
+    :param max_scrolls: Maximale Nachladerunden bis zur Marke
+    :return: Neue Videos, neueste zuerst
     """
+    limit = max_scrolls if mark else 1
+
+    reader = HISTORY_READERS.get(app_globals.READER_MODE)
+    if reader is not None:
+        try:
+            return [_as_dict(video) for video in reader(driver, max_pages=limit, stop_at=mark)]
+        except (ValueError, WebDriverException) as e:
+            print(f"[⚠️] Strukturdaten nicht lesbar ({e}) – weiter über den DOM.")
+
     driver.get("https://www.youtube.com/feed/history")
-    scroll_to_end(driver, max_scrolls)
+    scroller = AdaptiveScroller(driver)
+    scroller.wait_ready()
 
-    # Nach dem Scrollen alle Videoelemente auslesen
-    videos = []
-    containers = driver.find_elements(By.TAG_NAME, "ytd-video-renderer")
+    videos, reached = extract_until_mark(driver, mark)
+    while not reached and scroller.stats.rounds < limit and scroller.step():
+        videos, reached = extract_until_mark(driver, mark)
 
-    for container in containers:
-        try:
-            title_element = container.find_element(By.ID, "video-title")
-            title = title_element.text.strip()
-            url = title_element.get_attribute("href")
-            video_id = url.split("v=")[-1].split("&")[0]
-
-            channel_element = container.find_element(By.CSS_SELECTOR, "#channel-name a")
-            channel_name = channel_element.text.strip()
-            channel_url = channel_element.get_attribute("href")
-
-            videos.append({
-                "title": title,
-                "video_id": video_id,
-                "channel_name": channel_name,
-                "channel_url": channel_url
-            })
-        except Exception:
-            continue
-
-    return videos
-
-def get_recent_history_videos(driver: WebDriver) -> list[dict[str, str]]:
-    """
-    Gibt nur die obersten Verlaufseinträge zurück (≈ 30 Videos).
+    return [_as_dict(video) for video in videos]
 
-    Wird im WatchLoop verwendet, da ältere Videos bereits gesäubert wurden.
-    """
-    return get_all_history_videos(driver, max_scrolls=1)
+
+def _as_dict(video: ScannedVideo) -> dict[str, str]:
+    return {
+        "title": video.title,
+        "video_id": video.video_id,
+        "channel_name": video.channel_name,
+        "channel_url": video.channel_url,
+    }
@@ -1,12 +1,19 @@
 import time
 from selenium.webdriver.chrome.webdriver import WebDriver
-from .video_scraper import get_all_history_videos, get_recent_history_videos
-from .video_checker import is_video_blockworthy
+from .video_scraper import get_history_since
+from .video_checker import explain_videos, report_decision
 from .video_handler import handle_suspicious_video
-from watchangel.cleaner.cleaner import remove_all_from_channel
-from ..rules.block_rules import BlockRuleEngine
+from .job_runner import drain_jobs
+from ..rules.engine_instance import get_log_rules
+from ..rules.language import language_detector
+from ..storage.job_queue import get_job_queue
+from ..storage.seen_videos import get_seen_videos
+from ..storage.watermark import get_watermark_store
 
-SEEN_VIDEO_IDS: set[str] = set()
+WATERMARK_NAME = "watch_loop"
+
+# Höchstdauer je Durchlauf für das Abarbeiten von Aufträgen (Sekunden)
+JOB_TIME_BUDGET = 60.0
 
 
 def countdown(seconds: int, label: str = "Wiederholung") -> None:
@@ -17,37 +24,60 @@ def countdown(seconds: int, label: str = "Wiederholung") -> None:
 
 
 def check_history_once(driver: WebDriver) -> None:
-    driver.get("https://www.youtube.com/feed/history")
-    time.sleep(3)
+    watermarks = get_watermark_store()
+    mark = watermarks.load(WATERMARK_NAME)
+
+    print("[⏳] Lese neue Videos aus Verlauf...")
+    # Nur Videos oberhalb der Verlaufsmarke prüfen – ältere wurden bereits verarbeitet
+    videos = get_history_since(driver, mark.video_ids)
+    jobs = get_job_queue()
+    if not videos:
+        print("[💤] Keine neuen Videos seit der letzten Prüfung.")
+        drain_jobs(driver, jobs, time_budget=JOB_TIME_BUDGET)
+        countdown(10)
+        return
 
-    print("[⏳] Lese Videos aus Verlauf...")
-    # Nur oberste Videos prüfen – ältere sind bereits bereinigt
-    videos = get_recent_history_videos(driver)
+    engine = get_log_rules()
+    seen_videos = get_seen_videos()
 
-    engine = BlockRuleEngine.from_logs()
-    already_blocked = engine.block_channels
+    new_videos = [video for video in videos if video["video_id"] not in seen_videos]
+    decisions = explain_videos(new_videos)
+    # Kanäle, deren Verlauf über die Warteschlange gemeinsam bereinigt wird
+    offenders: set[str] = set()
 
-    for video in videos:
+    for video, decision in zip(new_videos, decisions):
         video_id = video["video_id"]
         title = video["title"]
         channel_name = video["channel_name"].strip()
 
-        if video_id in SEEN_VIDEO_IDS:
+        if video_id in seen_videos:
             continue
 
-        SEEN_VIDEO_IDS.add(video_id)
+        seen_videos.add(video_id)
 
-        if channel_name.lower() in already_blocked:
+        if engine.is_blocked_channel(channel_name):
             print(f"[♻️] Kanal bereits blockiert: {channel_name} → Verlauf bereinigen")
-            remove_all_from_channel(driver, video_id)
+            offenders.add(channel_name)
             continue
 
         print(f"[🔍] Prüfe Titel: {title}")
 
-        if is_video_blockworthy(title, channel_name):
-            handle_suspicious_video(driver, video)
-            already_blocked.add(channel_name.lower())  # Nur lowercase speichern
+        report_decision(decision, channel_name)
+        if decision.block:
+            handle_suspicious_video(driver, video)  # speichert den Kanal, Blockieren kommt in die Warteschlange
+            offenders.add(channel_name)
         else:
             print("[✅] War kein Trash – alles in Ordnung")
 
+    for channel_name in offenders:
+        jobs.enqueue("purge", channel_name)
+
+    # Marke setzen, sobald alles erkannt und eingeplant ist – die Aufträge selbst sind persistent.
+    # Nur Videos, die im Verlauf bleiben: die Marke wird an zwei aufeinanderfolgenden Einträgen erkannt.
+    kept = [video["video_id"] for video in videos if video["channel_name"].strip() not in offenders]
+    watermarks.save(WATERMARK_NAME, mark.advance(kept))
+    seen_videos.flush()
+
+    drain_jobs(driver, jobs, time_budget=JOB_TIME_BUDGET)
+    language_detector.save()
     countdown(10)